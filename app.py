@@ -1,11 +1,35 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import random
-from datetime import datetime, timedelta
+import hmac
+import os
+import time
+import uuid
+
+from rocket_core.missions import generate_missions, concat_missions
+from rocket_core.ingest import MissionLog, ingest
+from rocket_core.schema import memory_report
+from rocket_core.mission_store import MissionStore
+from rocket_core.mission_filters import MissionFilterIndex
+from rocket_core.aggregations import MissionAggregates
+from rocket_core.correlation import CorrelationAccumulator, GroupedCorrelation
+from rocket_core.rollups import LaunchRollups, COLUMNS as ROLLUP_COLUMNS, GRAINS
+from rocket_core.downsample import RunningLTTB, lttb, scatter_decimate, decimation_note
+from charts import WEBGL_THRESHOLD, scatter_trace, cached_figure, show_chart
+from rocket_core.physics import run_simulation, iter_simulation
+from rocket_core.trajectory import Trajectory
+from rocket_core import kernels
+from rocket_core.integrators import run_simulation_ode, run_vehicle
+from rocket_core.vehicle import VEHICLE_PRESETS
+from rocket_core.atmosphere import ATMOSPHERES, EXPONENTIAL
+from rocket_core.sim_cache import SimulationCache, simulation_key
+from rocket_core.executor import SimulationExecutor
+from rocket_core.sweep import grid_samples, latin_hypercube_samples, iter_sweep, SweepSummary
+from rocket_core.dispersion import DISTRIBUTIONS, dispersion_samples, summarize
+from rocket_core.solver import SOLVE_BOUNDS, SOLVE_GOALS, solve_apogee
+from rocket_core.profiling import Profiler, span, set_memory_tracing
 
 # ─── PAGE CONFIG ───
 st.set_page_config(
@@ -191,66 +215,263 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-# ─── PLOTLY DARK THEME ───
-PLOTLY_LAYOUT = dict(
-    paper_bgcolor='rgba(0,0,0,0)',
-    plot_bgcolor='rgba(0,0,0,0)',
-    font=dict(family="Exo 2, sans-serif", color="#C0C7D1", size=11),
-    margin=dict(l=40, r=20, t=30, b=40),
-    xaxis=dict(gridcolor='rgba(0,180,216,0.08)', linecolor='rgba(0,180,216,0.2)'),
-    yaxis=dict(gridcolor='rgba(0,180,216,0.08)', linecolor='rgba(0,180,216,0.2)'),
-    legend=dict(bgcolor='rgba(0,0,0,0)', bordercolor='rgba(0,180,216,0.2)', borderwidth=1)
-)
+# ─── DATA GENERATION ───
+# Mission frames are shared read-only by every session. Copy-on-Write (always
+# on from pandas 3) makes any per-session change copy the columns it touches.
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
 
 
-# ─── DATA GENERATION ───
-@st.cache_data
-def generate_mission_data(seed=42):
-    np.random.seed(seed)
-    random.seed(seed)
-
-    types = ['Orbital', 'Lunar', 'Mars', 'Deep Space', 'ISS Resupply']
-    vehicles = ['Falcon 9', 'Atlas V', 'Delta IV', 'Ariane 5', 'Soyuz', 'SLS']
-
-    profiles = {
-        'Orbital':      {'payload': (500, 8000),    'fuel': (20, 80),    'cost': (30, 120),   'dist': (200, 2000),      'dur': (1, 14),    'crew': (0, 4), 'success_rate': 0.92},
-        'Lunar':        {'payload': (1000, 12000),   'fuel': (50, 150),   'cost': (80, 250),   'dist': (350000, 400000), 'dur': (5, 20),    'crew': (0, 6), 'success_rate': 0.85},
-        'Mars':         {'payload': (2000, 20000),   'fuel': (100, 300),  'cost': (150, 450),  'dist': (55000, 400000),  'dur': (180, 300), 'crew': (0, 6), 'success_rate': 0.78},
-        'Deep Space':   {'payload': (500, 5000),     'fuel': (60, 200),   'cost': (100, 500),  'dist': (100000, 500000), 'dur': (365, 1000),'crew': (0, 0), 'success_rate': 0.82},
-        'ISS Resupply': {'payload': (1000, 6000),    'fuel': (15, 60),    'cost': (20, 80),    'dist': (400, 420),       'dur': (1, 3),     'crew': (0, 7), 'success_rate': 0.95},
-    }
+# cache_resource hands every session the same compact frame; cache_data would
+# unpickle a fresh copy of it on every call.
+@st.cache_resource
+def generate_mission_data(seed=42, n=48):
+    with span('data.generate'):
+        return generate_missions(n, seed)
 
-    records = []
-    base_date = datetime(2018, 1, 1)
-
-    for i in range(48):
-        t = types[i % len(types)]
-        p = profiles[t]
-        payload = np.random.uniform(*p['payload'])
-        fuel_base = np.random.uniform(*p['fuel'])
-        fuel_noise = payload * np.random.uniform(0.005, 0.015)
-        fuel = round(fuel_base + fuel_noise, 1)
-        launch_date = base_date + timedelta(days=random.randint(0, 365 * 6))
-
-        records.append({
-            'id': i + 1,
-            'mission_type': t,
-            'vehicle': random.choice(vehicles),
-            'payload_kg': round(payload),
-            'fuel_tons': fuel,
-            'cost_million': round(np.random.uniform(*p['cost']), 2),
-            'distance_km': round(np.random.uniform(*p['dist'])),
-            'duration_days': round(np.random.uniform(*p['dur'])),
-            'crew_size': round(np.random.uniform(*p['crew'])),
-            'scientific_yield': round(np.random.uniform(10, 100), 1),
-            'success': np.random.random() < p['success_rate'],
-            'launch_date': launch_date.strftime('%Y-%m-%d'),
-        })
 
-    return pd.DataFrame(records)
+MISSION_DATA_COLUMNS = ['mission_type', 'vehicle', 'payload_kg', 'fuel_tons', 'cost_million',
+                        'distance_km', 'duration_days', 'crew_size', 'scientific_yield', 'success']
+AGGREGATE_COLUMNS = ['payload_kg', 'fuel_tons', 'cost_million', 'crew_size']
+CORRELATION_COLUMNS = ['payload_kg', 'fuel_tons', 'cost_million', 'distance_km', 'duration_days', 'crew_size']
+
+
+# ─── MISSION DATA SOURCE ───
+@st.cache_resource
+def get_mission_store():
+    path = os.environ.get('ROCKET_MISSION_STORE')
+    return MissionStore(path) if path else None
+
+
+@st.cache_resource
+def get_mission_log():
+    """Missions imported into this server process, shared by every session."""
+    return MissionLog()
+
+
+def load_base_missions(columns=None):
+    store = get_mission_store()
+    if store is not None:
+        return store.frame(columns)
+    df = generate_mission_data(n=int(os.environ.get('ROCKET_MISSION_ROWS', 48)))
+    return df[columns] if columns else df
+
+
+def load_missions(columns=None):
+    df = load_base_missions(columns)
+    log = get_mission_log()
+    return concat_missions([df, log.frame(columns)]) if log.num_rows else df
+
+
+# Derived structures are keyed on the import log's version. Aggregates,
+# correlations, launch rollups and the filter index fold imported chunks into
+# copies of the base results, so an import never rescans the base rows.
+@st.cache_resource
+def get_base_filter_index():
+    with span('data.index'):
+        return MissionFilterIndex(load_base_missions(MISSION_DATA_COLUMNS))
+
+
+def get_filter_index():
+    return build_filter_index(get_mission_log().version)
+
+
+@st.cache_resource(max_entries=1)
+def build_filter_index(version):
+    index = get_base_filter_index().copy()
+    log = get_mission_log()
+    if log.num_rows:
+        index.extend(log.frame(MISSION_DATA_COLUMNS))
+    return index
+
+
+@st.cache_resource
+def get_base_aggregates():
+    with span('data.aggregate'):
+        return MissionAggregates.from_frame(load_base_missions(MISSION_DATA_COLUMNS), AGGREGATE_COLUMNS)
+
+
+def get_mission_aggregates():
+    return build_mission_aggregates(get_mission_log().version)
+
+
+@st.cache_resource(max_entries=1)
+def build_mission_aggregates(version):
+    agg = MissionAggregates(AGGREGATE_COLUMNS).merge(get_base_aggregates())
+    for chunk in get_mission_log().chunks():
+        agg.update(chunk)
+    return agg
+
+
+@st.cache_resource
+def get_base_correlation_groups():
+    with span('data.correlation'):
+        return GroupedCorrelation.from_frame(load_base_missions(MISSION_DATA_COLUMNS), CORRELATION_COLUMNS)
+
+
+def get_correlation_groups():
+    return build_correlation_groups(get_mission_log().version)
+
+
+@st.cache_resource(max_entries=1)
+def build_correlation_groups(version):
+    groups = get_base_correlation_groups().copy()
+    for chunk in get_mission_log().chunks():
+        groups.append(chunk)
+    return groups
+
+
+@st.cache_resource
+def get_base_rollups():
+    with span('data.rollup'):
+        return LaunchRollups.from_frame(load_base_missions(ROLLUP_COLUMNS))
+
+
+def get_launch_rollups():
+    return build_launch_rollups(get_mission_log().version)
+
+
+@st.cache_resource(max_entries=1)
+def build_launch_rollups(version):
+    rollups = get_base_rollups().copy()
+    for chunk in get_mission_log().chunks():
+        rollups.update(chunk)
+    return rollups
+
+
+def mission_correlation(mission_type=None, vehicle=None, max_cost=None, max_distance=None):
+    # Type/vehicle filters merge the per-group accumulators; only range limits
+    # that actually exclude rows need a pass over the selected missions.
+    index = get_filter_index()
+    pos = index.positions(mission_type, vehicle, max_cost, max_distance)
+    base = index.positions(mission_type, vehicle)
+    if (pos is None) == (base is None) and (pos is None or len(pos) == len(base)):
+        return get_correlation_groups().combine(mission_type, vehicle)
+    return CorrelationAccumulator.from_frame(index.filter(mission_type, vehicle, max_cost, max_distance),
+                                             CORRELATION_COLUMNS)
+
+
+@st.cache_resource(max_entries=1)
+def get_memory_report(version):
+    with span('data.memory'):
+        return memory_report(load_missions())
+
+
+def mission_count():
+    store = get_mission_store()
+    base = store.num_rows if store is not None else len(load_base_missions(['id']))
+    return base + get_mission_log().num_rows
+
+
+# ─── SHARED SIMULATION CACHE ───
+# Trajectories are only charted, so cached and session-held results keep them in float32.
+TRAJECTORY_DTYPE = np.float32
+
+
+@st.cache_resource
+def get_atmosphere(name):
+    return ATMOSPHERES[name]()
+
+
+@st.cache_resource
+def warm_kernels():
+    """Compile the single-run kernels once per server process, so no launch pays for it."""
+    with span('kernels.warmup'):
+        kernels.warmup((np.float64, TRAJECTORY_DTYPE))
+    return kernels.COMPILED
+
 
+warm_kernels()
 
-df_all = generate_mission_data()
+
+def simulation_job(integrator, params, atmosphere):
+    """Cache key and compute callable for one run with the Physics Sim integrator and atmosphere choice."""
+    bits = np.dtype(TRAJECTORY_DTYPE).itemsize * 8
+    env = get_atmosphere(atmosphere)
+    # The legacy model runs the engines' original inline path and keeps its old keys.
+    env, suffix = (None, '') if env is EXPONENTIAL else (env, '/' + env.name)
+    if integrator.startswith("Euler"):
+        return (simulation_key('euler-legacy' + suffix, *params, precision=bits),
+                lambda: run_simulation(*params, dtype=TRAJECTORY_DTYPE, environment=env))
+    method = 'rk45' if integrator == "RK45 Adaptive" else 'rk4'
+    return (simulation_key(method + suffix, *params, precision=bits),
+            lambda: run_simulation_ode(*params, method=method, dtype=TRAJECTORY_DTYPE, environment=env))
+
+
+def vehicle_job(integrator, vehicle, flight_time, atmosphere):
+    """Cache key and compute callable for a multi-stage flight; Euler runs the shared integrator at Δt = 1 s."""
+    bits = np.dtype(TRAJECTORY_DTYPE).itemsize * 8
+    env = get_atmosphere(atmosphere)
+    env, suffix = (None, '') if env is EXPONENTIAL else (env, '/' + env.name)
+    method = {'RK45 Adaptive': 'rk45'}.get(integrator, 'rk4' if integrator.startswith("RK4") else 'euler')
+    return (('vehicle', method + suffix, vehicle.key(), int(flight_time), ('precision', bits)),
+            lambda: run_vehicle(vehicle, flight_time, method=method, dtype=TRAJECTORY_DTYPE, environment=env))
+
+
+@st.cache_resource
+def get_sim_cache():
+    return SimulationCache(maxsize=256, path=os.environ.get('ROCKET_SIM_CACHE_DIR'))
+
+
+@st.cache_resource
+def get_executor():
+    return SimulationExecutor(max_workers=int(os.environ.get('ROCKET_SIM_WORKERS', 0)) or None)
+
+
+# Seconds between chart redraws while a sweep streams in.
+SWEEP_REDRAW_INTERVAL = 0.5
+
+
+# ─── PROFILING ───
+@st.cache_resource
+def get_profiler():
+    return Profiler(history=200)
+
+
+def stream_simulation(params, atmosphere, speed, slot):
+    """Run the Euler engine block by block into live charts, returning the same result as run_simulation.
+
+    Blocks are copied into preallocated buffers and only the new block is
+    decimated for the charts, so each update costs the same however long the
+    run gets. speed is a multiple of real time, or None to run flat out.
+    """
+    env = get_atmosphere(atmosphere)
+    env = None if env is EXPONENTIAL else env
+    steps = params[-1]
+    # About ten chart updates per second of playback.
+    block = max(1, int(speed / 10)) if speed else 5000
+
+    charts = []
+    for name, label, color in (('altitude', 'Altitude (m)', '#00B4D8'), ('velocity', 'Velocity (m/s)', '#FF6B35')):
+        fig = cached_figure(st.session_state.figures, ('live', name), lambda: go.Figure(
+            go.Scatter(mode='lines', line=dict(color=color, width=2), fill='tozeroy'),
+            layout=dict(title_font=dict(color=color, family='Orbitron'), xaxis_title='Time (s)',
+                        yaxis_title=label, height=280)))
+        fig.layout.xaxis.range = [0, steps]
+        charts.append(fig)
+    live = slot.empty()
+
+    data = np.empty((2, steps + 1), dtype=TRAJECTORY_DTYPE)
+    lines = [RunningLTTB(steps + 1, WEBGL_THRESHOLD) for _ in charts]
+    filled = 0
+    started = time.perf_counter()
+    for part in iter_simulation(*params, block=block, dtype=TRAJECTORY_DTYPE, environment=env):
+        n = len(part['times'])
+        data[0, filled:filled + n], data[1, filled:filled + n] = part['altitudes'], part['velocities']
+        filled += n
+        with live.container():
+            st.caption(f"T+{part['times'][-1]:.0f}s • altitude {part['altitudes'][-1] / 1000:.2f} km • "
+                       f"velocity {part['velocities'][-1]:.0f} m/s")
+            for fig, line, column in zip(charts, lines, ('altitudes', 'velocities')):
+                fig.data[0].x, fig.data[0].y = line.append(part['times'], part[column])
+                fig.layout.title.text = f"{fig.layout.yaxis.title.text.split(' (')[0]} vs Time · live"
+                show_chart(fig)
+        if speed:
+            time.sleep(max(0.0, part['times'][-1] / speed - (time.perf_counter() - started)))
+    live.empty()
+
+    return {'trajectory': Trajectory(data[:, :filled]), 'max_alt': part['max_alt'], 'max_vel': part['max_vel'],
+            'burnout_time': part['burnout_time'], 'twr': part['twr']}
 
 
 # ─── SESSION STATE INIT ───
@@ -260,6 +481,24 @@ if 'user' not in st.session_state:
     st.session_state.user = {}
 if 'sim_results' not in st.session_state:
     st.session_state.sim_results = None
+if 'sweep_summary' not in st.session_state:
+    st.session_state.sweep_summary = None
+if 'dispersion_results' not in st.session_state:
+    st.session_state.dispersion_results = None
+if 'solver_results' not in st.session_state:
+    st.session_state.solver_results = None
+    st.session_state.solver_guess = {}
+if 'mission_filters' not in st.session_state:
+    st.session_state.mission_filters = {}
+if 'figures' not in st.session_state:
+    st.session_state.figures = {}
+if 'profile_opts' not in st.session_state:
+    st.session_state.profile_opts = {'profile': False, 'trace_memory': False}
+if 'session_uid' not in st.session_state:
+    st.session_state.session_uid = uuid.uuid4().hex
+    st.session_state.sweep_count = 0
+    st.session_state.sweep_tag = None
+    st.session_state.sweep_sig = None
 
 
 # ════════════════════════════════════════
@@ -365,6 +604,11 @@ elif st.session_state.screen == 'login':
 # ════════════════════════════════════════
 elif st.session_state.screen == 'dashboard':
     user = st.session_state.user
+    # The Profiler can switch on process-wide tracing, so it is never opened from the URL alone:
+    # ROCKET_ADMIN=1 shows it to everyone, ROCKET_ADMIN_TOKEN to visitors passing ?admin=<token>.
+    token = os.environ.get('ROCKET_ADMIN_TOKEN')
+    admin = os.environ.get('ROCKET_ADMIN') == '1' or bool(
+        token and hmac.compare_digest(st.query_params.get('admin', '').encode(), token.encode()))
 
     # ── SIDEBAR ──
     with st.sidebar:
@@ -387,11 +631,8 @@ elif st.session_state.screen == 'dashboard':
         </div>
         """, unsafe_allow_html=True)
 
-        page = st.radio(
-            "Navigation",
-            ["🏠  Home", "📊  Mission Data", "🔬  Physics Sim", "⚡  Insights", "📖  About"],
-            label_visibility="collapsed"
-        )
+        pages = ["🏠  Home", "📊  Mission Data", "🔬  Physics Sim", "🧭  Design Explorer", "⚡  Insights", "📖  About"]
+        page = st.radio("Navigation", pages + (["🛠  Profiler"] if admin else []), label_visibility="collapsed")
 
         st.markdown("""
         <div class="panel-glass" style="margin-top:16px;">
@@ -407,6 +648,8 @@ elif st.session_state.screen == 'dashboard':
             st.session_state.user = {}
             st.rerun()
 
+    get_profiler().start(page, **st.session_state.profile_opts)
+
     # ══════════════
     #  HOME PAGE
     # ══════════════
@@ -420,7 +663,7 @@ elif st.session_state.screen == 'dashboard':
 
         # Metrics row
         c1, c2, c3, c4 = st.columns(4)
-        c1.metric("Total Missions", "48")
+        c1.metric("Total Missions", f"{mission_count():,}")
         c2.metric("Success Rate", "87.5%")
         c3.metric("Avg. Cost ($M)", "142.3")
         c4.metric("Max Altitude (km)", "42,800")
@@ -495,32 +738,66 @@ elif st.session_state.screen == 'dashboard':
             Analyze real mission parameters with interactive filters</p>
         """, unsafe_allow_html=True)
 
+        # ── IMPORT ──
+        with st.expander("📥 IMPORT LAUNCH LOGS", expanded=False):
+            st.caption("CSV or JSON Lines with the fields listed on the About page (scientific_yield and "
+                       "launch_date optional). Files are parsed in chunks and appended to the dataset "
+                       "for every session; rows that fail validation are skipped.")
+            uploads = st.file_uploader("Launch logs", type=['csv', 'jsonl', 'ndjson', 'json'],
+                                       accept_multiple_files=True)
+            if st.button("📥  IMPORT", disabled=not uploads):
+                for upload in uploads:
+                    try:
+                        with span('ingest'):
+                            missions, report = ingest(upload, first_id=mission_count() + 1)
+                    except ValueError as e:
+                        st.error(f"{upload.name}: {e}")
+                        continue
+                    if len(missions):
+                        get_mission_log().append(missions)
+                    st.success(f"{upload.name}: imported {report.accepted:,} of {report.rows:,} rows")
+                    if report.rejected:
+                        reasons = ', '.join(f"{why} ({n:,})" for why, n in report.reasons.most_common())
+                        st.warning(f"{report.rejected:,} rows rejected: {reasons}")
+                        st.dataframe(report.rejects(), hide_index=True, use_container_width=True)
+            log = get_mission_log()
+            if log.num_rows:
+                st.caption(f"{log.num_rows:,} imported missions in {log.version} import(s) on this server")
+
         # ── FILTERS ──
         with st.expander("🔧 FILTERS", expanded=True):
             fc1, fc2, fc3, fc4 = st.columns(4)
             with fc1:
                 f_type = st.selectbox("Mission Type", ["All Types", "Orbital", "Lunar", "Mars", "Deep Space", "ISS Resupply"])
             with fc2:
-                f_vehicle = st.selectbox("Launch Vehicle", ["All Vehicles", "Falcon 9", "Atlas V", "Delta IV", "Ariane 5", "Soyuz", "SLS"])
+                vehicles = ["Falcon 9", "Atlas V", "Delta IV", "Ariane 5", "Soyuz", "SLS"]
+                # A store written from real launch logs, and imports, may add vehicles of their own.
+                known = set(load_base_missions(['vehicle'])['vehicle'].cat.categories)
+                if get_mission_log().num_rows:
+                    known |= set(get_mission_log().frame(['vehicle'])['vehicle'].unique())
+                vehicles += sorted(known - set(vehicles))
+                f_vehicle = st.selectbox("Launch Vehicle", ["All Vehicles"] + vehicles)
             with fc3:
                 f_cost = st.slider("Max Cost ($M)", 10, 500, 500, 10)
             with fc4:
                 f_dist = st.slider("Max Distance (km)", 100, 500000, 500000, 1000)
 
         # Apply filters
-        df = df_all.copy()
-        if f_type != "All Types":
-            df = df[df['mission_type'] == f_type]
-        if f_vehicle != "All Vehicles":
-            df = df[df['vehicle'] == f_vehicle]
-        df = df[df['cost_million'] <= f_cost]
-        df = df[df['distance_km'] <= f_dist]
+        st.session_state.mission_filters = dict(mission_type=None if f_type == "All Types" else f_type,
+                                                vehicle=None if f_vehicle == "All Vehicles" else f_vehicle,
+                                                max_cost=f_cost, max_distance=f_dist)
+        with span('filter'):
+            df = get_filter_index().filter(**st.session_state.mission_filters)
 
         # ── METRICS ──
         m1, m2, m3, m4 = st.columns(4)
-        avg_payload = int(df['payload_kg'].mean()) if len(df) else 0
-        success_rate = int(df['success'].mean() * 100) if len(df) else 0
-        avg_fuel = round(df['fuel_tons'].mean(), 1) if len(df) else 0
+        with span('aggregate'):
+            # Nothing filtered out: the shared aggregate already covers exactly these rows.
+            unfiltered = get_filter_index().positions(**st.session_state.mission_filters) is None
+            agg = get_mission_aggregates() if unfiltered else MissionAggregates.from_frame(df, AGGREGATE_COLUMNS)
+        avg_payload = int(agg.overall_mean('payload_kg')) if len(df) else 0
+        success_rate = int(agg.success_rate() * 100) if len(df) else 0
+        avg_fuel = round(agg.overall_mean('fuel_tons'), 1) if len(df) else 0
         m1.metric("Filtered Missions", len(df))
         m2.metric("Avg Payload (kg)", f"{avg_payload:,}")
         m3.metric("Success Rate", f"{success_rate}%")
@@ -530,91 +807,164 @@ elif st.session_state.screen == 'dashboard':
             st.warning("No missions match the current filters. Try adjusting your selection.")
         else:
             # ── CHARTS ──
+            figs = st.session_state.figures
             col1, col2 = st.columns(2)
 
             with col1:
                 # Scatter: Payload vs Fuel
-                fig = px.scatter(df, x='payload_kg', y='fuel_tons',
-                                 color=df['success'].map({True: 'Success', False: 'Failure'}),
-                                 color_discrete_map={'Success': '#00B4D8', 'Failure': '#E63946'},
-                                 hover_data=['mission_type', 'vehicle'],
-                                 title='Payload vs Fuel Consumption')
-                fig.update_layout(**PLOTLY_LAYOUT, title_font=dict(color='#00B4D8', family='Orbitron'))
-                fig.update_traces(marker=dict(size=9, opacity=0.8))
-                fig.update_xaxes(title="Payload (kg)")
-                fig.update_yaxes(title="Fuel (tons)")
-                st.plotly_chart(fig, use_container_width=True)
+                idx, counts = scatter_decimate(df['payload_kg'], df['fuel_tons'], groups=df['success'])
+                plot_df = df.iloc[idx].assign(missions=counts)
+                outcomes = [('Success', True, '#00B4D8'), ('Failure', False, '#E63946')]
+                fig = cached_figure(figs, ('payload_fuel', len(idx) > WEBGL_THRESHOLD), lambda: go.Figure(
+                    [scatter_trace(len(idx), name=name, mode='markers', marker=dict(size=9, opacity=0.8, color=c),
+                                   hovertemplate='%{x}, %{y}<br>%{customdata[0]} • %{customdata[1]}'
+                                                 '<br>%{customdata[2]} mission(s)<extra>' + name + '</extra>')
+                     for name, _, c in outcomes],
+                    layout=dict(title_font=dict(color='#00B4D8', family='Orbitron'),
+                                xaxis_title="Payload (kg)", yaxis_title="Fuel (tons)")))
+                for trace, (_, outcome, _) in zip(fig.data, outcomes):
+                    part = plot_df[plot_df['success'] == outcome]
+                    trace.x, trace.y = part['payload_kg'].to_numpy(), part['fuel_tons'].to_numpy()
+                    trace.customdata = part[['mission_type', 'vehicle', 'missions']].astype(str).to_numpy()
+                fig.layout.title.text = 'Payload vs Fuel Consumption' + decimation_note(len(idx), len(df))
+                show_chart(fig)
 
             with col2:
                 # Bar: Avg cost success vs failure
-                avg_s = df[df['success']]['cost_million'].mean() if df['success'].any() else 0
-                avg_f = df[~df['success']]['cost_million'].mean() if (~df['success']).any() else 0
-                fig2 = go.Figure(go.Bar(
+                avg_s = agg.overall_mean('cost_million', success=True) if agg.count(True).any() else 0
+                avg_f = agg.overall_mean('cost_million', success=False) if agg.count(False).any() else 0
+                fig2 = cached_figure(figs, 'cost_outcome', lambda: go.Figure(go.Bar(
                     x=['Success', 'Failure'],
-                    y=[round(avg_s, 1), round(avg_f, 1)],
                     marker_color=['rgba(46,204,113,0.75)', 'rgba(230,57,70,0.75)'],
                     marker_line_color=['#2ECC71', '#E63946'],
                     marker_line_width=2,
-                    text=[f'${round(avg_s,1)}M', f'${round(avg_f,1)}M'],
                     textposition='outside',
                     textfont=dict(color='#C0C7D1')
-                ))
-                fig2.update_layout(**PLOTLY_LAYOUT, title='Mission Cost: Success vs Failure',
-                                   title_font=dict(color='#FF6B35', family='Orbitron'),
-                                   yaxis_title='Avg Cost ($M)')
-                st.plotly_chart(fig2, use_container_width=True)
+                ), layout=dict(title='Mission Cost: Success vs Failure',
+                               title_font=dict(color='#FF6B35', family='Orbitron'),
+                               yaxis_title='Avg Cost ($M)')))
+                fig2.data[0].y = [round(avg_s, 1), round(avg_f, 1)]
+                fig2.data[0].text = [f'${round(avg_s,1)}M', f'${round(avg_f,1)}M']
+                show_chart(fig2)
 
             col3, col4 = st.columns(2)
 
             with col3:
-                # Line: Duration vs Distance
-                df_sorted = df.sort_values('distance_km')
-                fig3 = go.Figure(go.Scatter(
-                    x=df_sorted['distance_km'],
-                    y=df_sorted['duration_days'],
-                    mode='lines+markers',
-                    line=dict(color='#00B4D8', width=2),
-                    fill='tozeroy',
-                    fillcolor='rgba(0,180,216,0.08)',
-                    marker=dict(size=4, color='#00B4D8'),
-                ))
-                fig3.update_layout(**PLOTLY_LAYOUT, title='Duration vs Distance',
-                                   title_font=dict(color='#00B4D8', family='Orbitron'),
-                                   xaxis_title='Distance (km)', yaxis_title='Duration (days)')
-                st.plotly_chart(fig3, use_container_width=True)
+                # Line: Duration vs Distance, in the distance order the filter index already keeps
+                index = get_filter_index()
+                order = index.order_by('distance_km', **st.session_state.mission_filters)
+                distance = index.df['distance_km'].to_numpy()[order]
+                duration = index.df['duration_days'].to_numpy()[order]
+                idx = lttb(distance, duration)
+                fig3 = cached_figure(figs, ('duration_distance', len(idx) > WEBGL_THRESHOLD), lambda: go.Figure(
+                    scatter_trace(
+                        len(idx),
+                        mode='lines+markers',
+                        line=dict(color='#00B4D8', width=2),
+                        fill='tozeroy',
+                        fillcolor='rgba(0,180,216,0.08)',
+                        marker=dict(size=4, color='#00B4D8'),
+                    ), layout=dict(title_font=dict(color='#00B4D8', family='Orbitron'),
+                                   xaxis_title='Distance (km)', yaxis_title='Duration (days)')))
+                fig3.data[0].x, fig3.data[0].y = distance[idx], duration[idx]
+                fig3.layout.title.text = 'Duration vs Distance' + decimation_note(len(idx), len(df))
+                show_chart(fig3)
 
             with col4:
                 # Scatter: Scientific Yield vs Cost
                 color_map = {'Orbital': '#00B4D8', 'Lunar': '#FF6B35', 'Mars': '#E63946',
                              'Deep Space': '#2ECC71', 'ISS Resupply': '#C0C7D1'}
-                fig4 = px.scatter(df, x='cost_million', y='scientific_yield',
-                                  color='mission_type',
-                                  color_discrete_map=color_map,
-                                  title='Scientific Yield vs Mission Cost')
-                fig4.update_layout(**PLOTLY_LAYOUT, title_font=dict(color='#FF6B35', family='Orbitron'))
-                fig4.update_traces(marker=dict(size=10))
-                fig4.update_xaxes(title='Cost ($M)')
-                fig4.update_yaxes(title='Scientific Yield')
-                st.plotly_chart(fig4, use_container_width=True)
+                idx, counts = scatter_decimate(df['cost_million'], df['scientific_yield'],
+                                               groups=df['mission_type'].factorize()[0])
+                plot_df = df.iloc[idx].assign(missions=counts)
+                fig4 = cached_figure(figs, ('yield_cost', len(idx) > WEBGL_THRESHOLD), lambda: go.Figure(
+                    [scatter_trace(len(idx), name=t, mode='markers', marker=dict(size=10, color=c),
+                                   hovertemplate='%{x}, %{y}<br>%{customdata} mission(s)<extra>' + t + '</extra>')
+                     for t, c in color_map.items()],
+                    layout=dict(title_font=dict(color='#FF6B35', family='Orbitron'),
+                                xaxis_title='Cost ($M)', yaxis_title='Scientific Yield',
+                                legend_title_text='mission_type')))
+                for trace in fig4.data:
+                    part = plot_df[plot_df['mission_type'] == trace.name]
+                    trace.x, trace.y = part['cost_million'].to_numpy(), part['scientific_yield'].to_numpy()
+                    trace.customdata = part['missions'].to_numpy()
+                    trace.showlegend = len(part) > 0
+                fig4.layout.title.text = 'Scientific Yield vs Mission Cost' + decimation_note(len(idx), len(df))
+                show_chart(fig4)
 
             # Bar: Crew Size by Mission Type
-            types = ['Orbital', 'Lunar', 'Mars', 'Deep Space', 'ISS Resupply']
-            crew_s = [df[(df['mission_type'] == t) & df['success']]['crew_size'].mean() for t in types]
-            crew_f = [df[(df['mission_type'] == t) & ~df['success']]['crew_size'].mean() for t in types]
-            crew_s = [x if not np.isnan(x) else 0 for x in crew_s]
-            crew_f = [x if not np.isnan(x) else 0 for x in crew_f]
-
-            fig5 = go.Figure()
-            fig5.add_trace(go.Bar(name='Success (Avg Crew)', x=types, y=crew_s,
-                                  marker_color='rgba(46,204,113,0.75)', marker_line_color='#2ECC71',
-                                  marker_line_width=1))
-            fig5.add_trace(go.Bar(name='Failure (Avg Crew)', x=types, y=crew_f,
-                                  marker_color='rgba(230,57,70,0.75)', marker_line_color='#E63946',
-                                  marker_line_width=1))
-            fig5.update_layout(**PLOTLY_LAYOUT, title='Crew Size vs Mission Success (by Type)',
-                               title_font=dict(color='#00B4D8', family='Orbitron'),
-                               yaxis_title='Avg Crew Size', barmode='group')
-            st.plotly_chart(fig5, use_container_width=True)
+            types = agg.types
+            crew_s = np.nan_to_num(agg.mean('crew_size', success=True))
+            crew_f = np.nan_to_num(agg.mean('crew_size', success=False))
+
+            fig5 = cached_figure(figs, 'crew_outcome', lambda: go.Figure([
+                go.Bar(name='Success (Avg Crew)', x=types,
+                       marker_color='rgba(46,204,113,0.75)', marker_line_color='#2ECC71', marker_line_width=1),
+                go.Bar(name='Failure (Avg Crew)', x=types,
+                       marker_color='rgba(230,57,70,0.75)', marker_line_color='#E63946', marker_line_width=1),
+            ], layout=dict(title='Crew Size vs Mission Success (by Type)',
+                           title_font=dict(color='#00B4D8', family='Orbitron'),
+                           yaxis_title='Avg Crew Size', barmode='group')))
+            fig5.data[0].y, fig5.data[1].y = crew_s, crew_f
+            show_chart(fig5)
+
+        # ── LAUNCH CADENCE ──
+        # Read from the monthly rollups, so any range, grain or split regroups a
+        # few thousand rows. Type and vehicle filters apply; cost and distance limits don't.
+        with st.expander("📅 LAUNCH CADENCE", expanded=True):
+            rollups = get_launch_rollups()
+            if rollups.span() is None:
+                st.info("No dated missions to chart.")
+            else:
+                first, last = (d.date() for d in rollups.span())
+                date_range = st.slider("Launch Dates", first, last, (first, last), format="MMM YYYY",
+                                       key="cadence_range")
+                cc1, cc2, cc3 = st.columns(3)
+                with cc1:
+                    grain = st.radio("Period", list(GRAINS), index=1, horizontal=True, key="cadence_grain")
+                with cc2:
+                    split = st.selectbox("Split By", ["None", "Vehicle", "Mission Type"], key="cadence_split")
+                with cc3:
+                    metrics = {'Launches': 'launches', 'Success Rate': 'success_rate', 'Total Cost ($M)': 'cost_million',
+                               'Total Payload (kg)': 'payload_kg', 'Avg Cost ($M)': 'avg_cost_million',
+                               'Avg Payload (kg)': 'avg_payload_kg'}
+                    metric = st.selectbox("Metric", list(metrics), key="cadence_metric")
+
+                by = {'None': None, 'Vehicle': 'vehicle', 'Mission Type': 'mission_type'}[split]
+                filters = st.session_state.mission_filters
+                with span('rollup.query'):
+                    cadence = rollups.query(*date_range, grain=GRAINS[grain], by=by,
+                                            mission_type=filters['mission_type'], vehicle=filters['vehicle'])
+                column = metrics[metric]
+                # Sums stack across groups; rates and averages are drawn as one line per group.
+                stacked = column in ('launches', 'cost_million', 'payload_kg')
+                groups = tuple(cadence[by].unique()) if by else ('All',)
+                fig_cad = cached_figure(st.session_state.figures, ('cadence', stacked, groups), lambda: go.Figure(
+                    [go.Bar(name=g) if stacked else go.Scatter(name=g, mode='lines+markers', marker=dict(size=5))
+                     for g in groups],
+                    layout=dict(title_font=dict(color='#00B4D8', family='Orbitron'), barmode='stack',
+                                showlegend=by is not None)))
+                for trace in fig_cad.data:
+                    part = cadence[cadence[by] == trace.name] if by else cadence
+                    trace.x, trace.y = part['period'].to_numpy(), part[column].to_numpy()
+                fig_cad.layout.title.text = f'{metric} per {grain}'
+                fig_cad.layout.yaxis.tickformat = '.0%' if column == 'success_rate' else None
+                show_chart(fig_cad)
+                note = f"{int(cadence['launches'].sum()):,} launches in range"
+                if rollups.undated:
+                    note += f" · {rollups.undated:,} imported missions without a launch date are not shown"
+                st.caption(note)
+
+        # ── MEMORY ──
+        with st.expander("💾 DATASET MEMORY", expanded=False):
+            st.caption("Bytes per column of the shared mission table as stored (categoricals, 32-bit "
+                       "numbers, datetime64) against object strings and 64-bit numbers")
+            if st.checkbox("Measure", key="memory_report"):
+                report = get_memory_report(get_mission_log().version).rename(columns={
+                    'column': 'Column', 'dtype': 'Dtype', 'bytes': 'Bytes', 'untyped_dtype': 'Untyped Dtype',
+                    'untyped_bytes': 'Untyped Bytes', 'saving': 'Saving'})
+                st.dataframe(report.style.format({'Bytes': '{:,}', 'Untyped Bytes': '{:,}', 'Saving': '{:.1f}×'}),
+                             hide_index=True, use_container_width=True)
 
     # ══════════════
     #  PHYSICS SIM
@@ -639,100 +989,90 @@ elif st.session_state.screen == 'dashboard':
             payload    = st.slider("Payload (kg)",           100,   50000,  5000,   100)
             fuel_mass  = st.slider("Fuel (kg)",             1000,  150000, 30000,   500)
             steps      = st.slider("Time Steps",              50,    500,   200,     10)
+            integrator = st.selectbox("Integrator", ["Euler (Δt = 1 s)", "RK4 (Δt = 1 s)", "RK45 Adaptive"])
+            atmosphere = st.selectbox("Atmosphere", list(ATMOSPHERES),
+                                      help="US Standard 1976 adds inverse-square gravity and Mach-dependent drag")
+            vehicle_name = st.selectbox("Vehicle", ["Single stage (sliders)"] + list(VEHICLE_PRESETS),
+                                        help="Multi-stage presets take only the payload from the sliders above")
+            if vehicle_name in VEHICLE_PRESETS:
+                flight_time = st.slider("Flight Time (s)", 100, 3000, 900, 50)
+            stream = st.checkbox("Stream playback", value=False,
+                                 help="Draws the Euler ascent while it is being integrated. "
+                                      "Cached runs, RK integrators and multi-stage vehicles appear at once.")
+            if stream:
+                speed = st.select_slider("Playback Speed (× real time)", [5, 10, 25, 50, 100, 'Max'], value=25)
 
             run_btn = st.button("🚀  LAUNCH SIMULATION", use_container_width=True)
 
-        # ── SIMULATION ENGINE ──
-        def run_simulation(init_mass, thrust_kn, drag_cd, payload, fuel_mass, steps):
-            g = 9.81
-            dt = 1.0
-            cross_area = 10.0
-            sea_level_density = 1.225
-            thrust = thrust_kn * 1000
-            fuel_burn_rate = fuel_mass / (steps * 0.7)
-
-            mass = init_mass + payload + fuel_mass
-            velocity = 0.0
-            altitude = 0.0
-            fuel = float(fuel_mass)
-
-            times, altitudes, velocities = [], [], []
-            max_alt = 0.0
-            max_vel = 0.0
-            burnout_time = 0
-
-            for t in range(steps + 1):
-                times.append(t)
-                altitudes.append(max(0.0, altitude))
-                velocities.append(max(0.0, velocity))
-
-                if altitude > max_alt:
-                    max_alt = altitude
-                if velocity > max_vel:
-                    max_vel = velocity
-
-                density = sea_level_density * np.exp(-altitude / 8500)
-                current_thrust = thrust if fuel > 0 else 0
-                gravity_force = mass * g
-                drag_force = 0.5 * drag_cd * density * velocity ** 2 * cross_area
-                net_force = current_thrust - gravity_force - drag_force
-                acceleration = net_force / mass
-
-                velocity += acceleration * dt
-                altitude += velocity * dt
-
-                if fuel > 0:
-                    fuel -= fuel_burn_rate * dt
-                    mass -= fuel_burn_rate * dt
-                    if fuel <= 0:
-                        fuel = 0
-                        burnout_time = t
-
-                if altitude < 0 and t > 1:
-                    altitude = 0.0
-                    velocity = 0.0
-
-            twr = thrust / ((init_mass + payload + fuel_mass) * g)
-            return {
-                'times': times, 'altitudes': altitudes, 'velocities': velocities,
-                'max_alt': max_alt, 'max_vel': max_vel,
-                'burnout_time': burnout_time, 'twr': round(twr, 2)
-            }
-
         if run_btn:
-            st.session_state.sim_results = run_simulation(init_mass, thrust_kn, drag_cd, payload, fuel_mass, steps)
+            if vehicle_name in VEHICLE_PRESETS:
+                key, compute = vehicle_job(integrator, VEHICLE_PRESETS[vehicle_name].with_payload(payload),
+                                           flight_time, atmosphere)
+            else:
+                params = (init_mass, thrust_kn, drag_cd, payload, fuel_mass, steps)
+                key, compute = simulation_job(integrator, params, atmosphere)
+                if stream and integrator.startswith("Euler"):
+                    compute = lambda: stream_simulation(params, atmosphere, None if speed == 'Max' else speed,
+                                                        chart_col)
+            with span('simulate'):
+                st.session_state.sim_results = get_sim_cache().get_or_compute(key, compute)
             st.success(f"🚀 Simulation complete! Max altitude: {st.session_state.sim_results['max_alt']/1000:.1f} km")
 
+        with ctrl_col:
+            cs = get_sim_cache().stats()
+            st.caption(f"Result cache: {cs['hits']:,} hits • {cs['misses']:,} misses • "
+                       f"{cs['size']}/{cs['maxsize']} entries ({cs['hit_rate']:.0%} hit rate)")
+
         with chart_col:
             if st.session_state.sim_results:
                 res = st.session_state.sim_results
                 s1, s2, s3, s4 = st.columns(4)
                 s1.metric("Max Altitude", f"{res['max_alt']/1000:.1f} km")
                 s2.metric("Max Velocity", f"{res['max_vel']:.0f} m/s")
-                s3.metric("Fuel Burnout", f"{res['burnout_time']}s")
+                s3.metric("Fuel Burnout", f"{res['burnout_time']:g}s")
                 s4.metric("TWR", res['twr'])
 
+                if 'events' in res:
+                    ev = {k: (f"{v:.2f}s" if v is not None else "—") for k, v in res['events'].items()}
+                    staging = ''.join(f" • {k} {v}" for k, v in ev.items() if k.startswith('separation'))
+                    st.caption(f"Events — {staging[3:] + ' • ' if staging else ''}burnout {ev['burnout']} • "
+                               f"apogee {ev['apogee']} • impact {ev['impact']} • {res['nfev']:,} function evaluations")
+                if 'stages' in res:
+                    stage_table = pd.DataFrame(res['stages']).rename(columns={
+                        'stage': 'Stage', 'ignition': 'Ignition (s)', 'burnout': 'Burnout (s)',
+                        'burn_time': 'Burn (s)', 'mass_flow': 'ṁ (kg/s)', 'altitude': 'Alt (km)',
+                        'velocity': 'Vel (m/s)'})
+                    stage_table['Alt (km)'] /= 1000
+                    st.dataframe(stage_table.style.format(precision=1, na_rep='—'),
+                                 hide_index=True, use_container_width=True)
+
                 # Altitude chart
-                fig_alt = go.Figure(go.Scatter(
-                    x=res['times'], y=res['altitudes'],
-                    mode='lines', line=dict(color='#00B4D8', width=2),
-                    fill='tozeroy', fillcolor='rgba(0,180,216,0.08)'
-                ))
-                fig_alt.update_layout(**PLOTLY_LAYOUT, title='Altitude vs Time',
-                                      title_font=dict(color='#00B4D8', family='Orbitron'),
-                                      xaxis_title='Time (s)', yaxis_title='Altitude (m)', height=280)
-                st.plotly_chart(fig_alt, use_container_width=True)
+                traj = res['trajectory']
+                times = traj.times
+                idx = lttb(times, traj.altitudes)
+                fig_alt = cached_figure(st.session_state.figures, ('altitude', len(idx) > WEBGL_THRESHOLD),
+                                        lambda: go.Figure(scatter_trace(
+                                            len(idx), mode='lines', line=dict(color='#00B4D8', width=2),
+                                            fill='tozeroy', fillcolor='rgba(0,180,216,0.08)'
+                                        ), layout=dict(title_font=dict(color='#00B4D8', family='Orbitron'),
+                                                       xaxis_title='Time (s)', yaxis_title='Altitude (m)',
+                                                       height=280)))
+                fig_alt.data[0].x, fig_alt.data[0].y = times[idx], traj.altitudes[idx]
+                fig_alt.layout.title.text = 'Altitude vs Time' + decimation_note(len(idx), len(times))
+                show_chart(fig_alt)
 
                 # Velocity chart
-                fig_vel = go.Figure(go.Scatter(
-                    x=res['times'], y=res['velocities'],
-                    mode='lines', line=dict(color='#FF6B35', width=2),
-                    fill='tozeroy', fillcolor='rgba(255,107,53,0.08)'
-                ))
-                fig_vel.update_layout(**PLOTLY_LAYOUT, title='Velocity vs Time',
-                                      title_font=dict(color='#FF6B35', family='Orbitron'),
-                                      xaxis_title='Time (s)', yaxis_title='Velocity (m/s)', height=280)
-                st.plotly_chart(fig_vel, use_container_width=True)
+                idx = lttb(times, traj.velocities)
+                fig_vel = cached_figure(st.session_state.figures, ('velocity', len(idx) > WEBGL_THRESHOLD),
+                                        lambda: go.Figure(scatter_trace(
+                                            len(idx), mode='lines', line=dict(color='#FF6B35', width=2),
+                                            fill='tozeroy', fillcolor='rgba(255,107,53,0.08)'
+                                        ), layout=dict(title_font=dict(color='#FF6B35', family='Orbitron'),
+                                                       xaxis_title='Time (s)', yaxis_title='Velocity (m/s)',
+                                                       height=280)))
+                fig_vel.data[0].x, fig_vel.data[0].y = times[idx], traj.velocities[idx]
+                fig_vel.layout.title.text = 'Velocity vs Time' + decimation_note(len(idx), len(times))
+                show_chart(fig_vel)
 
             else:
                 st.markdown("""
@@ -745,6 +1085,251 @@ elif st.session_state.screen == 'dashboard':
                 </div>
                 """, unsafe_allow_html=True)
 
+        # ── MONTE CARLO DISPERSION ──
+        with st.expander("🎲 MONTE CARLO DISPERSION", expanded=False):
+            st.caption("Perturbs the launch parameters above and runs every trajectory through the "
+                       "batched Euler engine (Δt = 1 s) with the selected atmosphere")
+            mc1, mc2, mc3 = st.columns(3)
+            with mc1:
+                mc_dist = st.selectbox("Distribution", DISTRIBUTIONS)
+                mc_runs = st.slider("Trajectories", 1000, 100000, 20000, 1000)
+                mc_seed = st.number_input("Seed", 0, 2**31 - 1, 42, 1)
+            with mc2:
+                sd_thrust = st.slider("Thrust Spread (%)", 0.0, 20.0, 3.0, 0.5)
+                sd_drag = st.slider("Drag Coefficient Spread (%)", 0.0, 50.0, 10.0, 1.0)
+                sd_fuel = st.slider("Fuel Spread (%)", 0.0, 20.0, 2.0, 0.5)
+            with mc3:
+                sd_payload = st.slider("Payload Spread (%)", 0.0, 20.0, 5.0, 0.5)
+                target_km = st.number_input("Target Altitude (km)", 0.1, 10000.0, 10.0, 1.0)
+                mc_pool = st.checkbox("Run on process pool", value=True, key="mc_pool")
+            mc_btn = st.button("🎲  RUN DISPERSION", use_container_width=True)
+
+        if mc_btn:
+            nominal = {'thrust_kn': thrust_kn, 'drag_cd': drag_cd, 'payload': payload, 'fuel_mass': fuel_mass}
+            spreads = {'thrust_kn': sd_thrust / 100, 'drag_cd': sd_drag / 100,
+                       'payload': sd_payload / 100, 'fuel_mass': sd_fuel / 100}
+            samples = dispersion_samples(nominal, spreads, mc_runs, mc_dist, seed=int(mc_seed))
+            env = get_atmosphere(atmosphere)
+            env = None if env is EXPONENTIAL else env
+            started = time.perf_counter()
+            with st.spinner(f"Flying {mc_runs:,} trajectories..."), span('dispersion'):
+                if mc_pool:
+                    st.session_state.sweep_count += 1
+                    tag = f"{st.session_state.session_uid}-mc-{st.session_state.sweep_count}"
+                    results = get_executor().map_sweep(samples, init_mass, steps, tag=tag, environment=env)
+                    chunks = [chunk for chunk, _ in results]
+                else:
+                    chunks = list(iter_sweep(samples, init_mass, steps, environment=env))
+            mc_res = pd.concat(chunks).sort_index()
+            st.session_state.dispersion_results = (mc_res, summarize(mc_res, target_km * 1000),
+                                                   target_km, time.perf_counter() - started)
+
+        if st.session_state.dispersion_results is not None:
+            mc_res, summary, mc_target, mc_elapsed = st.session_state.dispersion_results
+            low, high = summary['ci']
+            d1, d2, d3 = st.columns(3)
+            d1.metric(f"P(apogee ≥ {mc_target:g} km)", f"{summary['p_reach']:.1%}",
+                      help=f"{summary['hits']:,} of {summary['n']:,} trajectories")
+            d2.metric(f"{summary['confidence']:.0%} Confidence Interval", f"{low:.2%} – {high:.2%}")
+            d3.metric("Run Time", f"{mc_elapsed:.2f}s", help=f"{summary['n']:,} trajectories")
+
+            hc, tc = st.columns([3, 2])
+            with hc:
+                counts, edges = np.histogram(mc_res['max_alt'] / 1000, bins=60)
+                fig_mc = cached_figure(st.session_state.figures, 'dispersion', lambda: go.Figure(
+                    go.Bar(marker_color='rgba(0,180,216,0.6)', marker_line_color='#00B4D8', marker_line_width=1),
+                    layout=dict(title='Apogee Dispersion', title_font=dict(color='#00B4D8', family='Orbitron'),
+                                xaxis_title='Apogee (km)', yaxis_title='Trajectories', bargap=0.02, height=320)))
+                fig_mc.data[0].update(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges))
+                fig_mc.layout.shapes = []
+                fig_mc.add_vline(x=mc_target, line=dict(color='#FF6B35', dash='dash', width=2),
+                                 annotation_text="target", annotation_font_color='#FF6B35')
+                show_chart(fig_mc)
+            with tc:
+                label = st.selectbox("Percentiles", list(summary['percentiles']))
+                table = summary['percentiles'][label].rename(columns={
+                    'percentile': 'P', 'value': 'Value', 'ci_low': 'CI Low', 'ci_high': 'CI High'})
+                st.dataframe(table.style.format({'P': 'P{:d}', 'Value': '{:,.1f}',
+                                                 'CI Low': '{:,.1f}', 'CI High': '{:,.1f}'}),
+                             hide_index=True, use_container_width=True)
+
+        # ── INVERSE SOLVER ──
+        with st.expander("🎯 INVERSE SOLVER", expanded=False):
+            st.caption("Finds the fuel or payload that just reaches a target apogee, holding the other "
+                       "launch parameters, integrator and atmosphere fixed. Evaluations go through the result cache.")
+            preset = VEHICLE_PRESETS.get(vehicle_name)
+            if preset is not None:
+                st.caption(f"Solving for the {preset.name} over its flight time; each stage's propellant is "
+                           "fixed by the preset, so only the payload can be solved for.")
+            sv1, sv2, sv3 = st.columns(3)
+            with sv1:
+                goals = [g for g, (param, _) in SOLVE_GOALS.items() if preset is None or param == 'payload']
+                solve_for = st.selectbox("Solve For", goals)
+            with sv2:
+                solve_km = st.number_input("Target Apogee (km)", 0.1, 10000.0, 10.0, 1.0, key="solve_km")
+            with sv3:
+                solve_tol = st.number_input("Tolerance (kg)", 1.0, 1000.0, 10.0, 1.0)
+            solve_btn = st.button("🎯  SOLVE", use_container_width=True)
+
+        if solve_btn:
+            param, objective = SOLVE_GOALS[solve_for]
+            fixed = dict(init_mass=init_mass, thrust_kn=thrust_kn, drag_cd=drag_cd,
+                         payload=payload, fuel_mass=fuel_mass, steps=steps)
+
+            def apogee(x):
+                if preset is not None:
+                    key, compute = vehicle_job(integrator, preset.with_payload(x), flight_time, atmosphere)
+                else:
+                    key, compute = simulation_job(integrator, tuple({**fixed, param: x}.values()), atmosphere)
+                return get_sim_cache().get_or_compute(key, compute)['max_alt']
+
+            # Warm starts are kept per vehicle; a single-stage answer is no guide for a preset.
+            guess_key = (vehicle_name, param)
+            hits_before = get_sim_cache().stats()['hits']
+            with span('solve'):
+                result = solve_apogee(apogee, solve_km * 1000, SOLVE_BOUNDS[param], objective,
+                                      xtol=solve_tol, guess=st.session_state.solver_guess.get(guess_key))
+            result['cache_hits'] = get_sim_cache().stats()['hits'] - hits_before
+            if result['value'] is not None:
+                st.session_state.solver_guess[guess_key] = result['value']
+            st.session_state.solver_results = (solve_for, solve_km, result)
+
+        if st.session_state.solver_results is not None:
+            solve_for, solve_km, result = st.session_state.solver_results
+            if result['value'] is None:
+                st.warning(f"No {solve_for.split()[-1].lower()} within the slider range reaches {solve_km:g} km "
+                           f"({result['evals']} evaluations).")
+            else:
+                lo, hi = result['feasible']
+                r1, r2, r3 = st.columns(3)
+                r1.metric(solve_for, f"{result['value']:,.0f} kg")
+                r2.metric("Apogee Reached", f"{result['apogee']/1000:.2f} km")
+                r3.metric("Evaluations", result['evals'], help=f"{result['cache_hits']} answered from the result cache")
+                st.caption(f"Feasible range for {solve_km:g} km: {lo:,.0f} – {hi:,.0f} kg")
+            hist_x, hist_y = zip(*result['history'])
+            fig_sv = cached_figure(st.session_state.figures, 'solver', lambda: go.Figure(
+                go.Scatter(mode='markers+lines', line=dict(color='rgba(192,199,209,0.4)', width=1),
+                           marker=dict(size=8, color='#2ECC71')),
+                layout=dict(title='Solver Evaluations', title_font=dict(color='#2ECC71', family='Orbitron'),
+                            yaxis_title='Apogee (km)', height=280)))
+            fig_sv.data[0].update(x=hist_x, y=np.asarray(hist_y) / 1000)
+            fig_sv.layout.xaxis.title.text = solve_for.split()[-1] + ' (kg)'
+            fig_sv.layout.shapes = []
+            fig_sv.add_hline(y=solve_km, line=dict(color='#FF6B35', dash='dash', width=2))
+            show_chart(fig_sv)
+
+    # ══════════════
+    #  DESIGN EXPLORER
+    # ══════════════
+    elif page == "🧭  Design Explorer":
+        st.markdown("""
+        <h1 style="font-family:'Orbitron',sans-serif; color:#00B4D8; font-size:1.8rem; margin-bottom:4px;">
+            🧭 Design-Space Explorer</h1>
+        <p style="font-family:'Exo 2',sans-serif; color:#C0C7D1; font-size:13px; margin-bottom:20px;">
+            Sweep thrust, payload, fuel and drag through the simulator</p>
+        """, unsafe_allow_html=True)
+
+        with st.expander("🔧 SWEEP CONFIGURATION", expanded=True):
+            sc1, sc2, sc3 = st.columns(3)
+            with sc1:
+                sampling = st.radio("Sampling", ["Grid", "Latin Hypercube"], horizontal=True)
+                if sampling == "Grid":
+                    per_axis = st.slider("Points per Axis", 2, 40, 10, 1)
+                    n_points = per_axis ** 4
+                else:
+                    n_points = st.slider("Samples", 1000, 100000, 20000, 1000)
+                st.caption(f"{n_points:,} configurations")
+            with sc2:
+                r_thrust = st.slider("Thrust Range (kN)", 100, 5000, (400, 2000), 50)
+                r_payload = st.slider("Payload Range (kg)", 100, 50000, (1000, 20000), 100)
+                sw_mass = st.slider("Initial Mass (kg)", 5000, 200000, 50000, 1000, key="sw_mass")
+            with sc3:
+                r_fuel = st.slider("Fuel Range (kg)", 1000, 150000, (10000, 80000), 500)
+                r_drag = st.slider("Drag Coefficient Range", 0.05, 1.0, (0.2, 0.6), 0.01)
+                sw_steps = st.slider("Time Steps", 50, 500, 200, 10, key="sw_steps")
+
+            use_pool = st.checkbox("Run on process pool", value=True,
+                                   help="Dispatch sweep chunks to worker processes across all server cores")
+            sweep_btn = st.button("🧭  RUN SWEEP", use_container_width=True)
+
+        # Inputs moved since the last pooled sweep: drop whatever it still has queued.
+        sweep_sig = (sampling, n_points, r_thrust, r_payload, r_fuel, r_drag, sw_mass, sw_steps)
+        if st.session_state.sweep_tag and st.session_state.sweep_sig != sweep_sig:
+            get_executor().cancel(st.session_state.sweep_tag)
+            st.session_state.sweep_tag = None
+
+        progress = st.empty()
+        hm1, hm2 = st.columns(2)
+        alt_slot, burn_slot = hm1.empty(), hm2.empty()
+        pareto_slot = st.empty()
+
+        heatmaps = (
+            (alt_slot, 'thrust_kn', 'payload', 'max_alt', 'Max Altitude (m)', '#00B4D8'),
+            (burn_slot, 'fuel_mass', 'thrust_kn', 'burnout_time', 'Burnout Time (s)', '#FF6B35'),
+        )
+
+        def draw_sweep(summary):
+            for slot, x, y, value, title, color in heatmaps:
+                x_mid, y_mid, z = summary.heatmap(x, y, value)
+                fig_hm = cached_figure(st.session_state.figures, ('sweep', value), lambda: go.Figure(
+                    go.Heatmap(colorscale=[[0, '#0B1C2D'], [1, color]],
+                               colorbar=dict(tickfont=dict(color='#C0C7D1'))),
+                    layout=dict(title=title, title_font=dict(color=color, family='Orbitron'),
+                                xaxis_title=x, yaxis_title=y, height=340)))
+                fig_hm.data[0].update(x=x_mid, y=y_mid, z=z)
+                # A slot redrawn mid-sweep may get an unchanged figure; the row count keeps its id unique.
+                show_chart(fig_hm, slot, key=f'sweep-{value}-{summary.n}')
+
+            points, front = summary.points(), summary.front
+            fig_pf = cached_figure(st.session_state.figures, ('pareto', len(points) > WEBGL_THRESHOLD), lambda: go.Figure([
+                scatter_trace(len(points), mode='markers', name='Configurations',
+                              marker=dict(size=3, color='rgba(192,199,209,0.25)')),
+                go.Scatter(mode='lines+markers', name='Pareto Front',
+                           line=dict(color='#2ECC71', width=2), marker=dict(size=6)),
+            ], layout=dict(title_font=dict(color='#2ECC71', family='Orbitron'),
+                           xaxis_title='Payload (kg)', yaxis_title='Max Altitude (m)', height=380)))
+            fig_pf.data[0].x, fig_pf.data[0].y = points['payload'].to_numpy(), points['max_alt'].to_numpy()
+            fig_pf.data[1].x, fig_pf.data[1].y = front['payload'].to_numpy(), front['max_alt'].to_numpy()
+            fig_pf.layout.title.text = 'Pareto Front: Payload vs Max Altitude' + decimation_note(len(points), summary.n)
+            show_chart(fig_pf, pareto_slot, key=f'pareto-{summary.n}')
+
+        if sweep_btn:
+            ranges = {'thrust_kn': r_thrust, 'payload': r_payload, 'fuel_mass': r_fuel, 'drag_cd': r_drag}
+            samples = (grid_samples(ranges, per_axis) if sampling == "Grid"
+                       else latin_hypercube_samples(ranges, n_points))
+            job_times = []
+            summary = SweepSummary(samples, [(x, y, value) for _, x, y, value, _, _ in heatmaps])
+            drawn = 0.0
+            bar = progress.progress(0.0, text="Sweeping...")
+            started = time.perf_counter()
+            if use_pool:
+                executor = get_executor()
+                st.session_state.sweep_count += 1
+                tag = f"{st.session_state.session_uid}-{st.session_state.sweep_count}"
+                st.session_state.sweep_tag, st.session_state.sweep_sig = tag, sweep_sig
+                results = executor.map_sweep(samples, sw_mass, sw_steps, tag=tag)
+            else:
+                results = ((chunk, None) for chunk in iter_sweep(samples, sw_mass, sw_steps))
+            with span('sweep'):
+                for chunk, job in results:
+                    summary.add(chunk)
+                    if job is not None:
+                        job_times.append(job.run_time)
+                    bar.progress(summary.n / len(samples), text=f"Sweeping... {summary.n:,} / {len(samples):,}")
+                    # Redraws are paced by wall time; the summary is cheap to fold into on every chunk.
+                    if summary.n == len(samples) or time.perf_counter() - drawn >= SWEEP_REDRAW_INTERVAL:
+                        draw_sweep(summary)
+                        drawn = time.perf_counter()
+            st.session_state.sweep_summary = summary
+            st.session_state.sweep_tag = None
+            elapsed = time.perf_counter() - started
+            timing = (f" on {executor.max_workers} workers • mean job {np.mean(job_times):.2f}s" if job_times else "")
+            progress.success(f"🧭 Sweep complete: {len(samples):,} configurations in {elapsed:.2f}s{timing}")
+        elif st.session_state.sweep_summary is not None:
+            draw_sweep(st.session_state.sweep_summary)
+        else:
+            progress.info("Configure a sweep and click RUN SWEEP")
+
     # ══════════════
     #  INSIGHTS
     # ══════════════
@@ -756,52 +1341,49 @@ elif st.session_state.screen == 'dashboard':
             Cross-reference mission data with simulation physics</p>
         """, unsafe_allow_html=True)
 
+        follow = st.checkbox("Follow Mission Data filters", value=False,
+                             help="Compute the correlations over the missions selected on the Mission Data page")
+        filters = st.session_state.mission_filters if follow else {}
         col1, col2 = st.columns(2)
 
         with col1:
             # Correlation heatmap as bubble chart
             fields = ['Payload', 'Fuel', 'Cost', 'Distance', 'Duration', 'Crew']
-            field_keys = ['payload_kg', 'fuel_tons', 'cost_million', 'distance_km', 'duration_days', 'crew_size']
-
-            corr_matrix = df_all[field_keys].corr().values
-
-            heat_x, heat_y, heat_v, heat_color, heat_size, heat_text = [], [], [], [], [], []
-            for i in range(len(fields)):
-                for j in range(len(fields)):
-                    v = round(corr_matrix[i][j], 2)
-                    heat_x.append(fields[j])
-                    heat_y.append(fields[i])
-                    heat_v.append(v)
-                    heat_color.append('#00B4D8' if v >= 0 else '#E63946')
-                    heat_size.append(max(5, abs(v) * 30))
-                    heat_text.append(f"{fields[i]}×{fields[j]}: r={v}")
-
-            fig_heat = go.Figure(go.Scatter(
+
+            with span('correlation'):
+                corr_acc = mission_correlation(**filters)
+                corr_matrix = corr_acc.corr()
+
+            heat_x = np.tile(fields, len(fields))
+            heat_y = np.repeat(fields, len(fields))
+            heat_v = np.round(corr_matrix, 2).ravel()
+            heat_size = np.maximum(5, np.nan_to_num(np.abs(heat_v)) * 30)
+            heat_text = [f"{y}×{x}: r={v}" for x, y, v in zip(heat_x, heat_y, heat_v)]
+
+            fig_heat = cached_figure(st.session_state.figures, 'correlation', lambda: go.Figure(go.Scatter(
                 x=heat_x, y=heat_y,
                 mode='markers+text',
                 marker=dict(
-                    size=heat_size,
-                    color=[v for v in heat_v],
                     colorscale=[[0, '#E63946'], [0.5, '#666'], [1, '#00B4D8']],
                     cmin=-1, cmax=1,
                     showscale=True,
                     colorbar=dict(title='r', tickfont=dict(color='#C0C7D1'))
                 ),
-                text=[f"{v:.2f}" for v in heat_v],
                 textfont=dict(size=9, color='white'),
                 textposition='middle center',
-                hovertext=heat_text,
                 hoverinfo='text'
-            ))
-            fig_heat.update_layout(**PLOTLY_LAYOUT, title='Correlation Heatmap',
-                                   title_font=dict(color='#00B4D8', family='Orbitron'), height=360)
-            st.plotly_chart(fig_heat, use_container_width=True)
+            ), layout=dict(title_font=dict(color='#00B4D8', family='Orbitron'), height=360)))
+            fig_heat.data[0].marker.update(size=heat_size, color=heat_v)
+            fig_heat.data[0].update(text=[f"{v:.2f}" for v in heat_v], hovertext=heat_text)
+            fig_heat.layout.title.text = f'Correlation Heatmap ({corr_acc.n:,} missions)'
+            show_chart(fig_heat)
 
         with col2:
             # Avg Payload vs Fuel by Mission Type
-            types = ['Orbital', 'Lunar', 'Mars', 'Deep Space', 'ISS Resupply']
-            avg_payloads = [int(df_all[df_all['mission_type'] == t]['payload_kg'].mean()) for t in types]
-            avg_fuels = [round(df_all[df_all['mission_type'] == t]['fuel_tons'].mean(), 1) for t in types]
+            agg = get_mission_aggregates()
+            types = agg.types
+            avg_payloads = np.nan_to_num(agg.mean('payload_kg')).astype(int)
+            avg_fuels = np.nan_to_num(agg.mean('fuel_tons')).round(1)
 
             fig_cmp = make_subplots(specs=[[{"secondary_y": True}]])
             fig_cmp.add_trace(go.Bar(name='Avg Payload (kg)', x=types, y=avg_payloads,
@@ -811,14 +1393,14 @@ elif st.session_state.screen == 'dashboard':
                                      marker_color='rgba(255,107,53,0.75)',
                                      marker_line_color='#FF6B35', marker_line_width=1), secondary_y=True)
 
-            fig_cmp.update_layout(**PLOTLY_LAYOUT, title='Avg Payload vs Fuel by Mission Type',
+            fig_cmp.update_layout(title='Avg Payload vs Fuel by Mission Type',
                                   title_font=dict(color='#FF6B35', family='Orbitron'),
                                   barmode='group', height=360)
             fig_cmp.update_yaxes(title_text="Payload (kg)", secondary_y=False,
                                  gridcolor='rgba(0,180,216,0.08)', color='#00B4D8')
             fig_cmp.update_yaxes(title_text="Fuel (tons)", secondary_y=True,
                                  gridcolor='rgba(0,0,0,0)', color='#FF6B35')
-            st.plotly_chart(fig_cmp, use_container_width=True)
+            show_chart(fig_cmp)
 
         # Analysis text
         st.markdown("""
@@ -886,12 +1468,14 @@ elif st.session_state.screen == 'dashboard':
 
         schema = pd.DataFrame({
             'Field': ['mission_type', 'vehicle', 'payload_kg', 'fuel_tons', 'cost_million',
-                      'distance_km', 'duration_days', 'crew_size', 'success'],
-            'Type': ['string', 'string', 'number', 'number', 'number', 'number', 'number', 'number', 'boolean'],
+                      'distance_km', 'duration_days', 'crew_size', 'success', 'launch_date'],
+            'Type': ['category', 'category', 'int32', 'float32', 'float32', 'int32', 'int32', 'int8', 'bool',
+                     'datetime64'],
             'Description': ['Orbital, Lunar, Mars, Deep Space, ISS', 'Launch vehicle designation',
                             'Payload mass in kilograms', 'Fuel consumption in metric tons',
                             'Mission cost in millions USD', 'Mission distance in km',
-                            'Mission duration in days', 'Number of crew members', 'Mission outcome']
+                            'Mission duration in days', 'Number of crew members', 'Mission outcome',
+                            'Launch date (optional on import)']
         })
         st.dataframe(schema, use_container_width=True, hide_index=True)
         st.markdown('</div>', unsafe_allow_html=True)
@@ -907,4 +1491,74 @@ elif st.session_state.screen == 'dashboard':
             <span class="tag-chip" style="background:rgba(0,180,216,0.15); color:#00B4D8; border:1px solid rgba(0,180,216,0.3);">Pandas / NumPy</span>
         </div>
         </div>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+        """, unsafe_allow_html=True)
+
+    # ══════════════
+    #  PROFILER (admin only)
+    # ══════════════
+    elif page == "🛠  Profiler":
+        st.markdown("""
+        <h1 style="font-family:'Orbitron',sans-serif; color:#00B4D8; font-size:1.8rem; margin-bottom:4px;">
+            🛠 Rerun Profiler</h1>
+        <p style="font-family:'Exo 2',sans-serif; color:#C0C7D1; font-size:13px; margin-bottom:20px;">
+            Stage timings over recent reruns from every session on this server</p>
+        """, unsafe_allow_html=True)
+
+        profiler = get_profiler()
+        opts = st.session_state.profile_opts
+        pc1, pc2, pc3 = st.columns(3)
+        opts['profile'] = pc1.checkbox("cProfile capture", value=opts['profile'],
+                                       help="Profile this session's reruns with cProfile (slows them down)")
+        opts['trace_memory'] = pc2.checkbox("tracemalloc peaks", value=opts['trace_memory'],
+                                            help="Trace allocations process-wide to record each rerun's peak")
+        if not opts['trace_memory']:
+            set_memory_tracing(False)
+        if pc3.button("Clear History"):
+            profiler.clear()
+
+        labels = sorted({r.label for r in profiler.recent()} - {page})
+        scope = st.selectbox("Page", ["All Pages"] + labels)
+        label = None if scope == "All Pages" else scope
+        runs = [r for r in profiler.recent(label) if r.label != page]
+
+        if not runs:
+            st.info("No reruns recorded yet — visit the other pages first")
+        else:
+            stats = pd.DataFrame(profiler.stage_percentiles(label))
+            st.dataframe(stats.style.format({'p50': '{:,.1f} ms', 'p90': '{:,.1f} ms', 'p99': '{:,.1f} ms'}),
+                         hide_index=True, use_container_width=True)
+
+            wall = np.array([r.wall_ms for r in runs])
+            rss = np.array([r.rss / 2**20 if r.rss is not None else np.nan for r in runs])
+            peak = np.array([(r.peak_bytes or 0) / 2**20 for r in runs])
+            fig_prof = cached_figure(st.session_state.figures, 'profiler', lambda: make_subplots(
+                specs=[[{"secondary_y": True}]]))
+            if not fig_prof.data:
+                fig_prof.add_trace(go.Bar(name='Rerun (ms)', marker_color='rgba(0,180,216,0.6)'), secondary_y=False)
+                fig_prof.add_trace(go.Scatter(name='RSS (MiB)', mode='lines', line=dict(color='#FF6B35')),
+                                   secondary_y=True)
+                fig_prof.add_trace(go.Scatter(name='tracemalloc Peak (MiB)', mode='lines+markers',
+                                              line=dict(color='#2ECC71', dash='dot')), secondary_y=True)
+                fig_prof.update_layout(title='Recent Reruns', title_font=dict(color='#00B4D8', family='Orbitron'),
+                                       height=320)
+            x = np.arange(len(runs))
+            fig_prof.data[0].update(x=x, y=wall, hovertext=[r.label for r in runs])
+            fig_prof.data[1].update(x=x, y=rss)
+            fig_prof.data[2].update(x=x, y=np.where(peak > 0, peak, np.nan))
+            show_chart(fig_prof)
+            st.caption("Memory is per process, not per rerun: RSS is the server's resident memory when each "
+                       "rerun ended, and a tracemalloc peak counts allocations from every session running at "
+                       "the same time.")
+
+            profiled = [r for r in runs if r.profile_text]
+            if profiled:
+                with st.expander(f"cProfile — latest ({profiled[-1].label}, {profiled[-1].wall_ms:,.0f} ms)"):
+                    st.code(profiled[-1].profile_text, language=None)
+
+            ex1, ex2 = st.columns(2)
+            ex1.download_button("⬇  Export JSON", profiler.to_json(label), file_name="reruns.json",
+                                mime="application/json", use_container_width=True)
+            ex2.download_button("⬇  Export Chrome Trace", profiler.to_chrome_trace(label), file_name="reruns.trace.json",
+                                mime="application/json", use_container_width=True)
+
+    get_profiler().finish()
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""Per-step cost of the atmosphere models in the single-run and batch engines.
+
+Run from the repository root:  python -m benchmarks.atmosphere
+"""
+import time
+
+import numpy as np
+
+from rocket_core.atmosphere import EXPONENTIAL, StandardAtmosphere, ussa76
+from rocket_core.physics import run_simulation, run_simulation_batch
+
+
+CONFIG = (50000, 800, 0.30, 5000, 30000)
+SINGLE_STEPS = 50_000
+BATCH_SIZE, BATCH_STEPS = 10_000, 200
+
+
+def best_of(fn, repeats=5):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    standard = StandardAtmosphere()
+    models = [('inline exponential', None), ('exponential model', EXPONENTIAL), ('USSA76 tables', standard)]
+
+    print(f"{'model':<22}{'single ns/step':>16}{'batch ns/rocket-step':>23}{'apogee (m)':>14}")
+    for label, env in models:
+        single = best_of(lambda: run_simulation(*CONFIG, SINGLE_STEPS, environment=env), repeats=3)
+        batch = best_of(lambda: run_simulation_batch(np.full(BATCH_SIZE, CONFIG[0]), *CONFIG[1:], BATCH_STEPS,
+                                                     environment=env), repeats=3)
+        apogee = run_simulation(*CONFIG, 200, environment=env)['max_alt']
+        print(f"{label:<22}{single / (SINGLE_STEPS + 1) * 1e9:>16.0f}"
+              f"{batch / (BATCH_SIZE * (BATCH_STEPS + 1)) * 1e9:>23.2f}{apogee:>14.1f}")
+
+    # What the tables save: evaluating the USSA76 layer formulas directly.
+    altitudes = np.random.default_rng(0).uniform(0, 86000, 20_000)
+    direct = best_of(lambda: [ussa76(h) for h in altitudes.tolist()], repeats=3)
+    scalar = best_of(lambda: [standard.state(h) for h in altitudes.tolist()], repeats=3)
+    vector = best_of(lambda: standard.state(altitudes))
+    print(f"\nUSSA76 density lookup, per altitude: direct formulas {direct / len(altitudes) * 1e9:.0f} ns, "
+          f"table {scalar / len(altitudes) * 1e9:.0f} ns, vectorized table {vector / len(altitudes) * 1e9:.1f} ns")
+
+    exact = np.array([ussa76(h)[2] for h in altitudes])
+    err = np.max(np.abs(standard.state(altitudes)[0] / exact - 1))
+    print(f"max relative table error below 86 km: {err:.1e}")
+
+
+if __name__ == '__main__':
+    main()
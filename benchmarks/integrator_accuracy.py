@@ -0,0 +1,48 @@
+"""Function evaluations vs apogee error for the fixed-step and adaptive integrators.
+
+Run from the repository root:  python -m benchmarks.integrator_accuracy
+"""
+import time
+
+from rocket_core.integrators import run_simulation_ode, run_vehicle
+from rocket_core.vehicle import Stage, Vehicle
+
+
+CONFIG = (50000, 800, 0.30, 5000, 30000, 200)
+
+# The same liftoff mass and first-stage thrust, flown as one stage and as three.
+SINGLE_STAGE = Vehicle('single', [Stage('core', 50000, 30000, 800, 300)], payload=5000)
+THREE_STAGE = Vehicle('three', [Stage('first', 30000, 20000, 800, 300), Stage('second', 10000, 7000, 300, 320),
+                                Stage('third', 3000, 3000, 100, 330)], payload=5000, coast=2.0)
+
+
+def main():
+    ref = run_simulation_ode(*CONFIG, method='rk45', rtol=1e-12, atol=1e-9)
+    ref_alt, ref_apo = ref['max_alt'], ref['events']['apogee']
+    print(f"reference apogee {ref_alt:.6f} m at t = {ref_apo:.6f} s ({ref['nfev']} evals)\n")
+    print(f"{'method':<7}{'setting':>14}{'evals':>9}{'alt rel err':>14}{'t_apo err (s)':>15}{'ms':>9}")
+
+    runs = [('euler', dict(dt=dt), f"dt={dt}") for dt in (2.0, 1.0, 0.5, 0.25, 0.1, 0.05, 0.02)]
+    runs += [('rk4', dict(dt=dt), f"dt={dt}") for dt in (4.0, 2.0, 1.0, 0.5, 0.25, 0.1)]
+    runs += [('rk45', dict(rtol=rtol, atol=rtol * 1e3), f"rtol={rtol:g}") for rtol in (1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9)]
+
+    for method, kwargs, label in runs:
+        start = time.perf_counter()
+        res = run_simulation_ode(*CONFIG, method=method, **kwargs)
+        elapsed = (time.perf_counter() - start) * 1000
+        alt_err = abs(res['max_alt'] - ref_alt) / ref_alt
+        apo_err = abs(res['events']['apogee'] - ref_apo)
+        print(f"{method:<7}{label:>14}{res['nfev']:>9}{alt_err:>14.2e}{apo_err:>15.2e}{elapsed:>9.1f}")
+
+    # Staging adds segment boundaries, not smaller steps: evals should track the flight time.
+    print(f"\n{'vehicle':<9}{'method':<7}{'flown (s)':>11}{'evals':>9}{'ms':>9}")
+    for vehicle in (SINGLE_STAGE, THREE_STAGE):
+        for method in ('euler', 'rk4', 'rk45'):
+            start = time.perf_counter()
+            res = run_vehicle(vehicle, 400, method=method)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"{vehicle.name:<9}{method:<7}{res['trajectory'].times[-1]:>11.1f}{res['nfev']:>9}{elapsed:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Parity and speed of the compiled Euler kernel against the interpreted loop.
+
+Run from the repository root:  python -m benchmarks.kernel_parity
+
+Exits with status 1 if any run disagrees. The kernel must match its own
+plain-Python fallback exactly; against the interpreted loop it may differ only
+by rounding, because that loop evaluates exp() through NumPy rather than math.
+Runs through an atmosphere model must match _euler_steps_env exactly.
+"""
+import sys
+import time
+
+import numpy as np
+
+from rocket_core import kernels
+from rocket_core.atmosphere import ATMOSPHERES
+from rocket_core.physics import run_simulation
+
+
+RANGES = {'init_mass': (5000, 200000), 'thrust_kn': (100, 5000), 'drag_cd': (0.05, 1.0),
+          'payload': (100, 50000), 'fuel_mass': (1000, 150000)}
+RTOL = 1e-9
+LONG_RUN = 1_000_000
+
+
+def fallback(*args):
+    """The kernel as plain Python, whether or not Numba compiled it."""
+    return getattr(kernels.euler_ascent, 'py_func', kernels.euler_ascent)(*args)
+
+
+def compare(params, steps, stride=1, keep_last=None, environment=None):
+    fast = run_simulation(*params, steps, stride=stride, keep_last=keep_last, environment=environment)
+    ref = run_simulation(*params, steps, stride=stride, keep_last=keep_last, environment=environment,
+                         compiled=False)
+    ok = fast['burnout_time'] == ref['burnout_time'] and fast['trajectory'].data.shape == ref['trajectory'].data.shape
+    scale = np.maximum(np.abs(ref['trajectory'].data), 1.0)
+    err = np.max(np.abs(fast['trajectory'].data - ref['trajectory'].data) / scale) if ok else np.inf
+    err = max(err, abs(fast['max_alt'] - ref['max_alt']) / max(ref['max_alt'], 1.0))
+    return ok and err <= RTOL, err
+
+
+def main():
+    print(f"Numba {'available' if kernels.COMPILED else 'not installed; kernel runs as plain Python'}")
+    start = time.perf_counter()
+    kernels.warmup()
+    print(f"warmup {time.perf_counter() - start:.2f}s\n")
+
+    rng = np.random.default_rng(7)
+    samples = np.column_stack([rng.uniform(low, high, 200) for low, high in RANGES.values()])
+    failures, worst = 0, 0.0
+    for i, params in enumerate(samples.tolist()):
+        steps = (50, 200, 500, 5000)[i % 4]
+        stride, keep_last = ((1, None), (7, None), (1, 64), (3, 10))[i % 4]
+        ok, err = compare(params, steps, stride, keep_last)
+        worst = max(worst, err)
+        failures += not ok
+    print(f"interpreted loop: {len(samples)} configurations, max relative difference {worst:.1e}, "
+          f"{failures} failures")
+
+    for name, factory in ATMOSPHERES.items():
+        env = factory()
+        worst = max(compare(params, (50, 500)[i % 2], environment=env)[1] for i, params in enumerate(samples[:50].tolist()))
+        failures += worst > 0
+        print(f"{name}: {'identical' if worst == 0 else f'max relative difference {worst:.1e}'}")
+
+    args = (800e3, 0.3, 10.0, 1.225, 8500.0, 9.81, 1.0, 85000.0, 30000.0, 30000 / 140, 200, 1)
+    a, b = np.empty((2, 201)), np.empty((2, 201))
+    exact = kernels.euler_ascent(*args, a) == fallback(*args, b) and np.array_equal(a, b)
+    failures += not exact
+    print(f"plain-Python fallback: {'identical' if exact else 'DIFFERS'}\n")
+
+    params = (50000, 800, 0.30, 5000, 30000)
+    env = ATMOSPHERES['US Standard 1976']()
+    for label, kwargs in (('kernel', {}), ('interpreted', {'compiled': False}),
+                          ('USSA76 kernel', {'environment': env}),
+                          ('USSA76 interp.', {'environment': env, 'compiled': False})):
+        start = time.perf_counter()
+        run_simulation(*params, LONG_RUN, stride=100, **kwargs)
+        print(f"{LONG_RUN:,} steps, {label:<16}{(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
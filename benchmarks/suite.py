@@ -0,0 +1,216 @@
+"""Timing, throughput and peak memory for the simulator and mission analytics paths.
+
+Run from the repository root:
+
+    python -m benchmarks.suite                    # quick profile, compare to baseline
+    python -m benchmarks.suite --profile full     # steps to 1M, rows to 10M, sweeps to 1M
+    python -m benchmarks.suite --save             # record the results as the new baseline
+    python -m benchmarks.suite --require-baseline # CI: a missing baseline is an error
+
+Exits with status 1 when any case is slower (or uses more memory) than the
+baseline by more than the tolerance. Timings only compare on the machine that
+recorded them, so no baseline is committed; without one the suite just
+reports, unless --require-baseline is given, which exits with status 2 when
+the file or any case in it is missing. Nothing here imports Streamlit.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from rocket_core import kernels
+from rocket_core.aggregations import MissionAggregates
+from rocket_core.correlation import GroupedCorrelation
+from rocket_core.mission_filters import MissionFilterIndex
+from rocket_core.missions import generate_missions
+from rocket_core.physics import run_simulation
+from rocket_core.sweep import iter_sweep, latin_hypercube_samples
+
+
+BASELINE = Path(__file__).with_name('baseline.json')
+
+PROFILES = {
+    'quick': {'steps': [50, 500, 5_000, 50_000], 'rows': [48, 10_000, 1_000_000],
+              'sweep': [1_000, 10_000, 100_000]},
+    'full': {'steps': [50, 500, 5_000, 50_000, 1_000_000], 'rows': [48, 10_000, 1_000_000, 10_000_000],
+             'sweep': [1_000, 10_000, 100_000, 1_000_000]},
+}
+
+VEHICLE = (50000, 800, 0.30, 5000, 30000)
+SWEEP_RANGES = {'thrust_kn': (400, 2000), 'payload': (1000, 20000), 'fuel_mass': (10000, 80000), 'drag_cd': (0.2, 0.6)}
+AGGREGATE_COLUMNS = ['payload_kg', 'fuel_tons', 'cost_million', 'crew_size']
+CORRELATION_COLUMNS = ['payload_kg', 'fuel_tons', 'cost_million', 'distance_km', 'duration_days', 'crew_size']
+FILTERS = [dict(), dict(mission_type='Mars'), dict(vehicle='Falcon 9', max_cost=200),
+           dict(mission_type='Lunar', vehicle='SLS', max_cost=300, max_distance=400000)]
+
+
+# ─── CASES ───
+# Each case takes a size and returns (setup, run): setup() builds the inputs
+# outside the timed region, run(inputs) is what gets timed.
+def case_simulate(steps):
+    return lambda: None, lambda _: run_simulation(*VEHICLE, steps)
+
+
+def case_sweep(n):
+    def run(samples):
+        for _ in iter_sweep(samples, VEHICLE[0], 200):
+            pass
+    return lambda: latin_hypercube_samples(SWEEP_RANGES, n), run
+
+
+def case_generate(rows):
+    return lambda: None, lambda _: generate_missions(rows)
+
+
+def case_filter_index(rows):
+    return lambda: generate_missions(rows), MissionFilterIndex
+
+
+def case_filter(rows):
+    # The index is built once in setup; cache_size=0 so every run answers the
+    # queries instead of returning the previous run's cached positions.
+    def run(index):
+        for f in FILTERS:
+            index.filter(**f)
+            index.order_by('distance_km', **f)
+    return lambda: MissionFilterIndex(generate_missions(rows), cache_size=0), run
+
+
+def case_aggregate(rows):
+    def run(df):
+        MissionAggregates.from_frame(df, AGGREGATE_COLUMNS)
+        groups = GroupedCorrelation.from_frame(df, CORRELATION_COLUMNS)
+        groups.combine('Mars').corr()
+    return lambda: generate_missions(rows), run
+
+
+CASES = {
+    # name: (case, profile axis, unit of throughput)
+    'simulate': (case_simulate, 'steps', 'steps'),
+    'sweep': (case_sweep, 'sweep', 'trajectories'),
+    'generate_missions': (case_generate, 'rows', 'rows'),
+    'filter_index': (case_filter_index, 'rows', 'rows'),
+    'filter': (case_filter, 'rows', 'rows'),
+    'aggregate': (case_aggregate, 'rows', 'rows'),
+}
+
+
+# ─── MEASUREMENT ───
+def measure(case, size, min_time=0.5, max_repeats=25):
+    """Best-of-N wall time, then a separate traced run for peak memory.
+
+    The first call is a warm-up unless it alone takes longer than min_time.
+    """
+    setup, run = case(size)
+    inputs = setup()
+    start = time.perf_counter()
+    run(inputs)
+    first = time.perf_counter() - start
+    times = [first] if first >= min_time else []
+    while len(times) < max_repeats and sum(times) < min_time:
+        start = time.perf_counter()
+        run(inputs)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run(inputs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    seconds = min(times)
+    return {'size': size, 'seconds': seconds, 'throughput': size / seconds,
+            'peak_mb': peak / 2**20, 'repeats': len(times)}
+
+
+def environment():
+    return {'python': platform.python_version(), 'numpy': np.__version__, 'pandas': pd.__version__,
+            'machine': platform.machine(), 'system': platform.system(), 'cpus': os.cpu_count()}
+
+
+def run_suite(profile, only=None):
+    # Numba compiles on first use; load the kernels now so no case times it.
+    kernels.warmup()
+    results = {}
+    for name, (case, axis, unit) in CASES.items():
+        if only and name not in only:
+            continue
+        for size in PROFILES[profile][axis]:
+            r = measure(case, size)
+            key = f"{name}[{size}]"
+            results[key] = r
+            print(f"{key:<28}{r['seconds'] * 1000:>11.2f} ms{r['throughput']:>15,.0f} {unit}/s"
+                  f"{r['peak_mb']:>10.1f} MiB", flush=True)
+    return results
+
+
+# ─── BASELINE ───
+def compare(results, baseline, tolerance, memory_tolerance):
+    """Cases whose time or peak memory exceed the baseline by more than the tolerance."""
+    regressions = []
+    for key, r in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for field, tol in (('seconds', tolerance), ('peak_mb', memory_tolerance)):
+            # Timings under a few milliseconds and sub-MiB peaks are mostly noise.
+            floor = 2e-3 if field == 'seconds' else 1.0
+            if r[field] > max(base[field], floor) * (1 + tol):
+                regressions.append((key, field, base[field], r[field]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='quick')
+    parser.add_argument('--only', nargs='+', choices=sorted(CASES), help="run only these cases")
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--save', action='store_true', help="write the results into the baseline file")
+    parser.add_argument('--require-baseline', action='store_true',
+                        help="exit with status 2 if the baseline file, or a case in it, is missing")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    parser.add_argument('--memory-tolerance', type=float, default=0.25, help="allowed peak memory growth")
+    parser.add_argument('--output', type=Path, help="also write this run's results to a JSON file")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.profile, args.only)
+    report = {'environment': environment(), 'results': results}
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+    saved = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    if args.save:
+        merged = dict(saved['results']) if saved else {}
+        merged.update(results)
+        args.baseline.write_text(json.dumps({'environment': environment(), 'results': merged}, indent=2) + '\n')
+        print(f"\nbaseline saved to {args.baseline}")
+        return 0
+    if saved is None:
+        print(f"\nno baseline at {args.baseline}; run with --save to create one")
+        return 2 if args.require_baseline else 0
+    missing = [key for key in results if key not in saved['results']]
+    if missing and args.require_baseline:
+        print(f"\nno baseline for {', '.join(missing)} in {args.baseline}; run with --save to record them")
+        return 2
+
+    if saved['environment'] != report['environment']:
+        print(f"\nnote: baseline was recorded on {saved['environment']}")
+    regressions = compare(results, saved['results'], args.tolerance, args.memory_tolerance)
+    if not regressions:
+        print(f"\nno regressions against {args.baseline}")
+        return 0
+    print(f"\n{len(regressions)} REGRESSION(S) against {args.baseline}:")
+    for key, field, base, now in regressions:
+        print(f"  {key:<28}{field:<9}{base:>12.4g} -> {now:<12.4g}({now / base - 1:+.0%})")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
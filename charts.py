@@ -0,0 +1,61 @@
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+from rocket_core.profiling import span
+
+
+# ─── PLOTLY DARK THEME ───
+PLOTLY_LAYOUT = dict(
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+    font=dict(family="Exo 2, sans-serif", color="#C0C7D1", size=11),
+    margin=dict(l=40, r=20, t=30, b=40),
+    xaxis=dict(gridcolor='rgba(0,180,216,0.08)', linecolor='rgba(0,180,216,0.2)'),
+    yaxis=dict(gridcolor='rgba(0,180,216,0.08)', linecolor='rgba(0,180,216,0.2)'),
+    legend=dict(bgcolor='rgba(0,0,0,0)', bordercolor='rgba(0,180,216,0.2)', borderwidth=1)
+)
+
+TEMPLATE_NAME = 'mission_control'
+WEBGL_THRESHOLD = 1000
+
+
+def register_template():
+    """Register PLOTLY_LAYOUT as a template and make it the default, once per process."""
+    if TEMPLATE_NAME not in pio.templates:
+        pio.templates[TEMPLATE_NAME] = go.layout.Template(layout=PLOTLY_LAYOUT)
+    pio.templates.default = 'plotly+' + TEMPLATE_NAME
+
+
+register_template()
+
+
+# ─── FIGURE FACTORY ───
+def scatter_trace(n_points, **kwargs):
+    """Scatter trace that switches to WebGL rendering above WEBGL_THRESHOLD points."""
+    cls = go.Scattergl if n_points > WEBGL_THRESHOLD else go.Scatter
+    return cls(**kwargs)
+
+
+def cached_figure(cache, key, build):
+    """Figure skeleton from cache, built on first use.
+
+    Callers swap only the trace data (and any dynamic title) on later reruns,
+    so layout and template validation happen once. The cache should be
+    per-session (e.g. st.session_state) since figures are mutated in place.
+    """
+    fig = cache.get(key)
+    if fig is None:
+        with span('figure.build'):
+            fig = cache[key] = build()
+    return fig
+
+
+def show_chart(fig, slot=st, key=None):
+    """Render fig in slot with the mission_control template.
+
+    theme=None matters: Streamlit's default theme replaces the template's
+    layout (backgrounds, fonts, grid, margins) in the browser.
+    """
+    with span('chart'):
+        slot.plotly_chart(fig, use_container_width=True, key=key, theme=None)
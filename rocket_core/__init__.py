@@ -0,0 +1,63 @@
+"""Headless core of the mission dashboard: physics, mission data and analytics.
+
+Nothing in this package imports Streamlit or Plotly. Submodules are loaded on
+first use, so `import rocket_core` is cheap and `from rocket_core import
+run_simulation` costs only NumPy; pandas and pyarrow come in with the data
+modules that need them.
+"""
+import importlib
+
+
+_EXPORTS = {
+    'run_simulation': 'physics',
+    'run_simulation_batch': 'physics',
+    'iter_simulation': 'physics',
+    'run_simulation_ode': 'integrators',
+    'run_vehicle': 'integrators',
+    'Stage': 'vehicle',
+    'Vehicle': 'vehicle',
+    'Trajectory': 'trajectory',
+    'TrajectoryRecorder': 'trajectory',
+    'StandardAtmosphere': 'atmosphere',
+    'SimulationCache': 'sim_cache',
+    'simulation_key': 'sim_cache',
+    'SimulationExecutor': 'executor',
+    'grid_samples': 'sweep',
+    'latin_hypercube_samples': 'sweep',
+    'iter_sweep': 'sweep',
+    'heatmap_table': 'sweep',
+    'pareto_front': 'sweep',
+    'SweepSummary': 'sweep',
+    'dispersion_samples': 'dispersion',
+    'solve_apogee': 'solver',
+    'generate_missions': 'missions',
+    'iter_mission_chunks': 'missions',
+    'MissionStore': 'mission_store',
+    'write_missions': 'mission_store',
+    'iter_ingest': 'ingest',
+    'MissionLog': 'ingest',
+    'MissionFilterIndex': 'mission_filters',
+    'MissionAggregates': 'aggregations',
+    'CorrelationAccumulator': 'correlation',
+    'GroupedCorrelation': 'correlation',
+    'LaunchRollups': 'rollups',
+    'lttb': 'downsample',
+    'scatter_decimate': 'downsample',
+    'Profiler': 'profiling',
+    'span': 'profiling',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'rocket_core' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+from .missions import TYPES
+
+
+class MissionAggregates:
+    """Per-type, per-outcome sums and counts for a set of numeric columns.
+
+    Everything the per-type charts and the summary metrics need (means by type,
+    by outcome, or overall) is derived from one (type, outcome) bincount pass.
+    update() folds in appended rows without revisiting earlier ones, and two
+    aggregates over disjoint rows can be merged.
+    """
+
+    def __init__(self, columns, types=TYPES):
+        self.columns = list(columns)
+        self.types = list(types)
+        self._col = {c: i for i, c in enumerate(self.columns)}
+        # Axis 0: type, axis 1: outcome (0 = failure, 1 = success), axis 2: column.
+        self.sums = np.zeros((len(self.types), 2, len(self.columns)))
+        self.counts = np.zeros((len(self.types), 2), dtype=np.int64)
+
+    @classmethod
+    def from_frame(cls, df, columns, types=TYPES):
+        return cls(columns, types).update(df)
+
+    def update(self, df):
+        type_codes = pd.Categorical(df['mission_type'], categories=self.types).codes.astype(np.int64)
+        keep = type_codes >= 0
+        group = type_codes[keep] * 2 + df['success'].to_numpy(dtype=bool)[keep]
+        size = len(self.types) * 2
+        self.counts += np.bincount(group, minlength=size).reshape(-1, 2)
+        for c in self.columns:
+            weights = df[c].to_numpy(dtype=float)[keep]
+            self.sums[:, :, self._col[c]] += np.bincount(group, weights=weights, minlength=size).reshape(-1, 2)
+        return self
+
+    def merge(self, other):
+        self.sums += other.sums
+        self.counts += other.counts
+        return self
+
+    def _select(self, success):
+        if success is None:
+            return slice(None)
+        return int(bool(success))
+
+    def count(self, success=None):
+        """Row count per type."""
+        c = self.counts[:, self._select(success)]
+        return c if success is not None else c.sum(axis=1)
+
+    def mean(self, column, success=None):
+        """Mean of column per type (NaN where a type has no rows)."""
+        s = self.sums[:, self._select(success), self._col[column]]
+        if success is None:
+            s = s.sum(axis=1)
+        n = self.count(success)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return s / n
+
+    def overall_mean(self, column, success=None):
+        n = self.count(success).sum()
+        s = self.sums[:, self._select(success), self._col[column]].sum()
+        return s / n if n else np.nan
+
+    def total(self):
+        return int(self.counts.sum())
+
+    def success_rate(self):
+        n = self.total()
+        return self.counts[:, 1].sum() / n if n else np.nan
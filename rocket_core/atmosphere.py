@@ -0,0 +1,164 @@
+"""Atmosphere, gravity and Mach-drag models for the ascent engines.
+
+Every model exposes state(altitude) -> (density, gravity, speed_of_sound) and
+drag_factor(mach) -> multiplier on the subsonic drag coefficient. Both accept
+a Python float (single runs) or a NumPy array (batch runs). The standard
+atmosphere is tabulated once on a uniform altitude grid, so a lookup is an
+index computation and a linear blend rather than a search or a power law.
+"""
+import math
+
+import numpy as np
+
+from .physics import G, SEA_LEVEL_DENSITY, SCALE_HEIGHT
+
+
+# ─── CONSTANTS ───
+G0 = 9.80665              # standard gravity (m/s²)
+EARTH_RADIUS = 6371000.0  # mean radius for inverse-square gravity (m)
+R_AIR = 287.0528          # specific gas constant of dry air (J/kg·K)
+GAMMA = 1.4
+R0_GEOPOTENTIAL = 6356766.0
+
+# US Standard Atmosphere 1976 base layers: geopotential base height (m), lapse rate (K/m).
+USSA76_LAYERS = [(0.0, -0.0065), (11000.0, 0.0), (20000.0, 0.001), (32000.0, 0.0028),
+                 (47000.0, 0.0), (51000.0, -0.0028), (71000.0, -0.002), (84852.0, 0.0)]
+
+# Drag multiplier vs Mach for a slender launch vehicle: flat subsonic, a transonic
+# peak just past Mach 1, then a slow supersonic decline.
+MACH_DRAG_CURVE = ([0.0, 0.6, 0.8, 0.9, 1.0, 1.1, 1.2, 1.5, 2.0, 3.0, 5.0, 10.0],
+                   [1.0, 1.0, 1.05, 1.2, 1.5, 1.65, 1.6, 1.45, 1.25, 1.05, 0.9, 0.85])
+
+
+# ─── TABLES ───
+class UniformTable:
+    """Linear interpolation on a uniform grid; values are clamped outside it."""
+
+    def __init__(self, x0, dx, values):
+        self.x0 = float(x0)
+        self.dx = float(dx)
+        self.inv_dx = 1.0 / self.dx
+        self.values = np.ascontiguousarray(values, dtype=float)
+        # Slopes per cell, so an evaluation is one gather, one multiply, one add.
+        self.slopes = np.append(np.diff(self.values), 0.0)
+        self._values = self.values.tolist()
+        self._slopes = self.slopes.tolist()
+        self._last = len(self.values) - 1
+
+    def index(self, x):
+        """Cell index and fractional offset for x, shared by tables on the same grid."""
+        pos = (x - self.x0) * self.inv_dx
+        if isinstance(pos, float):
+            pos = min(max(pos, 0.0), self._last)
+            i = int(pos)
+            return i, pos - i
+        np.maximum(pos, 0.0, out=pos)
+        np.minimum(pos, self._last, out=pos)
+        i = pos.astype(np.intp)
+        pos -= i
+        return i, pos
+
+    def at(self, i, frac):
+        if isinstance(frac, float):
+            return self._values[i] + frac * self._slopes[i]
+        out = self.slopes[i]
+        out *= frac
+        out += self.values[i]
+        return out
+
+    def __call__(self, x):
+        return self.at(*self.index(x))
+
+
+def ussa76(altitude):
+    """Temperature (K), pressure (Pa) and density (kg/m³) at geometric altitude (m), up to 86 km."""
+    h = R0_GEOPOTENTIAL * altitude / (R0_GEOPOTENTIAL + altitude)
+    temperature, pressure = 288.15, 101325.0
+    for (base, lapse), (top, _) in zip(USSA76_LAYERS, USSA76_LAYERS[1:] + [(math.inf, 0.0)]):
+        dh = min(h, top) - base
+        if lapse == 0.0:
+            pressure *= math.exp(-G0 * dh / (R_AIR * temperature))
+        else:
+            t_next = temperature + lapse * dh
+            pressure *= (t_next / temperature) ** (-G0 / (R_AIR * lapse))
+            temperature = t_next
+        if h <= top:
+            break
+    return temperature, pressure, pressure / (R_AIR * temperature)
+
+
+# ─── MODELS ───
+class ExponentialAtmosphere:
+    """The original model: ρ = 1.225·exp(−h/8500), constant g, no Mach effect."""
+
+    name = 'exponential'
+    SPEED_OF_SOUND = 340.29
+
+    def state(self, altitude):
+        if isinstance(altitude, float):
+            return SEA_LEVEL_DENSITY * math.exp(-altitude / SCALE_HEIGHT), G, self.SPEED_OF_SOUND
+        return SEA_LEVEL_DENSITY * np.exp(-altitude / SCALE_HEIGHT), G, self.SPEED_OF_SOUND
+
+    def drag_factor(self, mach):
+        return 1.0
+
+
+class StandardAtmosphere:
+    """US Standard Atmosphere 1976 density and speed of sound, inverse-square gravity, Mach drag.
+
+    Density and speed of sound are tabulated every `step` metres to `ceiling`.
+    Above 86 km, where USSA76 switches to a different formulation, density
+    decays with the 86 km scale height and temperature is held.
+    """
+
+    name = 'ussa76'
+
+    def __init__(self, step=50.0, ceiling=1_000_000.0, mach_step=0.01):
+        altitudes = np.arange(0.0, ceiling + step, step)
+        top = 86000.0
+        t_top, _, rho_top = ussa76(top)
+        rows = [ussa76(h) if h <= top else
+                (t_top, None, rho_top * math.exp(-(h - top) * G0 / (R_AIR * t_top)))
+                for h in altitudes]
+        temperature = np.array([r[0] for r in rows])
+        self.density = UniformTable(0.0, step, [r[2] for r in rows])
+        self.sound = UniformTable(0.0, step, np.sqrt(GAMMA * R_AIR * temperature))
+        mach = np.arange(0.0, MACH_DRAG_CURVE[0][-1] + mach_step, mach_step)
+        self.mach_drag = UniformTable(0.0, mach_step, np.interp(mach, *MACH_DRAG_CURVE))
+
+    def state(self, altitude):
+        if isinstance(altitude, float):
+            # Single runs call this every step: inline the lookups on plain lists.
+            d, s = self.density, self.sound
+            pos = min(max(altitude * d.inv_dx, 0.0), d._last)
+            i = int(pos)
+            frac = pos - i
+            r = EARTH_RADIUS / (EARTH_RADIUS + altitude)
+            return (d._values[i] + frac * d._slopes[i], G0 * r * r,
+                    s._values[i] + frac * s._slopes[i])
+        i, frac = self.density.index(altitude)
+        r = EARTH_RADIUS / (EARTH_RADIUS + altitude)
+        return self.density.at(i, frac), G0 * r * r, self.sound.at(i, frac)
+
+    def drag_factor(self, mach):
+        if isinstance(mach, float):
+            m = self.mach_drag
+            pos = min(mach * m.inv_dx, m._last)
+            i = int(pos)
+            return m._values[i] + (pos - i) * m._slopes[i]
+        return self.mach_drag(mach)
+
+    def kernel_tables(self):
+        """The tables and constants kernels.euler_steps_table takes in place of state() and drag_factor()."""
+        d, s, m = self.density, self.sound, self.mach_drag
+        return (d.values, d.slopes, s.values, s.slopes, d.inv_dx, float(d._last),
+                m.values, m.slopes, m.inv_dx, float(m._last), G0, EARTH_RADIUS)
+
+
+EXPONENTIAL = ExponentialAtmosphere()
+
+# Display name -> factory; the standard atmosphere's tables are built on first use.
+ATMOSPHERES = {
+    'Exponential (legacy)': lambda: EXPONENTIAL,
+    'US Standard 1976': StandardAtmosphere,
+}
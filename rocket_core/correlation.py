@@ -0,0 +1,101 @@
+import numpy as np
+
+
+class CorrelationAccumulator:
+    """Running count, means and co-moment matrix over k columns.
+
+    Batches are folded in with the pairwise (Chan et al.) form of Welford's
+    update, so the cost per batch beyond reading it is O(k^2), and
+    accumulators over disjoint rows merge exactly.
+    """
+
+    def __init__(self, k):
+        self.n = 0
+        self.mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))
+
+    @classmethod
+    def from_array(cls, X):
+        return cls(X.shape[1]).update(X)
+
+    @classmethod
+    def from_frame(cls, df, columns):
+        return cls.from_array(df[columns].to_numpy(dtype=float))
+
+    def update(self, X):
+        X = np.asarray(X, dtype=float)
+        if len(X) == 0:
+            return self
+        batch = CorrelationAccumulator(X.shape[1])
+        batch.n = len(X)
+        batch.mean = X.mean(axis=0)
+        centered = X - batch.mean
+        batch.comoment = centered.T @ centered
+        return self.merge(batch)
+
+    def merge(self, other):
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.comoment = self.comoment + other.comoment + np.outer(delta, delta) * (self.n * other.n / n)
+        self.mean = self.mean + delta * (other.n / n)
+        self.n = n
+        return self
+
+    def copy(self):
+        acc = CorrelationAccumulator(len(self.mean))
+        acc.n, acc.mean, acc.comoment = self.n, self.mean.copy(), self.comoment.copy()
+        return acc
+
+    def corr(self):
+        std = np.sqrt(np.diag(self.comoment))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.comoment / np.outer(std, std)
+
+
+class GroupedCorrelation:
+    """One accumulator per (mission_type, vehicle) pair.
+
+    Correlations for any type/vehicle filter are merged from the group
+    accumulators without touching the rows again; append() updates only the
+    groups the new rows fall into.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.groups = {}
+
+    @classmethod
+    def from_frame(cls, df, columns):
+        return cls(columns).append(df)
+
+    def append(self, df):
+        X = df[self.columns].to_numpy(dtype=float)
+        codes, pairs = _pair_codes(df)
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(pairs) + 1))
+        for i, pair in enumerate(pairs):
+            if bounds[i + 1] > bounds[i]:
+                rows = X[order[bounds[i]:bounds[i + 1]]]
+                self.groups.setdefault(pair, CorrelationAccumulator(len(self.columns))).update(rows)
+        return self
+
+    def copy(self):
+        grouped = GroupedCorrelation(self.columns)
+        grouped.groups = {pair: acc.copy() for pair, acc in self.groups.items()}
+        return grouped
+
+    def combine(self, mission_type=None, vehicle=None):
+        acc = CorrelationAccumulator(len(self.columns))
+        for (t, v), group in self.groups.items():
+            if (mission_type is None or t == mission_type) and (vehicle is None or v == vehicle):
+                acc.merge(group)
+        return acc
+
+
+def _pair_codes(df):
+    type_codes, types = df['mission_type'].factorize()
+    vehicle_codes, vehicles = df['vehicle'].factorize()
+    codes = np.where((type_codes < 0) | (vehicle_codes < 0), -1, type_codes * len(vehicles) + vehicle_codes)
+    return codes, [(t, v) for t in types for v in vehicles]
@@ -0,0 +1,79 @@
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from .sweep import SWEEP_PARAMS
+
+
+DISTRIBUTIONS = ['Normal', 'Uniform', 'Triangular']
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+OUTPUTS = {'max_alt': 'Apogee (m)', 'burnout_time': 'Burnout (s)', 'max_vel': 'Max Velocity (m/s)'}
+
+# Perturbed values are clipped here so a wide spread can't produce negative
+# thrust, fuel or payload.
+FLOORS = {'thrust_kn': 1.0, 'payload': 0.0, 'fuel_mass': 1.0, 'drag_cd': 0.01}
+
+
+# ─── SAMPLING ───
+def dispersion_samples(nominal, spreads, n, distribution='Normal', seed=42):
+    """n perturbed copies of the nominal vehicle, one column per SWEEP_PARAMS entry.
+
+    spreads are relative: 1σ for Normal, the half-width for Uniform and
+    Triangular (which peaks at the nominal value). Parameters with no spread
+    stay at their nominal value.
+    """
+    rng = np.random.default_rng(seed)
+    cols = {}
+    for k in SWEEP_PARAMS:
+        width = nominal[k] * spreads.get(k, 0.0)
+        if distribution == 'Normal':
+            u = rng.standard_normal(n)
+        elif distribution == 'Uniform':
+            u = rng.uniform(-1.0, 1.0, n)
+        elif distribution == 'Triangular':
+            u = rng.triangular(-1.0, 0.0, 1.0, n)
+        else:
+            raise ValueError(f"unknown distribution: {distribution}")
+        cols[k] = np.maximum(nominal[k] + width * u, FLOORS[k])
+    return pd.DataFrame(cols)
+
+
+# ─── STATISTICS ───
+def wilson_interval(successes, n, confidence=0.95):
+    """Wilson score interval for a binomial proportion; stays inside [0, 1] even at 0 or n successes."""
+    if n == 0:
+        return np.nan, np.nan
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / n
+    denom = 1 + z ** 2 / n
+    centre = (p + z ** 2 / (2 * n)) / denom
+    half = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denom
+    return max(0.0, float(centre - half)), min(1.0, float(centre + half))
+
+
+def percentile_table(values, percentiles=PERCENTILES, confidence=0.95):
+    """Percentiles with distribution-free confidence bounds from order statistics.
+
+    The rank of the q-th sample quantile is Binomial(n, q), so the bounds are
+    the sorted values at n·q ± z·sqrt(n·q·(1−q)).
+    """
+    x = np.sort(np.asarray(values, dtype=float))
+    n = len(x)
+    q = np.asarray(percentiles) / 100
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    half = z * np.sqrt(n * q * (1 - q))
+    lo = np.clip(np.floor(n * q - half).astype(int), 0, n - 1)
+    hi = np.clip(np.ceil(n * q + half).astype(int), 0, n - 1)
+    return pd.DataFrame({'percentile': percentiles, 'value': np.percentile(x, percentiles),
+                         'ci_low': x[lo], 'ci_high': x[hi]})
+
+
+def summarize(results, target_alt, confidence=0.95):
+    """P(apogee ≥ target_alt) with its Wilson interval, plus a percentile table per output."""
+    n = len(results)
+    hits = int((results['max_alt'] >= target_alt).sum())
+    low, high = wilson_interval(hits, n, confidence)
+    tables = {label: percentile_table(results[col], confidence=confidence) for col, label in OUTPUTS.items()}
+    return {'n': n, 'hits': hits, 'p_reach': hits / n if n else np.nan,
+            'ci': (low, high), 'confidence': confidence, 'percentiles': tables}
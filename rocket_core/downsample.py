@@ -0,0 +1,106 @@
+import numpy as np
+
+
+MAX_LINE_POINTS = 2000
+MAX_SCATTER_POINTS = 5000
+
+
+# ─── LINES ───
+def lttb(x, y, n_out=MAX_LINE_POINTS):
+    """Largest-Triangle-Three-Buckets: indices of n_out points that keep the line's visual shape.
+
+    x must be sorted. The first and last points are always kept.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+        # Average of the next bucket is the third triangle vertex.
+        cx = x[end:nxt_end].mean() if nxt_end > end else x[-1]
+        cy = y[end:nxt_end].mean() if nxt_end > end else y[-1]
+        bx, by = x[start:end], y[start:end]
+        area = np.abs((x[a] - cx) * (by - y[a]) - (x[a] - bx) * (cy - y[a]))
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+class RunningLTTB:
+    """lttb for a line that arrives in blocks and whose final length is known.
+
+    Every total / n_out input points become one kept point, so each block is
+    decimated once on arrival and never revisited. Points short of whole
+    buckets wait in a raw tail for the next block; line() is the kept points
+    followed by that tail.
+    """
+
+    def __init__(self, total, n_out=MAX_LINE_POINTS):
+        self.bucket = max(1.0, total / n_out)
+        self._kept_x, self._kept_y = np.empty(0), np.empty(0)
+        self._tail_x, self._tail_y = np.empty(0), np.empty(0)
+
+    def append(self, x, y):
+        x = np.concatenate([self._tail_x, np.asarray(x, dtype=float)])
+        y = np.concatenate([self._tail_y, np.asarray(y, dtype=float)])
+        buckets = int(len(x) // self.bucket)
+        if buckets >= 3:
+            done = int(buckets * self.bucket)
+            idx = lttb(x[:done], y[:done], buckets)
+            self._kept_x = np.concatenate([self._kept_x, x[idx]])
+            self._kept_y = np.concatenate([self._kept_y, y[idx]])
+            x, y = x[done:], y[done:]
+        self._tail_x, self._tail_y = x, y
+        return self.line()
+
+    def line(self):
+        return np.concatenate([self._kept_x, self._tail_x]), np.concatenate([self._kept_y, self._tail_y])
+
+
+# ─── SCATTERS ───
+def scatter_decimate(x, y, max_points=MAX_SCATTER_POINTS, groups=None):
+    """Keep one point per occupied grid cell (per group) plus the x/y extremes.
+
+    groups, if given, are non-negative integer codes (e.g. one per trace colour)
+    so every group keeps its own cells. Returns (indices, counts) where counts
+    is how many original points each kept point stands for.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= max_points:
+        return np.arange(n), np.ones(n, dtype=np.int64)
+
+    group_codes = np.zeros(n, dtype=np.int64) if groups is None else np.asarray(groups, dtype=np.int64)
+    n_groups = group_codes.max() + 1
+    grid = max(2, int(np.sqrt(max_points / n_groups)))
+
+    def cell_index(v):
+        lo, hi = np.nanmin(v), np.nanmax(v)
+        span = hi - lo if hi > lo else 1.0
+        return np.minimum(((v - lo) / span * grid).astype(np.int64), grid - 1)
+
+    while True:
+        cells = (group_codes * grid + cell_index(x)) * grid + cell_index(y)
+        _, first, inverse, counts = np.unique(cells, return_index=True, return_inverse=True, return_counts=True)
+        if len(first) <= max_points or grid <= 2:
+            break
+        grid = max(2, int(grid * 0.8))
+
+    extremes = np.array([np.nanargmin(x), np.nanargmax(x), np.nanargmin(y), np.nanargmax(y)])
+    # An extreme replaces its cell's representative so no point is counted twice.
+    first[inverse[extremes]] = extremes
+    order = np.argsort(first)
+    return first[order], counts[order]
+
+
+def decimation_note(shown, total):
+    return "" if shown >= total else f" · showing {shown:,} of {total:,} points"
@@ -0,0 +1,146 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+
+# ─── WORKER ENTRY POINTS ───
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start, os.getpid()
+
+
+def _pool_context():
+    # spawn/forkserver children re-import __main__, which under Streamlit is the
+    # whole app script, so fork where the platform allows it. Workers are all
+    # forked together on first submit and then reused.
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context('spawn')
+
+
+# ─── EXECUTION BACKEND ───
+class Job:
+    def __init__(self, tag):
+        self.tag = tag
+        self.future = None
+        self.submitted = time.perf_counter()
+        self.run_time = None
+        self.wall_time = None
+        self.worker = None
+
+    def _finished(self, future):
+        self.wall_time = time.perf_counter() - self.submitted
+        if not future.cancelled() and future.exception() is None:
+            _, self.run_time, self.worker = future.result()
+
+    def result(self, timeout=None):
+        value = self.future.result(timeout)[0]
+        if self.run_time is None:
+            # Done-callbacks may still be pending when result() returns.
+            self._finished(self.future)
+        return value
+
+
+class SimulationExecutor:
+    """Process-pool backend for simulation jobs.
+
+    At most max_pending jobs are queued or running at once; submit blocks until
+    a slot frees up. Jobs carry a tag (unique per request, e.g. session id plus
+    a counter) so everything a request queued can be cancelled when its inputs
+    change. A tag is forgotten once none of its jobs are left and no map_sweep
+    is still submitting for it.
+    """
+
+    def __init__(self, max_workers=None, max_pending=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.max_workers * 4
+        self._pool = ProcessPoolExecutor(self.max_workers, mp_context=_pool_context())
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._jobs = {}
+        self._cancelled = set()
+        self._mapping = set()
+        self._lock = threading.Lock()
+        self.completed = 0
+
+    def _forget(self, tag):
+        # Caller holds the lock.
+        if not self._jobs.get(tag) and tag not in self._mapping:
+            self._jobs.pop(tag, None)
+            self._cancelled.discard(tag)
+
+    def _release(self, job):
+        self._slots.release()
+        with self._lock:
+            self._jobs.get(job.tag, set()).discard(job)
+            if not job.future.cancelled():
+                self.completed += 1
+            self._forget(job.tag)
+
+    def submit(self, fn, *args, tag=None, **kwargs):
+        self._slots.acquire()
+        job = Job(tag)
+        job.future = self._pool.submit(_timed, fn, *args, **kwargs)
+        with self._lock:
+            self._jobs.setdefault(tag, set()).add(job)
+        job.future.add_done_callback(job._finished)
+        job.future.add_done_callback(lambda _: self._release(job))
+        return job
+
+    def cancel(self, tag):
+        """Cancel queued jobs for tag; running ones finish but their results are dropped."""
+        with self._lock:
+            self._cancelled.add(tag)
+            jobs = list(self._jobs.get(tag, ()))
+            self._forget(tag)
+        for job in jobs:
+            job.future.cancel()
+
+    def is_cancelled(self, tag):
+        with self._lock:
+            return tag in self._cancelled
+
+    def map_sweep(self, samples, init_mass, steps, chunk_size=5000, tag=None, environment=None):
+        """Yield (result_frame, job) per chunk as workers finish, keeping the pool saturated."""
+        # Deferred so importing the executor doesn't pull in pandas.
+        from .sweep import run_sweep_chunk
+
+        chunks = (samples.iloc[i:i + chunk_size] for i in range(0, len(samples), chunk_size))
+        pending = set()
+        window = self.max_workers * 2
+        with self._lock:
+            self._mapping.add(tag)
+        try:
+            while True:
+                while len(pending) < window and not self.is_cancelled(tag):
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    pending.add(self.submit(run_sweep_chunk, chunk, init_mass, steps, environment, tag=tag))
+                if not pending:
+                    return
+                done, _ = wait([j.future for j in pending], return_when=FIRST_COMPLETED)
+                for job in [j for j in pending if j.future in done]:
+                    pending.discard(job)
+                    if job.future.cancelled() or self.is_cancelled(tag):
+                        continue
+                    yield job.result(), job
+        finally:
+            # Abandoned by the caller (e.g. a Streamlit rerun): drop whatever is still queued.
+            for job in pending:
+                job.future.cancel()
+            with self._lock:
+                self._mapping.discard(tag)
+                self._forget(tag)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.max_workers, 'max_pending': self.max_pending,
+                'in_flight': sum(len(j) for j in self._jobs.values()), 'completed': self.completed
+            }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
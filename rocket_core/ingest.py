@@ -0,0 +1,280 @@
+"""Chunked ingestion of mission logs from CSV or JSON Lines.
+
+Files are read a chunk at a time, coerced to the compact MISSION_DTYPES and
+validated row by row, so memory stays at one raw chunk plus the compact
+output however large the file is. Convert logs into a columnar store:
+
+    python -m rocket_core.ingest launches.csv more.jsonl --store missions.arrow [--append]
+
+--append writes only the new rows, as a part file the store reads together
+with what it already holds.
+"""
+import argparse
+import os
+import threading
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from .missions import MISSION_DTYPES, TYPES, concat_missions
+from .schema import to_compact
+
+
+# ─── SCHEMA ───
+# The fields documented on the About page; scientific_yield and launch_date may be absent.
+# ids belong to the dataset, so rows are numbered on ingestion and an id column is ignored.
+REQUIRED = ['mission_type', 'vehicle', 'payload_kg', 'fuel_tons', 'cost_million',
+            'distance_km', 'duration_days', 'crew_size', 'success']
+NUMERIC = ['payload_kg', 'fuel_tons', 'cost_million', 'distance_km', 'duration_days', 'crew_size',
+           'scientific_yield']
+FIELDS = [c for c in MISSION_DTYPES if c != 'id']
+INTEGER = [c for c in NUMERIC if MISSION_DTYPES[c].startswith('int')]
+
+TRUE_TOKENS = {'true', 't', 'yes', 'y', '1', 'success', 'successful'}
+FALSE_TOKENS = {'false', 'f', 'no', 'n', '0', 'failure', 'failed'}
+
+FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.json': 'jsonl'}
+
+
+# ─── READ ───
+def read_chunks(source, format=None, chunk_size=100_000):
+    """Raw DataFrame chunks from a CSV or JSON Lines path or file object.
+
+    Only mission columns are kept. String columns are read as categoricals;
+    everything else is left for coerce_chunk.
+    """
+    if format is None:
+        name = source if isinstance(source, (str, os.PathLike)) else getattr(source, 'name', '')
+        format = FORMATS.get(os.path.splitext(str(name))[1].lower())
+        if format is None:
+            raise ValueError(f"can't tell the format of {name!r}; expected one of {sorted(FORMATS)}")
+    if format == 'csv':
+        reader = pd.read_csv(source, chunksize=chunk_size, usecols=lambda c: c in FIELDS,
+                             dtype={'mission_type': 'category', 'vehicle': 'category'}, skipinitialspace=True)
+    else:
+        reader = pd.read_json(source, lines=True, chunksize=chunk_size, dtype=False, convert_dates=False)
+    with reader:
+        for chunk in reader:
+            yield chunk[[c for c in chunk.columns if c in FIELDS]]
+
+
+# ─── COERCE AND VALIDATE ───
+def _by_value(values, convert):
+    """Apply convert to each distinct value once (logs repeat the same few strings) and spread the results back."""
+    codes, uniques = pd.factorize(values)
+    converted = np.array([convert(u) for u in uniques] + [None], dtype=object)
+    return pd.Series(converted[codes], index=values.index)
+
+
+def _strings(values):
+    """Stripped strings, with blanks as missing."""
+    return _by_value(values, lambda v: str(v).strip() or None)
+
+
+def _booleans(values):
+    if pd.api.types.is_bool_dtype(values):
+        return values.astype(object)
+
+    def parse(v):
+        token = str(v).strip().lower()
+        return True if token in TRUE_TOKENS else False if token in FALSE_TOKENS else None
+    return _by_value(values, parse)
+
+
+def _dates(values):
+    """Naive UTC dates from ISO 8601, falling back to per-value format inference for anything else.
+
+    Offsets ("Z", "+05:30") are converted to UTC, so a log may mix them;
+    dates without one are taken as UTC already.
+    """
+    dates = pd.to_datetime(values, errors='coerce', format='ISO8601', utc=True)
+    retry = (values.notna() & dates.isna()).to_numpy()
+    if retry.any():
+        dates[retry] = pd.to_datetime(values[retry], errors='coerce', format='mixed', utc=True)
+    return dates.dt.tz_localize(None)
+
+
+def coerce_chunk(raw, first_row=1, first_id=1, vehicles=None):
+    """Coerce one raw chunk to MISSION_DTYPES.
+
+    Returns (missions, rejects). rejects has the file row number (first data
+    row = first_row) and the first reason each rejected row failed. Accepted
+    rows are numbered from first_id.
+    """
+    missing = [c for c in REQUIRED if c not in raw.columns]
+    if missing:
+        raise ValueError(f"missing required columns: {', '.join(missing)}")
+
+    n = len(raw)
+    reason = np.full(n, None, dtype=object)
+    ok = np.ones(n, dtype=bool)
+
+    def reject(mask, why):
+        new = mask & ok
+        reason[new] = why
+        ok[new] = False
+
+    mission_type = _strings(raw['mission_type'])
+    type_codes = pd.Index(TYPES).get_indexer(mission_type)
+    reject(mission_type.isna().to_numpy(), 'missing mission_type')
+    reject(type_codes < 0, 'unknown mission_type')
+
+    vehicle = _strings(raw['vehicle'])
+    reject(vehicle.isna().to_numpy(), 'missing vehicle')
+    if vehicles is not None:
+        reject(~vehicle.isin(vehicles).to_numpy(), 'unknown vehicle')
+
+    numbers = {}
+    for col in NUMERIC:
+        if col in raw.columns:
+            values = pd.to_numeric(raw[col], errors='coerce')
+            invalid = values.isna() if col in REQUIRED else raw[col].notna() & values.isna()
+            reject(invalid.to_numpy(), f'invalid {col}')
+        else:
+            values = pd.Series(np.nan, index=raw.index)
+        reject((values < 0).to_numpy(), f'negative {col}')
+        if col in INTEGER:
+            values = values.round()
+            reject((values > np.iinfo(MISSION_DTYPES[col]).max).to_numpy(), f'{col} out of range')
+        numbers[col] = values
+
+    success = _booleans(raw['success'])
+    reject(success.isna().to_numpy(), 'invalid success')
+
+    if 'launch_date' in raw.columns:
+        launch_date = _dates(raw['launch_date'])
+        reject((raw['launch_date'].notna() & launch_date.isna()).to_numpy(), 'invalid launch_date')
+    else:
+        launch_date = pd.Series(pd.NaT, index=raw.index, dtype='datetime64[ns]')
+
+    rows = np.arange(first_row, first_row + n)
+    rejects = pd.DataFrame({'row': rows[~ok], 'reason': reason[~ok]})
+
+    count = int(ok.sum())
+    frame = pd.DataFrame({
+        'id': np.arange(first_id, first_id + count),
+        'mission_type': pd.Categorical.from_codes(type_codes[ok], dtype=MISSION_DTYPES['mission_type']),
+        'vehicle': vehicle[ok].to_numpy(),
+        **{col: numbers[col][ok].to_numpy() for col in NUMERIC},
+        'success': success[ok].to_numpy(dtype=bool),
+        'launch_date': launch_date[ok].to_numpy(),
+    }, columns=list(MISSION_DTYPES))
+    return to_compact(frame), rejects
+
+
+class IngestReport:
+    """Row counts, rejection reasons and the first few rejected rows of an ingestion."""
+
+    def __init__(self, max_samples=100):
+        self.rows = 0
+        self.accepted = 0
+        self.reasons = Counter()
+        self.max_samples = max_samples
+        self._samples = []
+
+    @property
+    def rejected(self):
+        return self.rows - self.accepted
+
+    def add(self, missions, rejects):
+        self.rows += len(missions) + len(rejects)
+        self.accepted += len(missions)
+        self.reasons.update(rejects['reason'])
+        kept = sum(len(s) for s in self._samples)
+        if kept < self.max_samples and len(rejects):
+            self._samples.append(rejects.head(self.max_samples - kept))
+
+    def rejects(self):
+        if not self._samples:
+            return pd.DataFrame({'row': pd.Series(dtype=np.int64), 'reason': pd.Series(dtype=object)})
+        return pd.concat(self._samples, ignore_index=True)
+
+
+def iter_ingest(source, format=None, chunk_size=100_000, first_id=1, vehicles=None, report=None):
+    """Yield compact, validated mission chunks from a log file; counts go into report if given."""
+    first_row = 1
+    for raw in read_chunks(source, format, chunk_size):
+        missions, rejects = coerce_chunk(raw, first_row, first_id, vehicles)
+        first_row += len(raw)
+        first_id += len(missions)
+        if report is not None:
+            report.add(missions, rejects)
+        if len(missions):
+            yield missions
+
+
+def ingest(source, format=None, chunk_size=100_000, first_id=1, vehicles=None):
+    """Read a whole log into one compact frame. Returns (missions, report)."""
+    report = IngestReport()
+    chunks = list(iter_ingest(source, format, chunk_size, first_id, vehicles, report))
+    if not chunks:
+        return pd.DataFrame({c: pd.Series(dtype=d) for c, d in MISSION_DTYPES.items()}), report
+    return concat_missions(chunks), report
+
+
+# ─── APPEND ───
+class MissionLog:
+    """Missions appended to a running dashboard, kept as the compact chunks they arrived in.
+
+    append() never touches earlier rows. frame() concatenates on demand and is
+    cached per projection until the next append; version counts appends so
+    anything derived from the data can be keyed on it.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._frames = {}
+        self._lock = threading.Lock()
+        self.version = 0
+        self.num_rows = 0
+
+    def append(self, missions):
+        with self._lock:
+            self._chunks.append(missions)
+            self._frames.clear()
+            self.version += 1
+            self.num_rows += len(missions)
+
+    def chunks(self):
+        with self._lock:
+            return list(self._chunks)
+
+    def frame(self, columns=None):
+        key = tuple(columns) if columns else tuple(MISSION_DTYPES)
+        with self._lock:
+            if key not in self._frames:
+                self._frames[key] = concat_missions([c[list(key)] for c in self._chunks])
+            return self._frames[key]
+
+
+def main():
+    from .mission_store import MissionStore, append_missions, write_missions
+
+    parser = argparse.ArgumentParser(description="Validate mission logs and write them to a mission store.")
+    parser.add_argument('files', nargs='+', help="CSV or JSON Lines launch logs")
+    parser.add_argument('--store', required=True, help="output store (.parquet, or .arrow for memory-mapped IPC)")
+    parser.add_argument('--append', action='store_true', help="add to the rows already in the store")
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    args = parser.parse_args()
+
+    existing = MissionStore(args.store) if args.append and os.path.exists(args.store) else None
+    reports = {}
+
+    def chunks():
+        first_id = existing.num_rows + 1 if existing is not None else 1
+        for path in args.files:
+            reports[path] = report = IngestReport()
+            for missions in iter_ingest(path, chunk_size=args.chunk_size, first_id=first_id, report=report):
+                first_id += len(missions)
+                yield missions
+
+    (append_missions if existing is not None else write_missions)(chunks(), args.store)
+    for path, report in reports.items():
+        print(f"{path}: {report.accepted:,} of {report.rows:,} rows written, {report.rejected:,} rejected")
+        for why, count in report.reasons.most_common(5):
+            print(f"    {count:>10,}  {why}")
+
+
+if __name__ == '__main__':
+    main()
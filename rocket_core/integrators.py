@@ -0,0 +1,301 @@
+import numpy as np
+
+from .physics import G, CROSS_AREA, SEA_LEVEL_DENSITY, SCALE_HEIGHT
+from .trajectory import Trajectory
+
+
+# ─── DORMAND-PRINCE 5(4) TABLEAU ───
+DP_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+DP_A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+DP_B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+DP_B_LOW = np.array([5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+DP_E = DP_B - DP_B_LOW
+
+
+# ─── EQUATIONS OF MOTION ───
+class AscentODE:
+    """State y = [altitude, velocity, mass]; counts right-hand-side evaluations in nfev.
+
+    The flight is split into segments of constant propulsion; segments(t_end)
+    lists them as (start, end, phase, event) and phase is passed back to the
+    right-hand side. event, if set, is recorded when the segment ends and
+    handed to on_event, which may change the state (e.g. drop a spent stage).
+    """
+
+    def __init__(self, init_mass, thrust_kn, drag_cd, payload, fuel_mass, steps, environment=None):
+        self.environment = environment
+        self.thrust = thrust_kn * 1000
+        self.burn_rate = fuel_mass / (steps * 0.7)
+        self.drag_k = 0.5 * drag_cd * CROSS_AREA * SEA_LEVEL_DENSITY
+        self.y0 = np.array([0.0, 0.0, float(init_mass + payload + fuel_mass)])
+        self.burnout = fuel_mass / self.burn_rate if fuel_mass > 0 else 0.0
+        self.nfev = 0
+
+    def propulsion(self, burning):
+        """Thrust (N) and mass flow (kg/s) during a phase."""
+        return (self.thrust, self.burn_rate) if burning else (0.0, 0.0)
+
+    def segments(self, t_end):
+        burnout = min(self.burnout, t_end)
+        return [(0.0, burnout, True, 'burnout' if self.burnout <= t_end else None),
+                (burnout, t_end, False, None)]
+
+    def on_event(self, event, y):
+        return y
+
+    def liftoff(self, t, y, phase):
+        """When a vehicle resting on the pad at t lifts off during phase, or None.
+
+        On the pad velocity and drag are zero, so liftoff is where the burning
+        mass falls to thrust / g.
+        """
+        alt, vel, mass = y
+        thrust, flow = self.propulsion(phase)
+        if alt > 0 or vel > 0 or flow <= 0:
+            return None
+        g = G if self.environment is None else self.environment.state(0.0)[1]
+        if thrust >= mass * g:
+            return None
+        return t + (mass - thrust / g) / flow
+
+    def __call__(self, t, y, phase):
+        self.nfev += 1
+        alt, vel, mass = y
+        thrust, flow = self.propulsion(phase)
+        # Trial stages can dip below ground near impact; the air there is sea-level air.
+        ground_alt = max(float(alt), 0.0)
+        if self.environment is None:
+            drag = self.drag_k * np.exp(-ground_alt / SCALE_HEIGHT) * vel * abs(vel)
+            g = G
+        else:
+            density, g, sound = self.environment.state(ground_alt)
+            factor = self.environment.drag_factor(abs(float(vel)) / sound)
+            drag = self.drag_k / SEA_LEVEL_DENSITY * factor * density * vel * abs(vel)
+        acc = (thrust - drag) / mass - g
+        if alt <= 0 and vel <= 0 and acc < 0:
+            # Resting on the pad: the ground carries the weight.
+            vel, acc = 0.0, 0.0
+        return np.array([vel, acc, -flow])
+
+
+class StagedAscentODE(AscentODE):
+    """A vehicle.Vehicle flown stage by stage: the phase is the burning stage's index, or None when coasting.
+
+    Each burnout is a segment boundary and separation drops the stage's dry mass there.
+    """
+
+    def __init__(self, vehicle, environment=None):
+        self.vehicle = vehicle
+        self.environment = environment
+        self.engines = [(s.thrust_kn * 1000, s.mass_flow) for s in vehicle.stages]
+        self.thrust = self.engines[0][0] if self.engines else 0.0
+        self.drag_k = 0.5 * vehicle.drag_cd * vehicle.cross_area * SEA_LEVEL_DENSITY
+        self.y0 = np.array([0.0, 0.0, vehicle.liftoff_mass])
+        schedule = vehicle.schedule()
+        self.burnout = schedule[-1][1] if schedule else 0.0
+        self.nfev = 0
+
+    def propulsion(self, stage):
+        return (0.0, 0.0) if stage is None else self.engines[stage]
+
+    def segments(self, t_end):
+        segments, t = [], 0.0
+        last = len(self.vehicle.stages) - 1
+        for i, (ignition, burnout) in enumerate(self.vehicle.schedule()):
+            if ignition > t:
+                segments.append((min(t, t_end), min(ignition, t_end), None, None))
+            event = 'burnout' if i == last else f'separation {i + 1}'
+            segments.append((min(ignition, t_end), min(burnout, t_end), i, event if burnout <= t_end else None))
+            t = burnout
+        segments.append((min(t, t_end), t_end, None, None))
+        return segments
+
+    def on_event(self, event, y):
+        if not event.startswith('separation'):
+            return y
+        y = y.copy()
+        y[2] -= self.vehicle.stages[int(event.split()[1]) - 1].dry_mass
+        return y
+
+
+# ─── SINGLE STEPS ───
+def _euler_step(f, t, y, h, phase, f0=None):
+    f0 = f(t, y, phase) if f0 is None else f0
+    return y + h * f0, None, None
+
+
+def _rk4_step(f, t, y, h, phase, f0=None):
+    k1 = f(t, y, phase) if f0 is None else f0
+    k2 = f(t + h / 2, y + h / 2 * k1, phase)
+    k3 = f(t + h / 2, y + h / 2 * k2, phase)
+    k4 = f(t + h, y + h * k3, phase)
+    return y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4), None, None
+
+
+def _dp_step(f, t, y, h, phase, f0=None):
+    k = [f(t, y, phase) if f0 is None else f0]
+    for i in range(1, 7):
+        yi = y + h * sum(a * kj for a, kj in zip(DP_A[i], k))
+        k.append(f(t + DP_C[i] * h, yi, phase))
+    y_new = y + h * sum(b * kj for b, kj in zip(DP_B, k))
+    err = h * sum(e * kj for e, kj in zip(DP_E, k))
+    return y_new, err, k[6]
+
+
+# ─── EVENT LOCATION ───
+def _hermite(t0, y0, f0, t1, y1, f1, t):
+    h = t1 - t0
+    s = (t - t0) / h
+    h00 = 2 * s**3 - 3 * s**2 + 1
+    h10 = s**3 - 2 * s**2 + s
+    h01 = -2 * s**3 + 3 * s**2
+    h11 = s**3 - s**2
+    return h00 * y0 + h10 * h * f0 + h01 * y1 + h11 * h * f1
+
+
+def _locate(g, t0, t1, iters=60):
+    """Bisect for the first sign change of g on [t0, t1], assuming g(t0) > 0 >= g(t1)."""
+    for _ in range(iters):
+        mid = (t0 + t1) / 2
+        if g(mid) > 0:
+            t0 = mid
+        else:
+            t1 = mid
+    return t1
+
+
+# ─── INTEGRATOR ───
+def integrate(ode, t_end, method='rk45', dt=1.0, rtol=1e-6, atol=1e-3):
+    """Integrate ode to t_end, returning samples plus burnout/apogee/impact and segment event times.
+
+    Burnout, staging and liftoff from the pad are segment boundaries, so no
+    step ever straddles a thrust change, a mass drop or the end of the ground
+    contact; only the one step that reaches a boundary is shortened, and the
+    step size carries on unchanged into the next segment.
+    Apogee and impact are located by bisection on cubic Hermite interpolation of
+    each accepted step and inserted as samples. Integration stops at impact.
+    """
+    step = {'euler': _euler_step, 'rk4': _rk4_step, 'rk45': _dp_step}[method]
+    adaptive = method == 'rk45'
+
+    t, y = 0.0, ode.y0.copy()
+    times, states = [t], [y.copy()]
+    events = {'burnout': None, 'apogee': None, 'impact': None}
+    airborne = False
+    lifted = False
+
+    h = dt if not adaptive else 0.5
+
+    pending = list(ode.segments(t_end))
+    while pending:
+        seg_start, seg_end, phase, event = pending.pop(0)
+        if seg_end <= seg_start or events['impact'] is not None:
+            continue
+        # Split off the time spent on the pad once; after that, rounding in the
+        # weight must not split the segment again.
+        lift = None if lifted else ode.liftoff(seg_start, y, phase)
+        if lift is not None and seg_start < lift < seg_end:
+            pending.insert(0, (lift, seg_end, phase, event))
+            seg_end, event = lift, None
+            lifted = True
+        t = seg_start
+        f0 = ode(t, y, phase)
+        while t < seg_end - 1e-12:
+            h_try = min(h, seg_end - t)
+            y_new, err, f_new = step(ode, t, y, h_try, phase, f0)
+
+            if adaptive:
+                scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+                err_norm = np.sqrt(np.mean((err / scale) ** 2))
+                if not np.isfinite(err_norm):
+                    h = h_try * 0.2
+                    continue
+                factor = 0.9 * err_norm ** -0.2 if err_norm > 0 else 5.0
+                h = h_try * min(5.0, max(0.2, factor))
+                if err_norm > 1:
+                    continue
+            if f_new is None:
+                f_new = ode(t + h_try, y_new, phase)
+
+            t_new = t + h_try
+            if y_new[0] > 0:
+                airborne = True
+
+            def interp(tq, i):
+                return _hermite(t, y[i], f0[i], t_new, y_new[i], f_new[i], tq)
+
+            if events['apogee'] is None and y[1] > 0 >= y_new[1]:
+                t_apo = _locate(lambda tq: interp(tq, 1), t, t_new)
+                events['apogee'] = float(t_apo)
+                times.append(t_apo)
+                states.append(np.array([interp(t_apo, 0), 0.0, interp(t_apo, 2)]))
+            if airborne and y[0] > 0 >= y_new[0] and y_new[1] < 0:
+                t_hit = _locate(lambda tq: interp(tq, 0), t, t_new)
+                events['impact'] = float(t_hit)
+                times.append(t_hit)
+                states.append(np.array([0.0, interp(t_hit, 1), y_new[2]]))
+                break
+
+            t, y, f0 = t_new, y_new, f_new
+            times.append(t)
+            states.append(y.copy())
+
+        if event and events['impact'] is None:
+            events[event] = seg_end
+            y = ode.on_event(event, y)
+
+    states = np.array(states)
+    return np.array(times), states, events
+
+
+def run_simulation_ode(init_mass, thrust_kn, drag_cd, payload, fuel_mass, steps,
+                       method='rk45', dt=1.0, rtol=1e-6, atol=1e-3, stride=1, keep_last=None, dtype=np.float64,
+                       environment=None):
+    ode = AscentODE(init_mass, thrust_kn, drag_cd, payload, fuel_mass, steps, environment)
+    times, states, events = integrate(ode, float(steps), method, dt, rtol, atol)
+
+    altitudes = np.maximum(states[:, 0], 0.0)
+    velocities = np.maximum(states[:, 1], 0.0)
+
+    twr = ode.thrust / (ode.y0[2] * G)
+    return {
+        'trajectory': Trajectory.from_samples(times, altitudes, velocities, dtype, stride, keep_last),
+        'max_alt': float(altitudes.max()), 'max_vel': float(velocities.max()),
+        'burnout_time': round(events['burnout'], 2) if events['burnout'] is not None else 0,
+        'twr': round(twr, 2), 'events': events, 'nfev': ode.nfev
+    }
+
+
+def run_vehicle(vehicle, t_end, method='rk45', dt=1.0, rtol=1e-6, atol=1e-3, stride=1, keep_last=None,
+                dtype=np.float64, environment=None):
+    """Fly a vehicle.Vehicle for t_end seconds; like run_simulation_ode, plus a per-stage timeline."""
+    ode = StagedAscentODE(vehicle, environment)
+    times, states, events = integrate(ode, float(t_end), method, dt, rtol, atol)
+
+    altitudes = np.maximum(states[:, 0], 0.0)
+    velocities = np.maximum(states[:, 1], 0.0)
+
+    stages = []
+    for i, (stage, (ignition, burnout)) in enumerate(zip(vehicle.stages, vehicle.schedule())):
+        row = {'stage': stage.name, 'ignition': ignition, 'burnout': burnout, 'burn_time': stage.burn_time,
+               'mass_flow': stage.mass_flow}
+        reached = burnout <= times[-1]
+        row['altitude'] = float(np.interp(burnout, times, altitudes)) if reached else None
+        row['velocity'] = float(np.interp(burnout, times, velocities)) if reached else None
+        stages.append(row)
+
+    twr = ode.thrust / (ode.y0[2] * G)
+    return {
+        'trajectory': Trajectory.from_samples(times, altitudes, velocities, dtype, stride, keep_last),
+        'max_alt': float(altitudes.max()), 'max_vel': float(velocities.max()),
+        'burnout_time': round(events['burnout'], 2) if events['burnout'] is not None else 0,
+        'twr': round(twr, 2), 'events': events, 'nfev': ode.nfev, 'stages': stages
+    }
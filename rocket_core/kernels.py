@@ -0,0 +1,190 @@
+"""Compiled inner loops for the single-run engine.
+
+Numba is optional. Without it the same functions run as plain Python on
+math-module scalars, so results never depend on whether it is installed;
+only the speed does. Numba is imported and the kernels compiled on the first
+call (or warmup()), so importing this module costs nothing extra.
+"""
+import importlib.util
+import math
+import threading
+
+import numpy as np
+
+
+COMPILED = importlib.util.find_spec('numba') is not None
+
+_kernels = {}
+_lock = threading.Lock()
+
+
+def _euler_steps(thrust, drag_cd, cross_area, sea_level_density, scale_height, g, dt, fuel_burn_rate,
+                 state, start, stop, stride, buf, count):
+    """physics.run_simulation's Euler loop for the default atmosphere, over steps [start, stop).
+
+    state is [altitude, velocity, mass, fuel, max_alt, max_vel, burnout_time]
+    and is updated in place, so a run can be advanced a block at a time.
+    Every stride-th (altitude, velocity) sample goes into the (2, capacity)
+    buffer buf at position count, wrapping around when it is full. Returns
+    the new sample count.
+    """
+    capacity = buf.shape[1]
+    altitude, velocity, mass, fuel = state[0], state[1], state[2], state[3]
+    max_alt, max_vel, burnout_time = state[4], state[5], int(state[6])
+
+    for t in range(start, stop):
+        if t % stride == 0:
+            i = count % capacity
+            buf[0, i] = max(0.0, altitude)
+            buf[1, i] = max(0.0, velocity)
+            count += 1
+
+        if altitude > max_alt:
+            max_alt = altitude
+        if velocity > max_vel:
+            max_vel = velocity
+
+        current_thrust = thrust if fuel > 0 else 0.0
+        density = sea_level_density * math.exp(-altitude / scale_height)
+        gravity_force = mass * g
+        drag_force = 0.5 * drag_cd * density * velocity ** 2 * cross_area
+        net_force = current_thrust - gravity_force - drag_force
+        acceleration = net_force / mass
+
+        velocity += acceleration * dt
+        altitude += velocity * dt
+
+        if fuel > 0:
+            fuel -= fuel_burn_rate * dt
+            mass -= fuel_burn_rate * dt
+            if fuel <= 0:
+                fuel = 0.0
+                burnout_time = t
+
+        if altitude < 0 and t > 1:
+            altitude = 0.0
+            velocity = 0.0
+
+    state[0], state[1], state[2], state[3] = altitude, velocity, mass, fuel
+    state[4], state[5], state[6] = max_alt, max_vel, burnout_time
+    return count
+
+
+def _euler_steps_table(thrust, drag_cd, cross_area, dt, fuel_burn_rate,
+                       density, density_slopes, sound, sound_slopes, alt_inv_dx, alt_last,
+                       mach_drag, mach_slopes, mach_inv_dx, mach_last, g0, earth_radius,
+                       state, start, stop, stride, buf, count):
+    """_euler_steps for a tabulated atmosphere (atmosphere.StandardAtmosphere.kernel_tables()).
+
+    Density and speed of sound share one uniform altitude grid from 0 m; the
+    Mach drag multiplier has its own grid from Mach 0. Gravity falls off with
+    the inverse square of the distance from the centre of a sphere of radius
+    earth_radius. Otherwise the same step rules and arguments as _euler_steps.
+    """
+    capacity = buf.shape[1]
+    altitude, velocity, mass, fuel = state[0], state[1], state[2], state[3]
+    max_alt, max_vel, burnout_time = state[4], state[5], int(state[6])
+
+    for t in range(start, stop):
+        if t % stride == 0:
+            i = count % capacity
+            buf[0, i] = max(0.0, altitude)
+            buf[1, i] = max(0.0, velocity)
+            count += 1
+
+        if altitude > max_alt:
+            max_alt = altitude
+        if velocity > max_vel:
+            max_vel = velocity
+
+        current_thrust = thrust if fuel > 0 else 0.0
+        pos = min(max(altitude * alt_inv_dx, 0.0), alt_last)
+        i = int(pos)
+        frac = pos - i
+        r = earth_radius / (earth_radius + altitude)
+        pos = min(abs(velocity) / (sound[i] + frac * sound_slopes[i]) * mach_inv_dx, mach_last)
+        j = int(pos)
+        gravity_force = mass * (g0 * r * r)
+        cd = drag_cd * (mach_drag[j] + (pos - j) * mach_slopes[j])
+        drag_force = 0.5 * cd * (density[i] + frac * density_slopes[i]) * velocity ** 2 * cross_area
+        net_force = current_thrust - gravity_force - drag_force
+        acceleration = net_force / mass
+
+        velocity += acceleration * dt
+        altitude += velocity * dt
+
+        if fuel > 0:
+            fuel -= fuel_burn_rate * dt
+            mass -= fuel_burn_rate * dt
+            if fuel <= 0:
+                fuel = 0.0
+                burnout_time = t
+
+        if altitude < 0 and t > 1:
+            altitude = 0.0
+            velocity = 0.0
+
+    state[0], state[1], state[2], state[3] = altitude, velocity, mass, fuel
+    state[4], state[5], state[6] = max_alt, max_vel, burnout_time
+    return count
+
+
+# What _euler_ascent calls; _load() points it at the compiled kernel so the call is compiled too.
+_steps = _euler_steps
+
+
+def _euler_ascent(thrust, drag_cd, cross_area, sea_level_density, scale_height, g, dt,
+                  mass, fuel, fuel_burn_rate, steps, stride, buf):
+    state = np.array([0.0, 0.0, mass, fuel, 0.0, 0.0, 0.0])
+    count = _steps(thrust, drag_cd, cross_area, sea_level_density, scale_height, g, dt, fuel_burn_rate,
+                   state, 0, steps + 1, stride, buf, 0)
+    return state[4], state[5], int(state[6]), count
+
+
+def _load():
+    """The kernels, compiled with Numba on first use when it is installed."""
+    global _steps
+    with _lock:
+        if not _kernels:
+            if COMPILED:
+                import numba
+                jit = numba.njit(cache=True, nogil=True)
+                _steps = jit(_euler_steps)
+                _kernels.update(euler_steps=_steps, euler_ascent=jit(_euler_ascent),
+                                euler_steps_table=jit(_euler_steps_table))
+            else:
+                _kernels.update(euler_steps=_euler_steps, euler_ascent=_euler_ascent,
+                                euler_steps_table=_euler_steps_table)
+    return _kernels
+
+
+def euler_steps(*args):
+    return (_kernels or _load())['euler_steps'](*args)
+
+
+def euler_ascent(*args):
+    """A whole run of euler_steps from the pad. Returns max_alt, max_vel, burnout_time and the sample count."""
+    return (_kernels or _load())['euler_ascent'](*args)
+
+
+def euler_steps_table(*args):
+    return (_kernels or _load())['euler_steps_table'](*args)
+
+
+euler_steps.__doc__ = _euler_steps.__doc__
+euler_steps_table.__doc__ = _euler_steps_table.__doc__
+# The uncompiled kernels, as Numba exposes them on its dispatchers.
+euler_steps.py_func, euler_ascent.py_func = _euler_steps, _euler_ascent
+euler_steps_table.py_func = _euler_steps_table
+
+
+def warmup(dtypes=(np.float64, np.float32)):
+    """Compile (or load from Numba's on-disk cache) the kernels for each trajectory dtype."""
+    for dtype in dtypes:
+        buf = np.empty((2, 3), dtype=dtype)
+        euler_ascent(1000.0, 0.3, 10.0, 1.225, 8500.0, 9.81, 1.0, 1000.0, 100.0, 10.0, 2, 1, buf)
+        euler_steps(1000.0, 0.3, 10.0, 1.225, 8500.0, 9.81, 1.0, 10.0, np.array([0.0, 0.0, 1000.0, 100.0, 0.0, 0.0, 0.0]), 0, 2, 1, buf, 0)
+        table = np.array([1.0, 1.0])
+        euler_steps_table(1000.0, 0.3, 10.0, 1.0, 10.0, table, table, table, table, 1.0, 1.0,
+                          table, table, 1.0, 1.0, 9.81, 6371000.0,
+                          np.array([0.0, 0.0, 1000.0, 100.0, 0.0, 0.0, 0.0]), 0, 2, 1, buf, 0)
@@ -0,0 +1,147 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .missions import concat_missions
+
+
+class MissionFilterIndex:
+    """Prebuilt indexes answering Mission Data filter combinations without rescanning the table.
+
+    mission_type, vehicle and each (type, vehicle) pair map to their sorted row
+    positions; range columns keep an argsort so "<= limit" is a prefix found by
+    binary search. Range limits are then checked only on the categorical
+    candidates, and results are cached per filter tuple.
+
+    extend() adds appended rows by indexing only those rows and merging them
+    into the existing positions and sort orders.
+    """
+
+    RANGED = ('cost_million', 'distance_km')
+
+    def __init__(self, df, cache_size=64):
+        self.df = df
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Row positions per value of each categorical column and per (type, vehicle) pair.
+        self._by_type, self._by_vehicle, self._pairs = _category_positions(df)
+
+        self._values, self._order, self._sorted = {}, {}, {}
+        for col in self.RANGED:
+            values = df[col].to_numpy()
+            order = np.argsort(values, kind='stable')
+            self._values[col] = values
+            self._order[col] = order
+            self._sorted[col] = values[order]
+
+    def copy(self):
+        """An index over the same frame that can be extended without touching this one."""
+        index = MissionFilterIndex.__new__(MissionFilterIndex)
+        index.df, index.cache_size = self.df, self.cache_size
+        index._cache, index._lock = OrderedDict(), threading.Lock()
+        index._by_type, index._by_vehicle, index._pairs = dict(self._by_type), dict(self._by_vehicle), dict(self._pairs)
+        index._values, index._order, index._sorted = dict(self._values), dict(self._order), dict(self._sorted)
+        return index
+
+    def extend(self, chunk):
+        """Append chunk's rows to the frame and the indexes; only the new rows are grouped and sorted."""
+        if not len(chunk):
+            return self
+        offset = len(self.df)
+        self.df = concat_missions([self.df, chunk])
+
+        for groups, new in zip((self._by_type, self._by_vehicle, self._pairs), _category_positions(chunk)):
+            for label, pos in new.items():
+                if len(pos):
+                    pos = pos + offset
+                    groups[label] = np.concatenate([groups[label], pos]) if label in groups else pos
+
+        # New rows come after every existing position, so inserting them to the
+        # right of equal values keeps each order stable.
+        for col in self.RANGED:
+            values = chunk[col].to_numpy()
+            order = np.argsort(values, kind='stable')
+            at = np.searchsorted(self._sorted[col], values[order], side='right')
+            self._values[col] = np.concatenate([self._values[col], values])
+            self._order[col] = np.insert(self._order[col], at, order + offset)
+            self._sorted[col] = np.insert(self._sorted[col], at, values[order])
+
+        with self._lock:
+            self._cache.clear()
+        return self
+
+    def _match_positions(self, mission_type, vehicle, maxima):
+        n = len(self.df)
+        empty = np.empty(0, dtype=np.intp)
+        if mission_type is not None and vehicle is not None:
+            cands = self._pairs.get((mission_type, vehicle), empty)
+        elif mission_type is not None:
+            cands = self._by_type.get(mission_type, empty)
+        elif vehicle is not None:
+            cands = self._by_vehicle.get(vehicle, empty)
+        else:
+            cands = None
+
+        for col, limit in maxima.items():
+            count = np.searchsorted(self._sorted[col], limit, side='right')
+            if count == n:
+                continue
+            if cands is not None:
+                cands = cands[self._values[col][cands] <= limit]
+            elif count < n // 8:
+                cands = np.sort(self._order[col][:count])
+            else:
+                cands = np.flatnonzero(self._values[col] <= limit)
+        return cands
+
+    def positions(self, mission_type=None, vehicle=None, max_cost=None, max_distance=None):
+        """Sorted row positions matching the filters, or None when every row matches."""
+        key = (mission_type, vehicle, max_cost, max_distance)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        maxima = {c: v for c, v in zip(self.RANGED, (max_cost, max_distance)) if v is not None}
+        result = self._match_positions(mission_type, vehicle, maxima)
+
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def filter(self, mission_type=None, vehicle=None, max_cost=None, max_distance=None):
+        """Filtered frame; unfiltered requests return the shared frame itself, so treat it as read-only."""
+        pos = self.positions(mission_type, vehicle, max_cost, max_distance)
+        return self.df if pos is None else self.df.take(pos)
+
+    def order_by(self, col, mission_type=None, vehicle=None, max_cost=None, max_distance=None):
+        """Row positions matching the filters, ordered by a RANGED column (stable), without sorting the frame."""
+        order = self._order[col]
+        pos = self.positions(mission_type, vehicle, max_cost, max_distance)
+        if pos is None:
+            return order
+        if len(pos) < len(order) // 16:
+            return pos[np.argsort(self._values[col][pos], kind='stable')]
+        keep = np.zeros(len(order), dtype=bool)
+        keep[pos] = True
+        return order[keep[order]]
+
+
+def _category_positions(df):
+    type_codes, types = df['mission_type'].factorize()
+    vehicle_codes, vehicles = df['vehicle'].factorize()
+    pair_codes = np.where((type_codes < 0) | (vehicle_codes < 0), -1, type_codes * len(vehicles) + vehicle_codes)
+    pairs = [(t, v) for t in types for v in vehicles]
+    return (_group_positions(type_codes, types), _group_positions(vehicle_codes, vehicles),
+            _group_positions(pair_codes, pairs))
+
+
+def _group_positions(codes, labels):
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(len(labels) + 1))
+    return {label: order[bounds[i]:bounds[i + 1]] for i, label in enumerate(labels)}
@@ -0,0 +1,199 @@
+"""Columnar on-disk mission store (Parquet or Arrow IPC).
+
+Write a store from the generator:  python -m rocket_core.mission_store missions.arrow --rows 5000000
+
+A store is its base file plus any parts appended next to it
+(missions.part-0001.arrow, ...), read together as one dataset, so an append
+writes only the new rows.
+"""
+import argparse
+import glob
+import os
+import re
+import threading
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from .missions import TYPES, VEHICLES, iter_mission_chunks
+from .schema import to_compact
+
+
+# ─── SCHEMA ───
+MISSION_SCHEMA = pa.schema([
+    ('id', pa.int64()),
+    ('mission_type', pa.dictionary(pa.int8(), pa.string())),
+    ('vehicle', pa.dictionary(pa.int16(), pa.string())),
+    ('payload_kg', pa.int32()),
+    ('fuel_tons', pa.float32()),
+    ('cost_million', pa.float32()),
+    ('distance_km', pa.int32()),
+    ('duration_days', pa.int32()),
+    ('crew_size', pa.int8()),
+    ('scientific_yield', pa.float32()),
+    ('success', pa.bool_()),
+    ('launch_date', pa.date32()),
+])
+
+
+# mission_type is validated against TYPES. Vehicles start from the generator's
+# names and any others (e.g. from imported launch logs) are appended as they
+# appear, so codes already written never move.
+DICTIONARIES = {'mission_type': TYPES, 'vehicle': VEHICLES}
+OPEN_DICTIONARIES = {'vehicle'}
+
+# IPC files accept a dictionary delta only when it extends the previous one.
+WRITE_OPTIONS = ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+
+# Dates come back as datetime64[ns] straight from Arrow (casting datetime64[ms]
+# afterwards is several times slower); to_compact checks the rest.
+TO_PANDAS = {'date_as_object': False, 'coerce_temporal_nanoseconds': True}
+
+
+def _is_arrow(path):
+    return os.path.splitext(path)[1].lower() in ('.arrow', '.feather', '.ipc')
+
+
+def store_files(path):
+    """The store's base file followed by its appended parts, oldest first."""
+    stem, ext = os.path.splitext(path)
+    parts = {}
+    for part in glob.glob(f'{glob.escape(stem)}.part-*{glob.escape(ext)}'):
+        match = re.fullmatch(r'\.part-(\d+)', part[len(stem):len(part) - len(ext)])
+        if match:
+            parts[int(match.group(1))] = part
+    return [path] + [parts[i] for i in sorted(parts)]
+
+
+def _conform(table):
+    """Cast a table from an older store (e.g. an int8 vehicle dictionary) to MISSION_SCHEMA's types."""
+    schema = pa.schema([MISSION_SCHEMA.field(name) for name in table.schema.names])
+    return table if table.schema.equals(schema) else table.cast(schema)
+
+
+def _concat(tables):
+    tables = [_conform(t) for t in tables]
+    return tables[0] if len(tables) == 1 else pa.concat_tables(tables)
+
+
+def _to_batch(df, dictionaries):
+    """One record batch; dictionaries maps each dictionary field to its categories so far and is extended in place."""
+    cols = []
+    for field in MISSION_SCHEMA:
+        values = df[field.name]
+        if field.name == 'launch_date':
+            values = values.astype('datetime64[s]')
+        if field.name in dictionaries:
+            categories = dictionaries[field.name]
+            if field.name in OPEN_DICTIONARIES:
+                seen = values.dropna().unique()
+                categories += sorted(set(seen) - set(categories))
+            codes = pd.Categorical(values, categories=categories).codes
+            arr = pa.DictionaryArray.from_arrays(pa.array(codes, mask=codes < 0), pa.array(categories))
+        else:
+            arr = pa.array(values, from_pandas=True).cast(field.type)
+        cols.append(arr)
+    return pa.RecordBatch.from_arrays(cols, schema=MISSION_SCHEMA)
+
+
+# ─── WRITE ───
+def write_missions(chunks, path):
+    """Write one DataFrame or an iterable of DataFrame chunks as a new store; format follows the extension.
+
+    Parts appended to an earlier store at path are removed.
+    """
+    _write(chunks, path)
+    for part in store_files(path)[1:]:
+        os.remove(part)
+
+
+def append_missions(chunks, path):
+    """Add chunks to the store at path as a new part file, leaving the rows already there untouched."""
+    if not os.path.exists(path):
+        return write_missions(chunks, path)
+    stem, ext = os.path.splitext(path)
+    _write(chunks, f'{stem}.part-{len(store_files(path)):04d}{ext}')
+
+
+def _write(chunks, path):
+    if hasattr(chunks, 'columns'):
+        chunks = [chunks]
+    tmp = path + '.tmp'
+    dictionaries = {name: list(categories) for name, categories in DICTIONARIES.items()}
+    try:
+        if _is_arrow(path):
+            with pa.OSFile(tmp, 'wb') as sink, ipc.new_file(sink, MISSION_SCHEMA, options=WRITE_OPTIONS) as writer:
+                for df in chunks:
+                    writer.write_batch(_to_batch(df, dictionaries))
+        else:
+            with pq.ParquetWriter(tmp, MISSION_SCHEMA) as writer:
+                for df in chunks:
+                    writer.write_batch(_to_batch(df, dictionaries))
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, path)
+
+
+# ─── READ ───
+class MissionStore:
+    """Read-only, memory-mapped view of a mission file.
+
+    Arrow IPC files are mapped and read zero-copy; Parquet is decoded through a
+    memory-mapped reader. Only requested columns are read, and each projection
+    is converted to pandas once and shared by every caller.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.files = store_files(path)
+        self._frames = {}
+        self._lock = threading.Lock()
+        if _is_arrow(path):
+            self._table = _concat([ipc.open_file(pa.memory_map(f, 'r')).read_all() for f in self.files])
+            self.num_rows = self._table.num_rows
+        else:
+            self._table = None
+            self.num_rows = sum(pq.ParquetFile(f, memory_map=True).metadata.num_rows for f in self.files)
+
+    def table(self, columns=None):
+        columns = list(columns) if columns else MISSION_SCHEMA.names
+        if self._table is not None:
+            return self._table.select(columns)
+        return _concat([pq.read_table(f, columns=columns, memory_map=True) for f in self.files])
+
+    def frame(self, columns=None):
+        key = tuple(columns) if columns else tuple(MISSION_SCHEMA.names)
+        with self._lock:
+            if key not in self._frames:
+                df = to_compact(self.table(key).to_pandas(split_blocks=True, **TO_PANDAS))
+                self._frames[key] = df
+            return self._frames[key]
+
+    def iter_frames(self, batch_size=1_000_000):
+        """The whole store as DataFrame chunks, without materializing it at once."""
+        if self._table is not None:
+            batches = self._table.to_batches(max_chunksize=batch_size)
+        else:
+            batches = (batch for f in self.files
+                       for batch in pq.ParquetFile(f, memory_map=True).iter_batches(batch_size=batch_size))
+        for batch in batches:
+            yield to_compact(batch.to_pandas(**TO_PANDAS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate and write a mission store.")
+    parser.add_argument('path', help="output file (.parquet, or .arrow for memory-mapped IPC)")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunk-size', type=int, default=1_000_000)
+    args = parser.parse_args()
+    write_missions(iter_mission_chunks(args.rows, args.seed, args.chunk_size), args.path)
+    print(f"wrote {args.rows:,} missions to {args.path}")
+
+
+if __name__ == '__main__':
+    main()
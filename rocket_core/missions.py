@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+
+
+# ─── MISSION PROFILES ───
+TYPES = ['Orbital', 'Lunar', 'Mars', 'Deep Space', 'ISS Resupply']
+VEHICLES = ['Falcon 9', 'Atlas V', 'Delta IV', 'Ariane 5', 'Soyuz', 'SLS']
+
+PROFILES = {
+    'Orbital':      {'payload': (500, 8000),    'fuel': (20, 80),    'cost': (30, 120),   'dist': (200, 2000),      'dur': (1, 14),    'crew': (0, 4), 'success_rate': 0.92},
+    'Lunar':        {'payload': (1000, 12000),   'fuel': (50, 150),   'cost': (80, 250),   'dist': (350000, 400000), 'dur': (5, 20),    'crew': (0, 6), 'success_rate': 0.85},
+    'Mars':         {'payload': (2000, 20000),   'fuel': (100, 300),  'cost': (150, 450),  'dist': (55000, 400000),  'dur': (180, 300), 'crew': (0, 6), 'success_rate': 0.78},
+    'Deep Space':   {'payload': (500, 5000),     'fuel': (60, 200),   'cost': (100, 500),  'dist': (100000, 500000), 'dur': (365, 1000),'crew': (0, 0), 'success_rate': 0.82},
+    'ISS Resupply': {'payload': (1000, 6000),    'fuel': (15, 60),    'cost': (20, 80),    'dist': (400, 420),       'dur': (1, 3),     'crew': (0, 7), 'success_rate': 0.95},
+}
+
+# Compact in-memory dtypes for mission frames. mission_type is a closed set;
+# real launch logs name vehicles beyond the generator's list, so vehicle is open.
+MISSION_DTYPES = {
+    'id': 'int64',
+    'mission_type': pd.CategoricalDtype(TYPES),
+    'vehicle': 'category',
+    'payload_kg': 'int32',
+    'fuel_tons': 'float32',
+    'cost_million': 'float32',
+    'distance_km': 'int32',
+    'duration_days': 'int32',
+    'crew_size': 'int8',
+    'scientific_yield': 'float32',
+    'success': 'bool',
+    'launch_date': 'datetime64[ns]',
+}
+
+BASE_DATE = np.datetime64('2018-01-01')
+DATE_SPAN_DAYS = 365 * 6
+
+# Per-type (low, high) tables indexed by type code, so a whole chunk is drawn at once.
+_RANGES = {k: np.array([PROFILES[t][k] for t in TYPES], dtype=float)
+           for k in ('payload', 'fuel', 'cost', 'dist', 'dur', 'crew')}
+_SUCCESS = np.array([PROFILES[t]['success_rate'] for t in TYPES])
+_VEHICLE_DTYPE = pd.CategoricalDtype(VEHICLES)
+
+
+# ─── GENERATION ───
+def _uniform(rng, field, codes):
+    lo, hi = _RANGES[field][codes, 0], _RANGES[field][codes, 1]
+    return lo + (hi - lo) * rng.random(len(codes))
+
+
+def _sample_chunk(rng, start, n):
+    # Mission types cycle in profile order, as in the original 48-mission set.
+    codes = (np.arange(start, start + n) % len(TYPES)).astype(np.int8)
+    payload = _uniform(rng, 'payload', codes)
+    fuel = _uniform(rng, 'fuel', codes) + payload * rng.uniform(0.005, 0.015, n)
+    launch_day = rng.integers(0, DATE_SPAN_DAYS + 1, n)
+
+    # Columns are built directly in MISSION_DTYPES; no object arrays along the way.
+    return pd.DataFrame({
+        'id': np.arange(start + 1, start + n + 1),
+        'mission_type': pd.Categorical.from_codes(codes, dtype=MISSION_DTYPES['mission_type']),
+        'vehicle': pd.Categorical.from_codes(rng.integers(0, len(VEHICLES), n).astype(np.int8), dtype=_VEHICLE_DTYPE),
+        'payload_kg': np.round(payload).astype(np.int32),
+        'fuel_tons': np.round(fuel, 1).astype(np.float32),
+        'cost_million': np.round(_uniform(rng, 'cost', codes), 2).astype(np.float32),
+        'distance_km': np.round(_uniform(rng, 'dist', codes)).astype(np.int32),
+        'duration_days': np.round(_uniform(rng, 'dur', codes)).astype(np.int32),
+        'crew_size': np.round(_uniform(rng, 'crew', codes)).astype(np.int8),
+        'scientific_yield': np.round(rng.uniform(10, 100, n), 1).astype(np.float32),
+        'success': rng.random(n) < _SUCCESS[codes],
+        'launch_date': (BASE_DATE + launch_day).astype('datetime64[ns]'),
+    })
+
+
+def iter_mission_chunks(n, seed=42, chunk_size=1_000_000):
+    """Yield the n-row mission dataset as DataFrames of at most chunk_size rows.
+
+    Chunk k draws from its own Generator seeded with (seed, k), so output is
+    deterministic for a given seed and chunk_size.
+    """
+    for k, start in enumerate(range(0, n, chunk_size)):
+        rng = np.random.default_rng([seed, k])
+        yield _sample_chunk(rng, start, min(chunk_size, n - start))
+
+
+def generate_missions(n=48, seed=42, chunk_size=1_000_000):
+    return concat_missions(iter_mission_chunks(n, seed, chunk_size))
+
+
+def concat_missions(frames):
+    """pd.concat for mission frames that keeps categorical columns categorical.
+
+    Categories are unioned first; a plain concat would fall back to object
+    whenever two frames saw different vehicles.
+    """
+    frames = list(frames)
+    if len(frames) == 1:
+        return frames[0]
+    for col in frames[0].columns:
+        dtypes = [f[col].dtype for f in frames]
+        if all(isinstance(d, pd.CategoricalDtype) for d in dtypes) and len(set(dtypes)) > 1:
+            categories = pd.Index(sorted(set().union(*(d.categories for d in dtypes))))
+            frames = [f.assign(**{col: f[col].cat.set_categories(categories)}) for f in frames]
+    return pd.concat(frames, ignore_index=True)
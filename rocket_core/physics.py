@@ -0,0 +1,265 @@
+import numpy as np
+
+from . import kernels
+from .kernels import euler_ascent, euler_steps, euler_steps_table
+from .trajectory import TrajectoryRecorder
+
+
+# ─── CONSTANTS ───
+G = 9.81
+DT = 1.0
+CROSS_AREA = 10.0
+SEA_LEVEL_DENSITY = 1.225
+SCALE_HEIGHT = 8500
+
+
+# ─── SIMULATION ENGINE ───
+def run_simulation(init_mass, thrust_kn, drag_cd, payload, fuel_mass, steps,
+                   stride=1, keep_last=None, dtype=np.float64, environment=None, compiled=True):
+    """Euler ascent; the altitude/velocity history comes back as a packed Trajectory.
+
+    stride, keep_last and dtype control what is recorded (see TrajectoryRecorder);
+    max_alt, max_vel and burnout_time always cover every step. environment is
+    an atmosphere model from atmosphere.py; None keeps the original inline
+    exponential density and constant gravity.
+
+    With the default atmosphere the loop runs in kernels.euler_ascent (Numba
+    when installed); compiled=False runs the interpreted loop below, which is
+    the reference the kernel is checked against (benchmarks/kernel_parity.py).
+    Atmosphere models step through _env_steps, which is compiled for the
+    built-in models when Numba is installed; compiled=False forces the
+    interpreted _euler_steps_env.
+    """
+    g = G
+    dt = DT
+    cross_area = CROSS_AREA
+    sea_level_density = SEA_LEVEL_DENSITY
+    thrust = thrust_kn * 1000
+    fuel_burn_rate = fuel_mass / (steps * 0.7)
+
+    mass = init_mass + payload + fuel_mass
+    velocity = 0.0
+    altitude = 0.0
+    fuel = float(fuel_mass)
+
+    recorder = TrajectoryRecorder(steps + 1, stride, keep_last, dtype, dt=dt)
+    max_alt = 0.0
+    max_vel = 0.0
+    burnout_time = 0
+
+    if environment is not None:
+        state = np.array([0.0, 0.0, mass, fuel, 0.0, 0.0, 0.0])
+        steps_env = _env_steps if compiled else _euler_steps_env
+        count = steps_env(environment, thrust, drag_cd, fuel_burn_rate, state, 0, steps + 1, stride, recorder.buf, 0)
+        max_alt, max_vel, burnout_time = float(state[4]), float(state[5]), int(state[6])
+        recorder.count, recorder.step = count, steps + 1
+    elif compiled:
+        max_alt, max_vel, burnout_time, count = euler_ascent(
+            float(thrust), float(drag_cd), float(cross_area), sea_level_density, float(SCALE_HEIGHT), g, dt,
+            float(mass), fuel, float(fuel_burn_rate), int(steps), int(stride), recorder.buf)
+        # The kernel filled the recorder's buffer directly.
+        recorder.count, recorder.step = count, steps + 1
+    else:
+        for t in range(steps + 1):
+            recorder.append(max(0.0, altitude), max(0.0, velocity))
+
+            if altitude > max_alt:
+                max_alt = altitude
+            if velocity > max_vel:
+                max_vel = velocity
+
+            current_thrust = thrust if fuel > 0 else 0
+            density = sea_level_density * np.exp(-altitude / SCALE_HEIGHT)
+            gravity_force = mass * g
+            drag_force = 0.5 * drag_cd * density * velocity ** 2 * cross_area
+            net_force = current_thrust - gravity_force - drag_force
+            acceleration = net_force / mass
+
+            velocity += acceleration * dt
+            altitude += velocity * dt
+
+            if fuel > 0:
+                fuel -= fuel_burn_rate * dt
+                mass -= fuel_burn_rate * dt
+                if fuel <= 0:
+                    fuel = 0
+                    burnout_time = t
+
+            if altitude < 0 and t > 1:
+                altitude = 0.0
+                velocity = 0.0
+
+    twr = thrust / ((init_mass + payload + fuel_mass) * g)
+    return {
+        'trajectory': recorder.finish(),
+        'max_alt': max_alt, 'max_vel': max_vel,
+        'burnout_time': burnout_time, 'twr': round(twr, 2)
+    }
+
+
+def _env_steps(environment, thrust, drag_cd, fuel_burn_rate, state, start, stop, stride, buf, count):
+    """_euler_steps_env through a compiled kernel when the model has one.
+
+    The exponential model is the default atmosphere's kernel; tabulated models
+    hand their tables to kernels.euler_steps_table. Without Numba, and for
+    other models, the interpreted loop is faster than the kernels' fallback.
+    """
+    if kernels.COMPILED and getattr(environment, 'name', None) == 'exponential':
+        return euler_steps(float(thrust), float(drag_cd), float(CROSS_AREA), SEA_LEVEL_DENSITY, float(SCALE_HEIGHT),
+                           G, DT, float(fuel_burn_rate), state, start, stop, int(stride), buf, count)
+    if kernels.COMPILED and hasattr(environment, 'kernel_tables'):
+        return euler_steps_table(float(thrust), float(drag_cd), float(CROSS_AREA), DT, float(fuel_burn_rate),
+                                 *environment.kernel_tables(), state, start, stop, int(stride), buf, count)
+    return _euler_steps_env(environment, thrust, drag_cd, fuel_burn_rate, state, start, stop, stride, buf, count)
+
+
+def _euler_steps_env(environment, thrust, drag_cd, fuel_burn_rate, state, start, stop, stride, buf, count):
+    """kernels.euler_steps with an atmosphere model's density, gravity and Mach drag (interpreted)."""
+    dt = DT
+    capacity = buf.shape[1]
+    altitude, velocity, mass, fuel = (float(v) for v in state[:4])
+    max_alt, max_vel, burnout_time = float(state[4]), float(state[5]), int(state[6])
+
+    for t in range(start, stop):
+        if t % stride == 0:
+            i = count % capacity
+            buf[0, i] = max(0.0, altitude)
+            buf[1, i] = max(0.0, velocity)
+            count += 1
+
+        if altitude > max_alt:
+            max_alt = altitude
+        if velocity > max_vel:
+            max_vel = velocity
+
+        current_thrust = thrust if fuel > 0 else 0
+        density, g_local, sound = environment.state(altitude)
+        gravity_force = mass * g_local
+        cd = drag_cd * environment.drag_factor(abs(velocity) / sound)
+        drag_force = 0.5 * cd * density * velocity ** 2 * CROSS_AREA
+        net_force = current_thrust - gravity_force - drag_force
+        acceleration = net_force / mass
+
+        velocity += acceleration * dt
+        altitude += velocity * dt
+
+        if fuel > 0:
+            fuel -= fuel_burn_rate * dt
+            mass -= fuel_burn_rate * dt
+            if fuel <= 0:
+                fuel = 0
+                burnout_time = t
+
+        if altitude < 0 and t > 1:
+            altitude = 0.0
+            velocity = 0.0
+
+    state[:] = altitude, velocity, mass, fuel, max_alt, max_vel, burnout_time
+    return count
+
+
+# ─── STREAMING ───
+def iter_simulation(init_mass, thrust_kn, drag_cd, payload, fuel_mass, steps, block=1000, stride=1,
+                    dtype=np.float64, environment=None):
+    """run_simulation in blocks of `block` steps, for live playback.
+
+    Yields dicts with the block's times, altitudes and velocities (every
+    stride-th step, as run_simulation records them) plus the running max_alt,
+    max_vel, burnout_time and twr. Concatenating the blocks reproduces
+    run_simulation's trajectory exactly.
+    """
+    dt = DT
+    thrust = float(thrust_kn * 1000)
+    fuel_burn_rate = float(fuel_mass / (steps * 0.7))
+    state = np.array([0.0, 0.0, init_mass + payload + fuel_mass, fuel_mass, 0.0, 0.0, 0.0], dtype=float)
+    buf = np.empty((2, -(-block // stride) + 1), dtype=dtype)
+
+    for start in range(0, steps + 1, block):
+        stop = min(start + block, steps + 1)
+        if environment is None:
+            n = euler_steps(thrust, float(drag_cd), float(CROSS_AREA), SEA_LEVEL_DENSITY, float(SCALE_HEIGHT), G, dt,
+                            fuel_burn_rate, state, start, stop, int(stride), buf, 0)
+        else:
+            n = _env_steps(environment, thrust, drag_cd, fuel_burn_rate, state, start, stop, stride, buf, 0)
+        first = -(-start // stride) * stride
+        yield {'times': first * dt + stride * dt * np.arange(n),
+               'altitudes': buf[0, :n].copy(), 'velocities': buf[1, :n].copy(),
+               'max_alt': float(state[4]), 'max_vel': float(state[5]), 'burnout_time': int(state[6]),
+               'twr': round(thrust / ((init_mass + payload + fuel_mass) * G), 2)}
+
+
+# ─── BATCH ENGINE ───
+def run_simulation_batch(init_mass, thrust_kn, drag_cd, payload, fuel_mass, steps, record=False,
+                         environment=None):
+    """Integrate N rockets at once; same physics and step rules as run_simulation.
+
+    Parameters broadcast against each other, so any of them may be a scalar.
+    Returns a dict of length-N arrays (max_alt, max_vel, burnout_time, twr);
+    with record=True the altitude/velocity histories are added as (N, steps+1)
+    arrays.
+    """
+    init_mass, thrust_kn, drag_cd, payload, fuel_mass = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(a, dtype=float))
+          for a in (init_mass, thrust_kn, drag_cd, payload, fuel_mass)))
+    n = init_mass.shape[0]
+    dt = DT
+
+    thrust = thrust_kn * 1000
+    fuel_burn_rate = fuel_mass / (steps * 0.7)
+    burn_step = fuel_burn_rate * dt
+    drag_k = 0.5 * drag_cd * CROSS_AREA * SEA_LEVEL_DENSITY
+
+    mass = init_mass + payload + fuel_mass
+    velocity = np.zeros(n)
+    altitude = np.zeros(n)
+    fuel = fuel_mass.copy()
+
+    max_alt = np.zeros(n)
+    max_vel = np.zeros(n)
+    burnout_time = np.zeros(n, dtype=np.int64)
+
+    if record:
+        altitudes = np.empty((n, steps + 1))
+        velocities = np.empty((n, steps + 1))
+
+    for t in range(steps + 1):
+        if record:
+            np.maximum(altitude, 0.0, out=altitudes[:, t])
+            np.maximum(velocity, 0.0, out=velocities[:, t])
+
+        np.maximum(max_alt, altitude, out=max_alt)
+        np.maximum(max_vel, velocity, out=max_vel)
+
+        burning = fuel > 0
+        if environment is None:
+            density = np.exp(-altitude / SCALE_HEIGHT)
+            net_force = np.where(burning, thrust, 0.0) - mass * G - drag_k * density * velocity ** 2
+        else:
+            density, g_local, sound = environment.state(altitude)
+            drag = drag_k / SEA_LEVEL_DENSITY * environment.drag_factor(np.abs(velocity) / sound) * density
+            net_force = np.where(burning, thrust, 0.0) - mass * g_local - drag * velocity ** 2
+        velocity += net_force / mass * dt
+        altitude += velocity * dt
+
+        if burning.any():
+            fuel -= np.where(burning, burn_step, 0.0)
+            mass -= np.where(burning, burn_step, 0.0)
+            burnt = burning & (fuel <= 0)
+            fuel[burnt] = 0
+            burnout_time[burnt] = t
+
+        if t > 1:
+            grounded = altitude < 0
+            altitude[grounded] = 0.0
+            velocity[grounded] = 0.0
+
+    twr = np.round(thrust / ((init_mass + payload + fuel_mass) * G), 2)
+    out = {
+        'max_alt': max_alt, 'max_vel': max_vel,
+        'burnout_time': burnout_time, 'twr': twr
+    }
+    if record:
+        out['times'] = np.arange(steps + 1)
+        out['altitudes'] = altitudes
+        out['velocities'] = velocities
+    return out
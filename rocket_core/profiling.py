@@ -0,0 +1,182 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+_local = threading.local()
+
+
+def set_memory_tracing(enabled):
+    """Start or stop tracemalloc for the whole process; tracing slows every allocation while on."""
+    if enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not enabled and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def rss_bytes():
+    """Resident set size of the process right now (Linux /proc only; None elsewhere)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def max_rss_bytes():
+    """High-water mark of the process's resident set size; it never goes down."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux, bytes on macOS.
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+# ─── SPANS ───
+class Rerun:
+    """Timing spans, and optionally a cProfile capture and tracemalloc peak, for one script run."""
+
+    def __init__(self, label, profile=False, trace_memory=False):
+        self.label = label
+        self.thread = threading.get_ident()
+        self.started = time.perf_counter_ns()
+        self.wall_ms = None
+        self.spans = []       # (name, start_ns, duration_ns, depth)
+        self.stack = []
+        self.peak_bytes = None
+        self.rss = None
+        self.max_rss = None
+        self.profile_text = None
+        self._profile = cProfile.Profile() if profile else None
+        self._trace_memory = trace_memory
+
+    def begin(self):
+        if self._trace_memory:
+            set_memory_tracing(True)
+            tracemalloc.reset_peak()
+        if self._profile is not None:
+            self._profile.enable()
+        return self
+
+    def end(self):
+        if self._profile is not None:
+            self._profile.disable()
+            out = io.StringIO()
+            pstats.Stats(self._profile, stream=out).sort_stats('cumulative').print_stats(25)
+            self.profile_text = out.getvalue()
+            self._profile = None
+        if self._trace_memory and tracemalloc.is_tracing():
+            self.peak_bytes = tracemalloc.get_traced_memory()[1]
+        self.rss = rss_bytes()
+        self.max_rss = max_rss_bytes()
+        self.wall_ms = (time.perf_counter_ns() - self.started) / 1e6
+
+    def stage_ms(self):
+        """Total milliseconds per span name (a name used twice in one rerun is summed)."""
+        totals = {}
+        for name, _, duration, _ in self.spans:
+            totals[name] = totals.get(name, 0.0) + duration / 1e6
+        return totals
+
+
+@contextmanager
+def span(name):
+    """Time a stage of the current rerun; a no-op outside one."""
+    run = getattr(_local, 'run', None)
+    if run is None:
+        yield
+        return
+    start = time.perf_counter_ns()
+    run.stack.append(name)
+    try:
+        yield
+    finally:
+        run.stack.pop()
+        run.spans.append((name, start, time.perf_counter_ns() - start, len(run.stack)))
+
+
+# ─── RECENT RERUNS ───
+class Profiler:
+    """Process-wide ring buffer of the most recent instrumented reruns.
+
+    start() binds a Rerun to the calling thread (each Streamlit session runs
+    its script on its own thread) so span() needs no handle; finish() closes
+    it and keeps it. A rerun that is interrupted before finish() is dropped
+    when the thread starts its next one.
+    """
+
+    def __init__(self, history=200):
+        self.runs = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def start(self, label, profile=False, trace_memory=False):
+        _local.run = Rerun(label, profile, trace_memory).begin()
+        return _local.run
+
+    def finish(self):
+        run = getattr(_local, 'run', None)
+        if run is None:
+            return None
+        _local.run = None
+        run.end()
+        with self._lock:
+            self.runs.append(run)
+        return run
+
+    def recent(self, label=None):
+        with self._lock:
+            runs = list(self.runs)
+        return [r for r in runs if label is None or r.label == label]
+
+    def clear(self):
+        with self._lock:
+            self.runs.clear()
+
+    def stage_percentiles(self, label=None, percentiles=(50, 90, 99)):
+        """Per-stage latency percentiles (ms) over recent reruns, slowest median first."""
+        samples = {}
+        for run in self.recent(label):
+            samples.setdefault('rerun', []).append(run.wall_ms)
+            for name, ms in run.stage_ms().items():
+                samples.setdefault(name, []).append(ms)
+        rows = []
+        for name, values in samples.items():
+            row = {'stage': name, 'runs': len(values)}
+            row.update({f'p{p}': v for p, v in zip(percentiles, np.percentile(values, percentiles))})
+            rows.append(row)
+        return sorted(rows, key=lambda r: -r[f'p{percentiles[0]}'])
+
+    # ─── EXPORT ───
+    def to_json(self, label=None):
+        return json.dumps([{
+            'label': r.label, 'wall_ms': r.wall_ms, 'peak_bytes': r.peak_bytes, 'rss': r.rss, 'max_rss': r.max_rss,
+            'spans': [{'name': n, 'start_ms': (s - r.started) / 1e6, 'duration_ms': d / 1e6, 'depth': depth}
+                      for n, s, d, depth in r.spans],
+        } for r in self.recent(label)], indent=2)
+
+    def to_chrome_trace(self, label=None):
+        """Trace Event Format JSON, loadable in chrome://tracing or Perfetto."""
+        pid = os.getpid()
+        events = []
+        for r in self.recent(label):
+            events.append({'name': f'rerun: {r.label}', 'ph': 'X', 'pid': pid, 'tid': r.thread,
+                           'ts': r.started / 1e3, 'dur': r.wall_ms * 1e3,
+                           'args': {'peak_bytes': r.peak_bytes, 'rss': r.rss, 'max_rss': r.max_rss}})
+            events.extend({'name': n, 'ph': 'X', 'pid': pid, 'tid': r.thread, 'ts': s / 1e3, 'dur': d / 1e3}
+                          for n, s, d, _ in r.spans)
+        return json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'})
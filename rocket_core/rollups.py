@@ -0,0 +1,93 @@
+"""Pre-aggregated launch cadence by month, mission type and vehicle.
+
+Month is the finest grain kept. Quarters and years are sums of months, so
+every date range, grain and grouping is answered from a table of a few
+thousand rows instead of a pass over the missions.
+"""
+import numpy as np
+import pandas as pd
+
+
+COLUMNS = ['launch_date', 'mission_type', 'vehicle', 'success', 'cost_million', 'payload_kg']
+MEASURES = ['launches', 'successes', 'cost_million', 'payload_kg']
+GRAINS = {'Month': 'M', 'Quarter': 'Q', 'Year': 'Y'}
+KEYS = ['month', 'mission_type', 'vehicle']
+
+
+class LaunchRollups:
+    """Launch counts, successes and cost/payload sums per (month, mission_type, vehicle).
+
+    update() folds in appended rows by aggregating only those rows and adding
+    them to the table. Rows without a launch date are counted in undated.
+    """
+
+    def __init__(self):
+        self.table = pd.DataFrame(columns=MEASURES, index=pd.MultiIndex.from_arrays([[], [], []], names=KEYS),
+                                  dtype=float)
+        self.undated = 0
+
+    @classmethod
+    def from_frame(cls, df):
+        return cls().update(df)
+
+    def update(self, df):
+        dates = df['launch_date'].to_numpy(dtype='datetime64[ns]')
+        dated = ~np.isnat(dates)
+        self.undated += int((~dated).sum())
+        if not dated.any():
+            return self
+        rows = pd.DataFrame({
+            'month': dates[dated].astype('datetime64[M]').astype('datetime64[ns]'),
+            'mission_type': df['mission_type'].to_numpy(dtype=object)[dated],
+            'vehicle': df['vehicle'].to_numpy(dtype=object)[dated],
+            'launches': 1.0,
+            'successes': df['success'].to_numpy(dtype=float)[dated],
+            'cost_million': df['cost_million'].to_numpy(dtype=float)[dated],
+            'payload_kg': df['payload_kg'].to_numpy(dtype=float)[dated],
+        })
+        part = rows.groupby(KEYS, sort=False)[MEASURES].sum()
+        self.table = part if self.table.empty else self.table.add(part, fill_value=0.0)
+        self.table = self.table.sort_index()
+        return self
+
+    def copy(self):
+        rollups = LaunchRollups()
+        rollups.table, rollups.undated = self.table.copy(), self.undated
+        return rollups
+
+    def span(self):
+        """First and last month with launches, as Timestamps (None when empty)."""
+        if self.table.empty:
+            return None
+        months = self.table.index.get_level_values('month')
+        return months.min(), months.max()
+
+    def query(self, start=None, end=None, grain='M', by=None, mission_type=None, vehicle=None):
+        """Measures per period (and per `by` column) for the months touched by [start, end].
+
+        grain is 'M', 'Q' or 'Y'; periods are labelled by their first day.
+        Adds success_rate and per-launch average cost and payload.
+        """
+        table = self.table
+        months = table.index.get_level_values('month')
+        keep = np.ones(len(table), dtype=bool)
+        if start is not None:
+            keep &= months >= pd.Timestamp(start).to_period('M').to_timestamp()
+        if end is not None:
+            keep &= months <= pd.Timestamp(end)
+        if mission_type is not None:
+            keep &= table.index.get_level_values('mission_type') == mission_type
+        if vehicle is not None:
+            keep &= table.index.get_level_values('vehicle') == vehicle
+        table = table[keep]
+
+        period = table.index.get_level_values('month').to_period(grain).to_timestamp()
+        keys = [pd.Index(period, name='period')]
+        if by is not None:
+            keys.append(table.index.get_level_values(by))
+        out = table.groupby(keys).sum()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out['success_rate'] = out['successes'] / out['launches']
+            out['avg_cost_million'] = out['cost_million'] / out['launches']
+            out['avg_payload_kg'] = out['payload_kg'] / out['launches']
+        return out.reset_index()
@@ -0,0 +1,49 @@
+"""Typed mission frames: coercion to MISSION_DTYPES and a per-column memory report.
+
+Generated missions are built in MISSION_DTYPES. Stored and ingested ones pass
+through to_compact, which also serves frames from anywhere else (older
+pickles, ad-hoc read_csv output).
+"""
+import pandas as pd
+
+from .missions import MISSION_DTYPES
+
+
+def to_compact(df):
+    """df with every mission column cast to its MISSION_DTYPES type; other columns are left alone."""
+    dtypes = {c: d for c, d in MISSION_DTYPES.items() if c in df.columns}
+    return df.astype(dtypes)
+
+
+def _untyped(values):
+    """A column as an untyped frame holds it: object strings and 64-bit numbers."""
+    if isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(values.dtype):
+        return values.astype(object)
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return values.dt.strftime('%Y-%m-%d').astype(object)
+    if pd.api.types.is_bool_dtype(values.dtype):
+        return values
+    if pd.api.types.is_integer_dtype(values.dtype):
+        return values.astype('int64')
+    return values.astype('float64')
+
+
+def memory_report(df):
+    """Bytes per column as stored vs as object strings and int64/float64, with a total row.
+
+    Columns are converted one at a time, so the report never holds a second
+    copy of the whole frame.
+    """
+    rows = []
+    for col in df.columns:
+        values = df[col]
+        untyped = _untyped(values)
+        rows.append({'column': col, 'dtype': str(values.dtype), 'bytes': values.memory_usage(index=False, deep=True),
+                     'untyped_dtype': str(untyped.dtype),
+                     'untyped_bytes': untyped.memory_usage(index=False, deep=True)})
+    report = pd.DataFrame(rows)
+    total = {'column': 'total', 'dtype': '', 'bytes': report['bytes'].sum(), 'untyped_dtype': '',
+             'untyped_bytes': report['untyped_bytes'].sum()}
+    report = pd.concat([report, pd.DataFrame([total])], ignore_index=True)
+    report['saving'] = report['untyped_bytes'] / report['bytes']
+    return report
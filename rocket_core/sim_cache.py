@@ -0,0 +1,84 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+
+def simulation_key(method, init_mass, thrust_kn, drag_cd, payload, fuel_mass, steps, **settings):
+    """Quantized, hashable key for one simulation run and its integrator settings."""
+    params = tuple(round(float(v), 6) for v in (init_mass, thrust_kn, drag_cd, payload, fuel_mass))
+    return (method,) + params + (int(steps),) + tuple(sorted((k, round(float(v), 12)) for k, v in settings.items()))
+
+
+class SimulationCache:
+    """Thread-safe, size-bounded LRU cache of simulation results.
+
+    With a path, entries are also pickled to disk so they survive restarts; a
+    memory miss falls back to the disk copy before recomputing.
+    """
+
+    def __init__(self, maxsize=256, path=None):
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if path:
+            os.makedirs(path, exist_ok=True)
+
+    def _file(self, key):
+        return os.path.join(self.path, hashlib.sha1(repr(key).encode()).hexdigest() + '.pkl')
+
+    def _load(self, key):
+        if not self.path:
+            return None
+        try:
+            with open(self._file(key), 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def _store(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            value = self._load(key)
+            if value is not None:
+                self._store(key, value)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._store(key, value)
+        if self.path:
+            tmp = f"{self._file(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._file(key))
+        return value
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits, 'misses': self.misses, 'size': len(self._entries),
+                'maxsize': self.maxsize, 'hit_rate': self.hits / total if total else 0.0
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
@@ -0,0 +1,107 @@
+import numpy as np
+
+
+# Search bounds match the Physics Sim sliders.
+SOLVE_BOUNDS = {'fuel_mass': (1000.0, 150000.0), 'payload': (100.0, 50000.0)}
+
+# Label -> (parameter, objective). Burn time is fixed at 70% of the run, so
+# extra fuel only adds mass and the fuel limit is usually the useful answer.
+SOLVE_GOALS = {
+    'Minimum Fuel': ('fuel_mass', 'min'),
+    'Maximum Fuel': ('fuel_mass', 'max'),
+    'Maximum Payload': ('payload', 'max'),
+}
+
+
+class _Counted:
+    """Memoizes evaluate(x) - target and records every distinct evaluation."""
+
+    def __init__(self, evaluate, target):
+        self.evaluate = evaluate
+        self.target = target
+        self.history = {}
+
+    def __call__(self, x):
+        x = float(x)
+        if x not in self.history:
+            self.history[x] = self.evaluate(x)
+        return self.history[x] - self.target
+
+    @property
+    def evals(self):
+        return len(self.history)
+
+
+def _bracket_from_guess(f, guess, lo, hi):
+    """Walk outward from a warm-start guess, doubling the step, until the sign of f changes.
+
+    Returns (a, fa, b, fb); fa and fb share a sign when a bound was hit first,
+    or None when f is flat around the guess and gives no direction.
+    """
+    step = (hi - lo) * 0.02
+    a, fa = guess, f(guess)
+    direction = 1.0 if guess < hi else -1.0
+    b = float(np.clip(a + direction * step, lo, hi))
+    fb = f(b)
+    if np.sign(fa) == np.sign(fb):
+        if fb == fa:
+            return None
+        if abs(fb) > abs(fa) and lo < guess < hi:
+            # Moving away from the boundary; head the other way.
+            direction = -direction
+            b = float(np.clip(a + direction * step, lo, hi))
+            fb = f(b)
+    while np.sign(fa) == np.sign(fb) and lo < b < hi:
+        step *= 2
+        a, fa = b, fb
+        b = float(np.clip(b + direction * step, lo, hi))
+        fb = f(b)
+    return a, fa, b, fb
+
+
+def solve_apogee(evaluate, target, bounds, objective='min', xtol=10.0, guess=None, max_evals=60):
+    """Smallest or largest parameter value in bounds whose apogee reaches target.
+
+    evaluate(x) returns the apogee for parameter value x with everything else
+    held fixed; apogee is assumed monotone in x over bounds. The feasible
+    boundary is bracketed (from the bounds, or outward from a warm-start guess)
+    and refined with the Illinois variant of regula falsi to within xtol.
+    Repeated x values are evaluated once.
+
+    Returns a dict with the chosen value, its apogee, the feasible interval
+    (None when no value in bounds reaches target), the number of distinct
+    evaluations and the (x, apogee) history.
+    """
+    lo, hi = map(float, bounds)
+    f = _Counted(evaluate, target)
+
+    bracket = None
+    if guess is not None and lo <= guess <= hi:
+        bracket = _bracket_from_guess(f, float(guess), lo, hi)
+    a, fa, b, fb = bracket or (lo, f(lo), hi, f(hi))
+
+    if np.sign(fa) == np.sign(fb) and fa != 0:
+        # No crossing inside bounds: every value is feasible or none is.
+        feasible = (lo, hi) if fa > 0 else None
+    else:
+        while abs(b - a) > xtol and f.evals < max_evals:
+            c = (a * fb - b * fa) / (fb - fa)
+            fc = f(c)
+            if fc == 0:
+                a, fa = c, fc
+                break
+            if np.sign(fc) != np.sign(fb):
+                a, fa = b, fb
+            else:
+                fa /= 2
+            b, fb = c, fc
+        # The feasible side of the boundary is whichever end still reaches target.
+        edge, other = (float(a), float(b)) if fa >= 0 else (float(b), float(a))
+        feasible = (lo, edge) if edge < other else (edge, hi)
+
+    value = apogee = None
+    if feasible is not None:
+        value = feasible[0] if objective == 'min' else feasible[1]
+        apogee = f(value) + target
+    return {'value': value, 'apogee': apogee, 'feasible': feasible,
+            'evals': f.evals, 'history': sorted(f.history.items())}
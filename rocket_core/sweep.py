@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+from .downsample import scatter_decimate
+from .physics import run_simulation_batch
+
+
+SWEEP_PARAMS = ['thrust_kn', 'payload', 'fuel_mass', 'drag_cd']
+
+
+# ─── SAMPLING ───
+def grid_samples(ranges, points_per_axis):
+    axes = [np.linspace(lo, hi, points_per_axis) for lo, hi in (ranges[k] for k in SWEEP_PARAMS)]
+    mesh = np.meshgrid(*axes, indexing='ij')
+    return pd.DataFrame({k: m.ravel() for k, m in zip(SWEEP_PARAMS, mesh)})
+
+
+def latin_hypercube_samples(ranges, n, seed=42):
+    rng = np.random.default_rng(seed)
+    cols = {}
+    for k in SWEEP_PARAMS:
+        lo, hi = ranges[k]
+        u = (rng.permutation(n) + rng.random(n)) / n
+        cols[k] = lo + u * (hi - lo)
+    return pd.DataFrame(cols)
+
+
+# ─── EXECUTION ───
+def run_sweep_chunk(chunk, init_mass, steps, environment=None):
+    res = run_simulation_batch(init_mass, chunk['thrust_kn'].values, chunk['drag_cd'].values,
+                               chunk['payload'].values, chunk['fuel_mass'].values, steps, environment=environment)
+    out = chunk.copy()
+    for k in ('max_alt', 'max_vel', 'burnout_time', 'twr'):
+        out[k] = res[k]
+    return out
+
+
+def iter_sweep(samples, init_mass, steps, chunk_size=5000, environment=None):
+    """Run every sample through the batch engine, yielding one result frame per chunk."""
+    for start in range(0, len(samples), chunk_size):
+        yield run_sweep_chunk(samples.iloc[start:start + chunk_size], init_mass, steps, environment)
+
+
+# ─── ANALYSIS ───
+def _bin_means(x_edges, y_edges, total, count):
+    with np.errstate(invalid='ignore'):
+        mean = total / count
+    x_mid = (x_edges[:-1] + x_edges[1:]) / 2
+    y_mid = (y_edges[:-1] + y_edges[1:]) / 2
+    return x_mid, y_mid, mean.T
+
+
+def heatmap_table(df, x, y, value, bins=25):
+    x_edges = np.linspace(df[x].min(), df[x].max(), bins + 1)
+    y_edges = np.linspace(df[y].min(), df[y].max(), bins + 1)
+    total, _, _ = np.histogram2d(df[x], df[y], bins=[x_edges, y_edges], weights=df[value])
+    count, _, _ = np.histogram2d(df[x], df[y], bins=[x_edges, y_edges])
+    return _bin_means(x_edges, y_edges, total, count)
+
+
+def pareto_front(df, x, y):
+    """Rows not dominated when maximizing both x and y."""
+    ordered = df.sort_values([x, y], ascending=[False, False])
+    prev_best = ordered[y].cummax().shift(fill_value=-np.inf)
+    return ordered[ordered[y] > prev_best].sort_values(x)
+
+
+class SweepSummary:
+    """Heatmap sums, Pareto front and a decimated point cloud of a sweep, folded in a chunk at a time.
+
+    Bin edges come from the samples, which are known before any result, so a
+    chunk only adds its own histograms and heatmap() matches heatmap_table on
+    the full result. The front is merged with each chunk's rows, and the point
+    cloud keeps each chunk's decimated points, so drawing never goes back over
+    everything swept so far.
+    """
+
+    def __init__(self, samples, heatmaps, front=('payload', 'max_alt'), bins=25):
+        self._sums = {}
+        for x, y, value in heatmaps:
+            x_edges = np.linspace(samples[x].min(), samples[x].max(), bins + 1)
+            y_edges = np.linspace(samples[y].min(), samples[y].max(), bins + 1)
+            self._sums[x, y, value] = (x_edges, y_edges, np.zeros((bins, bins)), np.zeros((bins, bins)))
+        self.front_axes = front
+        self.front = None
+        self._points = []
+        self.n = 0
+
+    def add(self, chunk):
+        for (x, y, value), (x_edges, y_edges, total, count) in self._sums.items():
+            total += np.histogram2d(chunk[x], chunk[y], bins=[x_edges, y_edges], weights=chunk[value])[0]
+            count += np.histogram2d(chunk[x], chunk[y], bins=[x_edges, y_edges])[0]
+        x, y = self.front_axes
+        rows = chunk[[x, y]]
+        self.front = pareto_front(rows if self.front is None else pd.concat([self.front, rows]), x, y)
+        idx, _ = scatter_decimate(rows[x], rows[y])
+        self._points.append(rows.iloc[idx])
+        self.n += len(chunk)
+        return self
+
+    def heatmap(self, x, y, value):
+        return _bin_means(*self._sums[x, y, value])
+
+    def points(self):
+        """The decimated (front x, front y) cloud, re-decimated as chunks pile up."""
+        if len(self._points) > 1:
+            x, y = self.front_axes
+            points = pd.concat(self._points)
+            idx, _ = scatter_decimate(points[x], points[y])
+            self._points = [points.iloc[idx]]
+        return self._points[0] if self._points else pd.DataFrame(columns=list(self.front_axes))
@@ -0,0 +1,77 @@
+import numpy as np
+
+
+class Trajectory:
+    """Altitude and velocity samples packed into one contiguous (2, n) array.
+
+    Sample times are implied by t0 and dt for fixed-step runs, so only the two
+    state rows are stored; adaptive runs pass their (float64) times explicitly.
+    """
+
+    def __init__(self, data, t0=0.0, dt=1.0, times=None):
+        self.data = np.ascontiguousarray(data)
+        self.t0 = t0
+        self.dt = dt
+        self._times = times
+
+    @classmethod
+    def from_samples(cls, times, altitudes, velocities, dtype=np.float64, stride=1, keep_last=None):
+        """Pack already-computed samples, keeping every stride-th and optionally only the last keep_last."""
+        sel = slice(None, None, stride)
+        data = np.stack([np.asarray(altitudes)[sel], np.asarray(velocities)[sel]]).astype(dtype, copy=False)
+        times = np.asarray(times, dtype=float)[sel]
+        if keep_last is not None:
+            data, times = data[:, -keep_last:], times[-keep_last:]
+        return cls(data, times=times)
+
+    def __len__(self):
+        return self.data.shape[1]
+
+    @property
+    def altitudes(self):
+        return self.data[0]
+
+    @property
+    def velocities(self):
+        return self.data[1]
+
+    @property
+    def times(self):
+        if self._times is not None:
+            return self._times
+        return self.t0 + self.dt * np.arange(len(self))
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes + (self._times.nbytes if self._times is not None else 0)
+
+
+class TrajectoryRecorder:
+    """Fills a Trajectory one step at a time.
+
+    Every stride-th step is kept. With keep_last the buffer is a ring of that
+    many samples, so memory stays fixed however long the run is.
+    """
+
+    def __init__(self, steps, stride=1, keep_last=None, dtype=np.float64, t0=0.0, dt=1.0):
+        samples = -(-steps // stride)
+        self.capacity = min(samples, keep_last) if keep_last else samples
+        self.buf = np.empty((2, self.capacity), dtype=dtype)
+        self.stride = stride
+        self.t0, self.dt = t0, dt
+        self.step = 0
+        self.count = 0
+
+    def append(self, altitude, velocity):
+        if self.step % self.stride == 0:
+            i = self.count % self.capacity
+            self.buf[0, i] = altitude
+            self.buf[1, i] = velocity
+            self.count += 1
+        self.step += 1
+
+    def finish(self):
+        n = min(self.count, self.capacity)
+        first = self.count - n
+        data = np.roll(self.buf, -(self.count % self.capacity), axis=1) if self.count > self.capacity else self.buf[:, :n]
+        return Trajectory(data, t0=self.t0 + first * self.stride * self.dt, dt=self.stride * self.dt)
@@ -0,0 +1,84 @@
+"""Multi-stage launch vehicles: per-stage structure, propellant and engines.
+
+A stage burns at the constant mass flow its thrust and specific impulse imply
+(ṁ = F / (Isp·g0)), so burn times follow from the propellant load rather than
+from the number of integration steps. Spent stages are jettisoned at burnout.
+"""
+from .atmosphere import G0
+from .physics import CROSS_AREA
+
+
+class Stage:
+    """One stage: dry structure (kg), propellant (kg), thrust (kN) and specific impulse (s)."""
+
+    def __init__(self, name, dry_mass, propellant, thrust_kn, isp):
+        self.name = name
+        self.dry_mass = float(dry_mass)
+        self.propellant = float(propellant)
+        self.thrust_kn = float(thrust_kn)
+        self.isp = float(isp)
+
+    @property
+    def mass_flow(self):
+        return self.thrust_kn * 1000 / (self.isp * G0)
+
+    @property
+    def burn_time(self):
+        return self.propellant / self.mass_flow
+
+    @property
+    def mass(self):
+        return self.dry_mass + self.propellant
+
+    def key(self):
+        return (self.dry_mass, self.propellant, self.thrust_kn, self.isp)
+
+
+class Vehicle:
+    """A stack of stages, first to burn first, topped by the payload.
+
+    Each stage ignites `coast` seconds after the one below separates.
+    """
+
+    def __init__(self, name, stages, payload, drag_cd=0.30, cross_area=CROSS_AREA, coast=0.0):
+        self.name = name
+        self.stages = list(stages)
+        self.payload = float(payload)
+        self.drag_cd = float(drag_cd)
+        self.cross_area = float(cross_area)
+        self.coast = float(coast)
+
+    @property
+    def liftoff_mass(self):
+        return self.payload + sum(s.mass for s in self.stages)
+
+    def schedule(self):
+        """(ignition, burnout) time of every stage."""
+        times, t = [], 0.0
+        for i, stage in enumerate(self.stages):
+            if i:
+                t += self.coast
+            times.append((t, t + stage.burn_time))
+            t += stage.burn_time
+        return times
+
+    def with_payload(self, payload):
+        return Vehicle(self.name, self.stages, payload, self.drag_cd, self.cross_area, self.coast)
+
+    def key(self):
+        """Hashable description of everything that affects a flight, for the result cache."""
+        return (tuple(s.key() for s in self.stages), self.payload, self.drag_cd, self.cross_area, self.coast)
+
+
+# Rounded public figures for two familiar stacks; payloads are overridden in the UI.
+VEHICLE_PRESETS = {
+    'Two-stage (Falcon 9 class)': Vehicle('Two-stage (Falcon 9 class)', [
+        Stage('Stage 1', 25600, 395700, 7607, 282),
+        Stage('Stage 2', 3900, 92670, 934, 348),
+    ], payload=5000, drag_cd=0.30, cross_area=10.5, coast=3.0),
+    'Three-stage (Saturn V class)': Vehicle('Three-stage (Saturn V class)', [
+        Stage('S-IC', 130000, 2150000, 35100, 263),
+        Stage('S-II', 40100, 451700, 5141, 421),
+        Stage('S-IVB', 13500, 107100, 1033, 421),
+    ], payload=45000, drag_cd=0.50, cross_area=80.0, coast=4.0),
+}
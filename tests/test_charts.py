@@ -0,0 +1,27 @@
+import json
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+
+ROOT = str(Path(__file__).resolve().parents[1])
+
+
+def _render(root):
+    import sys
+    sys.path.insert(0, root)
+    import plotly.graph_objects as go
+    from charts import show_chart
+    show_chart(go.Figure(go.Bar(x=['Success', 'Failure'], y=[1, 2])))
+
+
+def test_show_chart_renders_mission_control_template():
+    at = AppTest.from_function(_render, args=(ROOT,)).run()
+    assert not at.exception
+
+    chart = at.get('plotly_chart')[0].proto
+    # Streamlit's own theme would override the template in the browser.
+    assert chart.theme == ''
+    layout = json.loads(chart.spec)['layout']['template']['layout']
+    assert layout['paper_bgcolor'] == 'rgba(0,0,0,0)'
+    assert layout['plot_bgcolor'] == 'rgba(0,0,0,0)'